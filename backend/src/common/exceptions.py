@@ -5,7 +5,7 @@ import sentry_sdk
 from fastapi import Request, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 
 
@@ -43,31 +43,31 @@ class APIException(Exception):
         self.error_type = error_type
 
 
-async def internal_exception_handler(request: Request, exc: InternalException) -> JSONResponse:
+async def internal_exception_handler(request: Request, exc: InternalException) -> ORJSONResponse:
     """
     This catches validation errors and is registered at the app level
     """
     logger.exception(exc)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=jsonable_encoder({'detail': exc.message}),
     )
 
 
-async def api_exception_handler(request: Request, exc: APIException) -> JSONResponse:
+async def api_exception_handler(request: Request, exc: APIException) -> ORJSONResponse:
     """
     This catches validation errors and is registered at the app level
     """
     content = {'detail': exc.message}
     if exc.error_type:
         content['error_type'] = exc.error_type
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.code,
         content=jsonable_encoder(content),
     )
 
 
-async def inbound_validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def inbound_validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     """
     This catches pydantic validation errors and is registered at the app level
     """
@@ -115,7 +115,7 @@ async def inbound_validation_exception_handler(request: Request, exc: RequestVal
                 'type': error['type'],
             }
         )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=jsonable_encoder({'detail': modified_details}),
     )
@@ -1,3 +1,4 @@
+import functools
 import string
 from math import ceil, log
 from os import urandom
@@ -8,37 +9,39 @@ from typing import TypeAlias
 # Examples: prop-XSqS5h9vFTSgP, cltr-yb6GG995oiBf, rptr-kwA4kDkqoS8V7
 NanoIdType: TypeAlias = str
 
+_DEFAULT_CHAR_POOL = string.digits + string.ascii_letters
+
+
+@functools.lru_cache(maxsize=64)
+def _mask_and_step(size: int, char_pool_len: int) -> tuple[int, int]:
+    mask = 1
+    if char_pool_len > 1:
+        mask = (2 << int(log(char_pool_len - 1) / log(2))) - 1
+    step = int(ceil(1.6 * mask * size / char_pool_len))
+    return mask, step
+
 
 def generate_custom_nanoid(size: int = 8, char_pool: str | None = None) -> NanoIdType:
     """
     Generate a short random url safe id great for public links / urls
     Entropy here -> https://zelark.github.io/nano-id-cc/
     """
-
-    def gen_bytes(size: int) -> bytearray:
-        return bytearray(urandom(size))
-
     if char_pool is None:
-        char_pool = string.digits + string.ascii_letters
+        char_pool = _DEFAULT_CHAR_POOL
 
     char_pool_len = len(char_pool)
-    mask = 1
-    if char_pool_len > 1:
-        mask = (2 << int(log(char_pool_len - 1) / log(2))) - 1
-    step = int(ceil(1.6 * mask * size / char_pool_len))
+    mask, step = _mask_and_step(size, char_pool_len)
 
-    id = ''
+    chars = []
     # Ensure bits generated fit in specified character pool
     while True:
-        random_bytes = gen_bytes(step)
-        for i in range(step):
-            random_byte = random_bytes[i] & mask
+        for random_byte in urandom(step):
+            random_byte &= mask
             if random_byte < char_pool_len:
-                if char_pool[random_byte]:
-                    id += char_pool[random_byte]
+                chars.append(char_pool[random_byte])
 
-                    if len(id) == size:
-                        return id
+                if len(chars) == size:
+                    return ''.join(chars)
 
 
 class NanoId:
@@ -50,8 +53,7 @@ class NanoId:
 
     @classmethod
     def gen(cls, abbrev: str | None = None) -> NanoIdType:
-        char_pool = string.digits + string.ascii_letters
-        nano_id = generate_custom_nanoid(size=cls._CHAR_SIZE, char_pool=char_pool)
+        nano_id = generate_custom_nanoid(size=cls._CHAR_SIZE, char_pool=_DEFAULT_CHAR_POOL)
         if abbrev:
             nano_id = f'{abbrev}-{nano_id}'
 
@@ -0,0 +1,15 @@
+import functools
+
+from jinja2 import Environment, PackageLoader, select_autoescape
+
+
+@functools.cache
+def get_template_environment(package_name: str) -> Environment:
+    """
+    Jinja environment for the templates directory of a package, shared across renders
+    so parsed templates stay cached
+    """
+    return Environment(
+        loader=PackageLoader(package_name, 'templates'),
+        autoescape=select_autoescape(['html', 'xml']),
+    )
@@ -1,6 +1,7 @@
 import string
+import time
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta
 from typing import List
 
 import jwt
@@ -510,10 +511,9 @@ class AuthenticationService:
         auth_method: str | None = None,
         oidc_provider_id: str | None = None,
     ) -> str:
-        expires_at = datetime.now(tz=timezone.utc) + settings.AUTH_SETTINGS['ACCESS_TOKEN_LIFETIME']
         return cls._create_token(
             user_id,
-            expires_at,
+            settings.AUTH_SETTINGS['ACCESS_TOKEN_LIFETIME'],
             ip_address=ip_address,
             impersonator_id=impersonator_id,
             auth_method=auth_method,
@@ -529,10 +529,9 @@ class AuthenticationService:
         auth_method: str | None = None,
         oidc_provider_id: str | None = None,
     ) -> str:
-        expires_at = datetime.now(tz=timezone.utc) + settings.AUTH_SETTINGS['REFRESH_TOKEN_LIFETIME']
         return cls._create_token(
             user_id,
-            expires_at,
+            settings.AUTH_SETTINGS['REFRESH_TOKEN_LIFETIME'],
             ip_address=ip_address,
             impersonator_id=impersonator_id,
             auth_method=auth_method,
@@ -543,7 +542,7 @@ class AuthenticationService:
     def _create_token(
         cls,
         sub: str,
-        expire: datetime,
+        lifetime: timedelta,
         ip_address: str | None = None,
         secret_key: str | None = None,
         impersonator_id: str | None = None,
@@ -551,12 +550,14 @@ class AuthenticationService:
         oidc_provider_id: str | None = None,
     ):
         secret_key = secret_key or settings.SECRET_KEY
+        now = int(time.time())
         jwt_content = {
             'jti': str(uuid.uuid4()),
-            'exp': int(expire.timestamp()),
+            # Plain epoch arithmetic, no datetime objects needed for the claims
+            'exp': now + int(lifetime.total_seconds()),
             'sub': sub,
             'imp_sub': impersonator_id,
-            'nbf': int(datetime.now(tz=timezone.utc).timestamp()),
+            'nbf': now,
             'ip': ip_address or '',
             'auth_method': auth_method,  # Track how user authenticated
             'oidc_provider_id': oidc_provider_id,  # Which OIDC provider (if any)
@@ -584,10 +585,7 @@ class AuthenticationService:
         Similar to Access token but uses email as sub with a different
         expiration used to verify magic link
         """
-        now = datetime.now(tz=timezone.utc)
-        expires_at = now + settings.AUTH_SETTINGS['CHALLENGE_TOKEN_LIFETIME']
-
-        return cls._create_token(email, expires_at, ip_address=ip_address)
+        return cls._create_token(email, settings.AUTH_SETTINGS['CHALLENGE_TOKEN_LIFETIME'], ip_address=ip_address)
 
     @classmethod
     def create_mfa_token(
@@ -600,13 +598,11 @@ class AuthenticationService:
         Similar to Access token but uses email as sub with a different
         expiration used to verify magic link
         """
-        now = datetime.now(tz=timezone.utc)
-        expires_at = now + settings.AUTH_SETTINGS['MFA_CODE']
         mfa_secret_key = cls._generate_mfa_token_secret()
 
         token = cls._create_token(
             email,
-            expires_at,
+            settings.AUTH_SETTINGS['MFA_CODE'],
             ip_address=ip_address,
             secret_key=mfa_secret_key,
         )
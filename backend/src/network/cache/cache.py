@@ -6,10 +6,14 @@ from src.settings import REDIS_URL
 
 # Parse REDIS_URL to extract components for Walrus
 _parsed = urlparse(REDIS_URL)
-Cache = Walrus(
+_connection_kwargs = dict(
     host=_parsed.hostname or 'localhost',
     port=_parsed.port or 6379,
     db=0,
     decode_responses=True,
     password=_parsed.password,
 )
+Cache = Walrus(**_connection_kwargs)
+# For values that are only an optimization: a down or unreachable redis costs a caller a fraction of a
+# second before it falls back to computing the value, rather than the default unbounded wait
+BestEffortCache = Walrus(**_connection_kwargs, socket_connect_timeout=0.25, socket_timeout=0.25)
@@ -9,6 +9,15 @@ from alembic.operations import MigrateOperation, Operations
 from sqlalchemy import text
 from sqlalchemy.orm import DeclarativeBase
 
+# Bound statement so the SQL text stays identical across tables and is parsed once
+_TRIGGER_COUNT_SQL = text(
+    """
+    SELECT count(*) FROM pg_trigger
+    WHERE tgrelid = cast(:table_name AS regclass)
+    AND tgname IN ('audit_trigger_row', 'audit_trigger_stm');
+    """
+)
+
 
 @Operations.register_operation('audit_table')
 class AuditTableOperation(MigrateOperation):
@@ -70,15 +79,7 @@ def compare_table_level(autogen_context, modify_ops, schemaname, tablename, conn
     audit = autogen_context.metadata.info.get('audit_enabled_tables').get(tablename)
     conn = op.get_bind()
     if conn_table is not None:
-        result = conn.execute(
-            text(
-                f"""
-                SELECT count(*) FROM pg_trigger
-                WHERE tgrelid = '{tablename}'::regclass
-                AND (tgname = 'audit_trigger_row' OR tgname = 'audit_trigger_stm');        
-            """
-            )
-        )
+        result = conn.execute(_TRIGGER_COUNT_SQL, {'table_name': tablename})
         try:
             count = result.fetchone()[0]
         except:  # noqa: E722
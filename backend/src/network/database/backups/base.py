@@ -6,8 +6,7 @@ from src import settings
 class BaseDbBackup:
     def __init__(self):
         self._backup_dir = os.path.join(settings.TEMP_DIR, 'db-backups')
-        if not os.path.exists(self._backup_dir):
-            os.makedirs(self._backup_dir)
+        os.makedirs(self._backup_dir, exist_ok=True)
 
     @property
     def backup_dir(self):
@@ -321,12 +321,12 @@ class SessionManager(metaclass=SessionManagerMeta):
 db: SessionManagerMeta = SessionManager
 
 
-def on_commit(func: Callable[..., Any]) -> None:
+def on_commit(func: Callable[[], Any]) -> None:
     """
-    Register function to be called after commit
+    Register a zero-argument function to be called after commit
     """
-    # @TODO func must take in a session since sqlalchemy always passes it in
-    event.listen(db.session, 'after_commit', func)
+    # sqlalchemy always passes in the session, which callers don't need
+    event.listen(db.session, 'after_commit', lambda session: func())
 
 
 class IsolatedSession(SessionManager):
@@ -3,6 +3,7 @@ from contextlib import asynccontextmanager
 import sentry_sdk
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 from sentry_sdk.integrations.fastapi import FastApiIntegration
 from sentry_sdk.integrations.starlette import StarletteIntegration
@@ -93,6 +94,7 @@ server = FastAPI(
     docs_url='/docs' if settings.IS_LOCAL else None,
     redoc_url='/redoc' if settings.IS_LOCAL else None,
     separate_input_output_schemas=False,
+    default_response_class=ORJSONResponse,
 )
 
 # Middlewares are inserted(0) last will run first!
@@ -120,7 +122,7 @@ server.exception_handler(APIException)(api_exception_handler)
 if settings.BACKEND_CORS_ORIGINS:
     server.add_middleware(
         CORSMiddleware,
-        allow_origins=[str(origin) for origin in settings.BACKEND_CORS_ORIGINS],
+        allow_origins=settings.BACKEND_CORS_ORIGINS,
         allow_credentials=True,
         allow_methods=settings.CORS_ALLOWED_METHODS,
         allow_headers=settings.CORS_ALLOWED_HEADERS,
@@ -119,39 +119,7 @@ class AuditLog(BaseModel[AuditLogRead, None]):
         Returns:
             Tuple of (audit log results for paginated events, total event count)
         """
-        # Build the filter conditions (same as before)
-        grouped_lookups = {}
-        for table_name, fields in table_context_pairs:
-            if table_name not in grouped_lookups:
-                grouped_lookups[table_name] = {}
-            for field_name, field_value in fields.items():
-                if field_name not in grouped_lookups[table_name]:
-                    grouped_lookups[table_name][field_name] = []
-                grouped_lookups[table_name][field_name].append(field_value)
-
-        or_conditions = []
-        for table_name, fields_dict in grouped_lookups.items():
-            # Build AND conditions for all fields within the same table
-            table_conditions = [cls.table_name == table_name]
-
-            for field_name, values in fields_dict.items():
-                if len(values) > 1:
-                    # Handle chunking for large value lists
-                    if len(values) > 50:
-                        field_or_conditions = []
-                        for i in range(0, len(values), 50):
-                            chunk = values[i : i + 50]
-                            field_or_conditions.append(cls.context.op('->>')(field_name).in_(chunk))
-                        table_conditions.append(or_(*field_or_conditions))
-                    else:
-                        table_conditions.append(cls.context.op('->>')(field_name).in_(values))
-                else:
-                    table_conditions.append(cls.context.op('->>')(field_name) == values[0])
-
-            # Combine all conditions for this table with AND
-            or_conditions.append(and_(*table_conditions))
-
-        combined_filter = or_(*or_conditions) if or_conditions else True
+        combined_filter = cls._build_context_filter(table_context_pairs)
 
         session = cls._get_session()
 
@@ -188,3 +156,38 @@ class AuditLog(BaseModel[AuditLogRead, None]):
             audit_logs = []
 
         return audit_logs, total_events
+
+    @classmethod
+    def _build_context_filter(cls, table_context_pairs: list[tuple[str, dict[str, str]]]):
+        grouped_lookups = {}
+        for table_name, fields in table_context_pairs:
+            if table_name not in grouped_lookups:
+                grouped_lookups[table_name] = {}
+            for field_name, field_value in fields.items():
+                if field_name not in grouped_lookups[table_name]:
+                    grouped_lookups[table_name][field_name] = []
+                grouped_lookups[table_name][field_name].append(field_value)
+
+        or_conditions = []
+        for table_name, fields_dict in grouped_lookups.items():
+            # Build AND conditions for all fields within the same table
+            table_conditions = [cls.table_name == table_name]
+
+            for field_name, values in fields_dict.items():
+                if len(values) > 1:
+                    # Handle chunking for large value lists
+                    if len(values) > 50:
+                        field_or_conditions = []
+                        for i in range(0, len(values), 50):
+                            chunk = values[i : i + 50]
+                            field_or_conditions.append(cls.context.op('->>')(field_name).in_(chunk))
+                        table_conditions.append(or_(*field_or_conditions))
+                    else:
+                        table_conditions.append(cls.context.op('->>')(field_name).in_(values))
+                else:
+                    table_conditions.append(cls.context.op('->>')(field_name) == values[0])
+
+            # Combine all conditions for this table with AND
+            or_conditions.append(and_(*table_conditions))
+
+        return or_(*or_conditions) if or_conditions else True
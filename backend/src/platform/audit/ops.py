@@ -3,6 +3,8 @@ Automates the checking of the audit flag and creates
 the correct SQL
 """
 
+import hashlib
+
 from alembic import op
 from alembic.autogenerate import comparators, renderers
 from alembic.operations import MigrateOperation, Operations
@@ -10,6 +12,27 @@ from loguru import logger
 from sqlalchemy import text
 from sqlalchemy.orm import DeclarativeBase
 
+# Bound statements so the SQL text stays identical across tables and is parsed once
+_TRIGGER_COUNT_SQL = text(
+    """
+    SELECT count(*) FROM pg_trigger
+    WHERE tgrelid = cast(:table_name AS regclass)
+    AND tgname IN ('app_audit_delete_trigger', 'app_audit_insert_update_trigger');
+    """
+)
+_ANY_TRIGGER_EXISTS_SQL = text(
+    """
+    SELECT EXISTS (
+        SELECT 1 FROM pg_trigger
+        WHERE tgname IN ('app_audit_delete_trigger', 'app_audit_insert_update_trigger')
+    );
+    """
+)
+_CONTEXT_FUNCTION_DEF_SQL = text('SELECT pg_get_functiondef(cast(:function_name AS regproc));')
+_CONTEXT_FUNCTION_COMMENT_SQL = text("SELECT obj_description(cast(:function_name AS regproc), 'pg_proc');")
+# Context functions are tagged with a fingerprint comment so unchanged ones skip the full comparison
+_FINGERPRINT_PREFIX = 'hash:'
+
 
 @Operations.register_operation('app_audit')
 class AppAuditTableOperation(MigrateOperation):
@@ -56,6 +79,13 @@ def app_audit(operations, operation: AppAuditTableOperation):
             """
             )
         )
+        fingerprint = context_function_fingerprint(operation.context_function)
+        op.execute(
+            text(
+                f'COMMENT ON FUNCTION app_audit_get_{operation.table_name}_context(TEXT) '
+                f"IS '{_FINGERPRINT_PREFIX}{fingerprint}';"
+            )
+        )
         op.execute(text(f"SELECT app_audit_track_table('{operation.table_name}'::regclass);"))
     else:
         op.execute(text(f"SELECT app_audit_ignore_table('{operation.table_name}'::regclass);"))
@@ -63,15 +93,23 @@ def app_audit(operations, operation: AppAuditTableOperation):
 
 def register_audit_metadata(target_metadata, base_model: DeclarativeBase):
     application_audit_by_table_name = {}
+    context_hash_by_table_name = {}
     for mapper in base_model.registry.mappers:
         table = mapper.local_table.name
-        if mapper.class_.__app_audit__:
-            context_builder_function = mapper.class_.__app_audit_context_builder__
-            application_audit_by_table_name[table] = mapper.class_.__app_audit__, context_builder_function
+        model_class = mapper.class_
+        app_audit_enabled = model_class.__app_audit__
+        if app_audit_enabled:
+            context_builder_function = model_class.__app_audit_context_builder__
+            application_audit_by_table_name[table] = app_audit_enabled, context_builder_function
+            context_hash_by_table_name[table] = context_function_fingerprint(context_builder_function)
         else:
-            application_audit_by_table_name[table] = mapper.class_.__app_audit__, None
+            application_audit_by_table_name[table] = app_audit_enabled, None
 
     target_metadata.info.setdefault('app_audit_enabled_tables', application_audit_by_table_name)
+    target_metadata.info.setdefault(
+        'app_audit_any_enabled', any(enabled for enabled, _ in application_audit_by_table_name.values())
+    )
+    target_metadata.info.setdefault('app_audit_context_hashes', context_hash_by_table_name)
 
 
 @renderers.dispatch_for(AppAuditTableOperation)
@@ -90,6 +128,10 @@ def render_create_sequence(autogen_context, op):
 
 @comparators.dispatch_for('table')
 def compare_table_level(autogen_context, modify_ops, schemaname, tablename, conn_table, metadata_table):
+    if not _app_audit_in_use(autogen_context):
+        # Nothing is audited in code or in the database, no per table work needed
+        return
+
     if metadata_table is None:
         # Table has been removed from code but still may exist in database
         modify_ops.ops.append(AppAuditTableOperation(tablename, audit=False, context_function=None))
@@ -99,15 +141,7 @@ def compare_table_level(autogen_context, modify_ops, schemaname, tablename, conn
     app_audit_enabled, context_function = app_audit_enabled_tables.get(tablename)
     conn = op.get_bind()
     if conn_table is not None:
-        result = conn.execute(
-            text(
-                f"""
-                SELECT count(*) FROM pg_trigger
-                WHERE tgrelid = '{tablename}'::regclass
-                AND (tgname = 'app_audit_delete_trigger' OR tgname = 'app_audit_insert_update_trigger');     
-            """
-            )
-        )
+        result = conn.execute(_TRIGGER_COUNT_SQL, {'table_name': tablename})
         try:
             count = result.fetchone()[0]
         except:  # noqa: E722
@@ -127,13 +161,13 @@ def compare_table_level(autogen_context, modify_ops, schemaname, tablename, conn
     # Enabled and exists in db
     elif app_audit_enabled and count == 2:
         # Detect potential changes for context function format
-        existing_trigger = conn.execute(
-            text(
-                f"""
-            SELECT pg_get_functiondef('app_audit_get_{tablename}_context'::regproc);            
-            """
-            )
-        )
+        function_name = f'app_audit_get_{tablename}_context'
+        expected_fingerprint = autogen_context.metadata.info.get('app_audit_context_hashes', {}).get(tablename)
+        existing_comment = conn.execute(_CONTEXT_FUNCTION_COMMENT_SQL, {'function_name': function_name}).scalar()
+        if expected_fingerprint and existing_comment == f'{_FINGERPRINT_PREFIX}{expected_fingerprint}':
+            return
+
+        existing_trigger = conn.execute(_CONTEXT_FUNCTION_DEF_SQL, {'function_name': function_name})
         pg_func = existing_trigger.fetchone()[0]
         norm_pg_func = normalize_sql(pg_func)
         norm_context_function = normalize_sql(context_function)
@@ -142,6 +176,21 @@ def compare_table_level(autogen_context, modify_ops, schemaname, tablename, conn
             modify_ops.ops.append(AppAuditTableOperation(tablename, audit=True, context_function=context_function))
 
 
+def _app_audit_in_use(autogen_context) -> bool:
+    """
+    Whether any model enables app audit or any app audit trigger still exists.
+    Checked once per autogenerate run instead of per table.
+    """
+    info = autogen_context.metadata.info
+    if info.get('app_audit_any_enabled'):
+        return True
+
+    if 'app_audit_triggers_exist' not in info:
+        info['app_audit_triggers_exist'] = bool(op.get_bind().execute(_ANY_TRIGGER_EXISTS_SQL).scalar())
+
+    return info['app_audit_triggers_exist']
+
+
 def normalize_sql(sql: str):
     """
     Normalize an SQL string to facilitate comparison.
@@ -162,3 +211,10 @@ def normalize_sql(sql: str):
 
     # Strip leading/trailing whitespace
     return normalized.strip()
+
+
+def context_function_fingerprint(context_function: str | None) -> str:
+    """
+    Short digest of the normalized context function, stored as a comment on the generated pg function
+    """
+    return hashlib.blake2b(normalize_sql(context_function or '').encode(), digest_size=16).hexdigest()
@@ -1,6 +1,5 @@
 import math
 
-from src.common.utils import group_iterable_by_attribute
 from src.platform.audit.domain import (
     AuditEventDomain,
     AuditLogRead,
@@ -48,26 +47,39 @@ class AuditService:
         Returns:
             PaginatedResult containing grouped events and metadata
         """
-        event_map = group_iterable_by_attribute(audit_logs, group_by_key='event_id')
         total_events_count = total_events_count or 0
         total_pages = math.ceil(total_events_count / page_size) if total_events_count > 0 else 1
 
+        events = self._group_events(audit_logs)
+
+        return PaginatedResult(
+            events=events,
+            current_page=page,
+            total_pages=total_pages,
+            page_size=page_size,
+        )
+
+    @staticmethod
+    def _group_events(audit_logs: list[AuditLog]) -> list[AuditEventDomain]:
+        # Single pass grouping that preserves first-seen event order; every group is non-empty
+        logs_by_event_id: dict = {}
+        for log in audit_logs:
+            event_logs = logs_by_event_id.get(log.event_id)
+            if event_logs is None:
+                event_logs = logs_by_event_id[log.event_id] = []
+            event_logs.append(log)
+
         events = []
-        for event_id, logs in event_map.items():
+        for event_id, logs in logs_by_event_id.items():
+            first_log = logs[0]
             events.append(
                 AuditEventDomain(
                     event_id=event_id,
-                    user_display_name=logs[0].user_display_name if logs else None,
-                    occurred_at=logs[0].occurred_at if logs else None,
+                    user_display_name=first_log.user_display_name,
+                    occurred_at=first_log.occurred_at,
                     logs=logs,
-                    event_context=logs[0].event_context if logs else None,
+                    event_context=first_log.event_context,
                     total_logs_count=len(logs),
                 )
             )
-
-        return PaginatedResult(
-            events=events,
-            current_page=page,
-            total_pages=total_pages,
-            page_size=page_size,
-        )
+        return events
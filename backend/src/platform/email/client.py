@@ -1,25 +1,21 @@
 import abc
 import datetime
+import functools
 import os
 import smtplib
+from contextlib import contextmanager
 from email.message import EmailMessage
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
 
-import boto3
-import resend
 import sentry_sdk
-from botocore.exceptions import BotoCoreError, ClientError
 from loguru import logger
 from pydantic import model_validator
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
 from slugify import slugify
 
 from src import settings
 from src.common.domain import BaseDomain
 from src.common.nanoid import generate_custom_nanoid
-from src.platform.email.exceptions import EmailFailedToSend
+from src.common.templates import get_template_environment
+from src.platform.email.exceptions import EmailBatchFailedToSend, EmailFailedToSend
 
 
 class EmailClientDomain(BaseDomain):
@@ -49,6 +45,25 @@ class AbstractEmailClient(abc.ABC):
     @abc.abstractmethod
     def send(self, message: EmailClientDomain): ...
 
+    def send_many(self, messages: list[EmailClientDomain]):
+        """
+        Clients that can share a connection or batch API call should override this.
+        Every message is attempted before reporting failures.
+
+        Raises:
+            EmailBatchFailedToSend: Carrying only the messages that were not sent
+        """
+        unsent = []
+        for message in messages:
+            try:
+                self.send(message)
+            except Exception as exc:
+                logger.warning(f'{self.__class__.__name__} failed to send {message.subject}-{message.to_emails}: {exc}')
+                unsent.append(message)
+
+        if unsent:
+            raise EmailBatchFailedToSend(message=f'{len(unsent)} of {len(messages)} email(s) not sent', unsent=unsent)
+
 
 class MailPitClient(AbstractEmailClient):
     def __init__(self, *args, **kwargs):
@@ -58,6 +73,42 @@ class MailPitClient(AbstractEmailClient):
         super().__init__(*args, **kwargs)
 
     def send(self, message: EmailClientDomain):
+        self.send_many([message])
+
+    def send_many(self, messages: list[EmailClientDomain]):
+        unsent = []
+        attempted_count = 0
+        try:
+            # One connection (TCP + EHLO) for the whole batch
+            with self._connection() as server:
+                for message in messages:
+                    try:
+                        server.send_message(self._build_message(message))
+                    except smtplib.SMTPServerDisconnected:
+                        raise
+                    except smtplib.SMTPException as exc:
+                        # Refused for this message only, e.g. its recipients, the connection is still usable
+                        logger.warning(f'MailPit refused {message.subject}-{message.to_emails}: {exc}')
+                        unsent.append(message)
+                    attempted_count += 1
+        except (OSError, smtplib.SMTPException) as exc:
+            # The connection itself failed, nothing from the message in flight onwards went out
+            unsent.extend(messages[attempted_count:])
+            raise EmailBatchFailedToSend(message=f'MailPit: {exc}', unsent=unsent) from exc
+
+        if unsent:
+            raise EmailBatchFailedToSend(
+                message=f'MailPit: {len(unsent)} of {len(messages)} email(s) not sent', unsent=unsent
+            )
+
+        logger.info(f'{len(messages)} message(s) sent to MailPit server at {self.smtp_host}:{self.smtp_port}')
+
+    @contextmanager
+    def _connection(self):
+        with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
+            yield server
+
+    def _build_message(self, message: EmailClientDomain) -> EmailMessage:
         # Create the base text message
         msg = EmailMessage()
         msg['Subject'] = message.subject
@@ -76,10 +127,7 @@ class MailPitClient(AbstractEmailClient):
         if message.html_content:
             msg.add_alternative(message.html_content, subtype='html')
 
-        # Send message
-        with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-            server.send_message(msg)
-            logger.info(f'Message sent to MailPit server at {self.smtp_host}:{self.smtp_port}')
+        return msg
 
 
 class MockEmailClient(AbstractEmailClient):
@@ -97,13 +145,19 @@ class MockEmailClient(AbstractEmailClient):
         return []
 
 
-class SendGridAPIEmailClient(SendGridAPIClient):
+class SendGridAPIEmailClient(AbstractEmailClient):
     def __init__(self, *args, **kwargs):
-        super().__init__(
+        # Vendor SDKs are imported on first use so workers on other backends don't pay for them
+        from sendgrid import SendGridAPIClient
+
+        self.client = SendGridAPIClient(
             api_key=settings.SENDGRID_API_KEY,
         )
+        super().__init__(*args, **kwargs)
 
     def send(self, message: EmailClientDomain):
+        from sendgrid.helpers.mail import Mail
+
         sendgrid_mail = Mail(
             from_email=message.from_email,
             to_emails=message.to_emails,
@@ -114,7 +168,7 @@ class SendGridAPIEmailClient(SendGridAPIClient):
         for bcc in message.bcc_emails:
             sendgrid_mail.add_bcc(bcc)
 
-        response = super().send(sendgrid_mail)
+        response = self.client.send(sendgrid_mail)
         if 200 <= response.status_code < 300:
             print('Request was successful.')
         else:
@@ -122,16 +176,41 @@ class SendGridAPIEmailClient(SendGridAPIClient):
 
 
 class ResendEmailClient(AbstractEmailClient):
+    # Resend caps the number of emails per batch request
+    BATCH_SIZE = 100
+
     def __init__(self, *args, **kwargs):
         if not settings.RESEND_API_KEY:
             raise EmailFailedToSend(message='RESEND_API_KEY not configured')
+        import resend
+
         resend.api_key = settings.RESEND_API_KEY
+        self._resend = resend
         super().__init__(*args, **kwargs)
 
     def send(self, message: EmailClientDomain):
+        try:
+            response = self._resend.Emails.send(self._build_params(message))
+            logger.info(f'Resend email sent successfully: id={response.get("id")} to={message.to_emails}')
+        except Exception as exc:
+            logger.error(f'Resend failed: {exc}')
+            raise EmailFailedToSend(message=f'Resend: {exc}') from exc
+
+    def send_many(self, messages: list[EmailClientDomain]):
+        for i in range(0, len(messages), self.BATCH_SIZE):
+            batch = messages[i : i + self.BATCH_SIZE]
+            try:
+                self._resend.Batch.send([self._build_params(message) for message in batch])
+                logger.info(f'Resend batch of {len(batch)} email(s) sent successfully')
+            except Exception as exc:
+                # Earlier batches already went out, only hand back this batch and the ones after it
+                logger.error(f'Resend batch failed: {exc}')
+                raise EmailBatchFailedToSend(message=f'Resend: {exc}', unsent=messages[i:]) from exc
+
+    def _build_params(self, message: EmailClientDomain) -> dict:
         from_email = f'{message.from_email[1]} <{message.from_email[0]}>'
 
-        params: resend.Emails.SendParams = {
+        params = {
             'from': from_email,
             'to': message.to_emails,
             'subject': message.subject,
@@ -146,12 +225,7 @@ class ResendEmailClient(AbstractEmailClient):
         if message.plain_text_content:
             params['text'] = message.plain_text_content
 
-        try:
-            response = resend.Emails.send(params)
-            logger.info(f'Resend email sent successfully: id={response.get("id")} to={message.to_emails}')
-        except Exception as exc:
-            logger.error(f'Resend failed: {exc}')
-            raise EmailFailedToSend(message=f'Resend: {exc}') from exc
+        return params
 
 
 class EmailFileClient(AbstractEmailClient):
@@ -176,27 +250,13 @@ class EmailFileClient(AbstractEmailClient):
 
     def write_email(self, message: EmailClientDomain) -> str:
         if message.html_content is not None:
-            # Handle formatting for HTML views
-            metadata_html_lines = [
-                f'<strong>From:</strong> {message.from_email[1]} ({message.from_email[0]})'
-                if message.from_email
-                else '<strong>From:</strong> None',
-                f"<strong>To:</strong> {', '.join(message.to_emails)}"
-                if message.to_emails
-                else '<strong>To:</strong> None',
-                f"<strong>Bcc:</strong> {', '.join(message.bcc_emails)}"
-                if message.bcc_emails
-                else '<strong>Bcc:</strong> None',
-                f'<strong>Subject:</strong> {message.subject}' if message.subject else '<strong>Subject:</strong> None',
-            ]
-            metadata_html_content = '<br>'.join(metadata_html_lines)
-            # Wrap HTML metadata in a styled block
-            metadata_html = f"""
-                 <div style="background-color: #f0f0f0; padding: 10px; margin-bottom: 20px; border-radius: 5px; font-family: Arial, sans-serif; font-size: 14px;">
-                     <p>{metadata_html_content}</p>
-                 </div>
-             """
-            content = metadata_html + (message.html_content or '')
+            # Handle formatting for HTML views, metadata goes in a styled block
+            header = (
+                get_template_environment('src.platform.email')
+                .get_template('file-client-header.html')
+                .render(message=message)
+            )
+            body = message.html_content
         else:
             # Handle formatting for plain text views
             metadata_plain_lines = [
@@ -205,12 +265,14 @@ class EmailFileClient(AbstractEmailClient):
                 f"Bcc: {', '.join(message.bcc_emails)}" if message.bcc_emails else 'Bcc: None',
                 f'Subject: {message.subject}' if message.subject else 'Subject: None',
             ]
-            metadata_plain_content = '\n'.join(metadata_plain_lines)
-            content = metadata_plain_content + '\n\n' + (message.plain_text_content or '')
+            header = '\n'.join(metadata_plain_lines) + '\n\n'
+            body = message.plain_text_content or ''
 
         file_with_path = self._get_full_filename(message)
+        # Written separately to avoid copying large bodies into a concatenated string
         with open(file_with_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+            f.write(header)
+            f.write(body)
 
         return file_with_path
 
@@ -218,13 +280,20 @@ class EmailFileClient(AbstractEmailClient):
         """Return a unique file name."""
         timestamp = datetime.datetime.now().strftime('%Y%m%d-%H%M%S')
         random = generate_custom_nanoid(size=4)
-        file_name = f'{timestamp}-{random}-{slugify(str(message.subject))}.html'
-        file_with_path = os.path.join(self.file_path, file_name)
-        return file_with_path
+        file_name = f'{timestamp}-{random}-{_slugify_subject(str(message.subject))}.html'
+        return os.path.join(self.file_path, file_name)
+
+
+@functools.lru_cache(maxsize=256)
+def _slugify_subject(subject: str) -> str:
+    # Templated mail repeats subjects, slugify is a regex pipeline worth skipping
+    return slugify(subject)
 
 
 class AWSEmailClient(AbstractEmailClient):
     def __init__(self, *args, **kwargs):
+        import boto3
+
         self.client = boto3.client(
             'ses',
             region_name=settings.AWS_REGION_NAME,
@@ -237,28 +306,22 @@ class AWSEmailClient(AbstractEmailClient):
         """
         Send an email using AWS SES API
         """
-        mmp = MIMEMultipart('alternative')
+        from botocore.exceptions import BotoCoreError, ClientError
 
+        # SES builds the MIME envelope server side, no need to serialize one ourselves
+        body = {}
         if message.plain_text_content is not None:
-            part1 = MIMEText(message.plain_text_content, 'plain')
-            mmp.attach(part1)
+            body['Text'] = {'Data': message.plain_text_content, 'Charset': 'UTF-8'}
 
         if message.html_content is not None:
-            part2 = MIMEText(message.html_content, 'html')
-            mmp.attach(part2)
-
-        mmp['Subject'] = message.subject
-        mmp['From'] = f'{message.from_email[1]} <{message.from_email[0]}>'
-        # mmp['From'] = message.from_email[0]
-        mmp['To'] = ', '.join(message.to_emails)
-        mmp['Bcc'] = ', '.join(message.bcc_emails)
+            body['Html'] = {'Data': message.html_content, 'Charset': 'UTF-8'}
 
         logger.info(f'sending {message.subject} email to {message.to_emails}')
         try:
-            response = self.client.send_raw_email(
-                Source=message.from_email[0],
-                Destinations=message.to_emails + message.bcc_emails,
-                RawMessage={'Data': mmp.as_string()},
+            response = self.client.send_email(
+                Source=f'{message.from_email[1]} <{message.from_email[0]}>',
+                Destination={'ToAddresses': message.to_emails, 'BccAddresses': message.bcc_emails or []},
+                Message={'Subject': {'Data': message.subject, 'Charset': 'UTF-8'}, 'Body': body},
             )
         except (BotoCoreError, ClientError) as exc:
             logger.exception(exc)
@@ -299,3 +362,31 @@ class ResilientLiveEmailClient(AbstractEmailClient):
 
         if not message_sent:
             raise EmailFailedToSend(message=f'Exhausted all clients -> {message.subject}-{message.to_emails}')
+
+    def send_many(self, messages: list[EmailClientDomain]):
+        """
+        Fail over only the messages a client reports as unsent, so recipients never get duplicates
+        """
+        unsent = messages
+        for email_client in self.CLIENT_PRIORITY_ORDER:
+            client_name = email_client.__name__
+            logger.info(f'Attempting to send {len(unsent)} email(s) via {client_name}')
+            try:
+                email_client().send_many(unsent)
+            except EmailBatchFailedToSend as exc:
+                logger.warning(f'{client_name} failed to send {len(exc.unsent)} of {len(unsent)} email(s): {exc}')
+                sentry_sdk.capture_exception()
+                unsent = exc.unsent
+            except Exception as exc:
+                # Raised before anything was sent (e.g. client misconfigured), the whole remainder moves on
+                logger.error(f'{client_name} unexpected error: {exc}')
+                sentry_sdk.capture_exception()
+            else:
+                logger.info(f'{len(unsent)} email(s) sent successfully via {client_name}')
+                unsent = []
+                break
+
+        if unsent:
+            raise EmailBatchFailedToSend(
+                message=f'Exhausted all clients -> {len(unsent)} of {len(messages)} email(s)', unsent=unsent
+            )
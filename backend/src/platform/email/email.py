@@ -1,12 +1,20 @@
+import functools
 from typing import Any
 
 from pydantic import EmailStr, Field
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
 
 from src.common.domain import BaseDomain
-from src.network.database.session import on_commit
-from src.platform.email.tasks import _send_template_email
+from src.network.database.session import db, on_commit
+from src.platform.email.tasks import _send_template_email, _send_template_email_batch
 from src.platform.email.utils import render_template
 
+_PENDING_EMAILS_KEY = 'pending_template_emails'
+_BATCH_LISTENERS_KEY = 'template_email_batch_listeners'
+# Keeps worker messages small and bounds what one failing provider call can hold up
+MAX_EMAILS_PER_BATCH = 50
+
 
 class Email(BaseDomain):
     subject: str
@@ -29,16 +37,18 @@ class Email(BaseDomain):
         send_on_commit: bool = True,
         send_async: bool = True,
     ):
-        # make sure the email generates before dispatching send
-        self.render_template_with_context()
-        kwargs = dict(
-            subject=self.subject,
-            recipients=self.recipients,
-            context=self.context,
-            template_name=self.template_name,
-        )
+        # make sure the email generates before dispatching send, the worker reuses this render
+        rendered_html = self.render_template_with_context()
+        # Plain dict as this is the worker message payload
+        send_kwargs = {
+            'subject': self.subject,
+            'recipients': self.recipients,
+            'context': self.context,
+            'template_name': self.template_name,
+            'rendered_html': rendered_html,
+        }
         self._send(
-            send_kwargs=kwargs,
+            send_kwargs=send_kwargs,
             send_on_commit=send_on_commit,
             send_async=send_async,
         )
@@ -52,6 +62,11 @@ class Email(BaseDomain):
         """
         Broken out to be easily patched during testing
         """
+        if send_async and send_on_commit:
+            # Coalesce all emails of the transaction into one worker message
+            _queue_for_batch_on_commit(send_kwargs)
+            return
+
         if send_async:
             # Send this off to a worker
             send_function = _send_template_email.send
@@ -60,6 +75,36 @@ class Email(BaseDomain):
 
         if send_on_commit:
             # Send this at the end of transaction
-            on_commit(lambda session: send_function(**send_kwargs))
+            on_commit(functools.partial(send_function, **send_kwargs))
         else:
             send_function(**send_kwargs)
+
+
+def _queue_for_batch_on_commit(send_kwargs: dict[str, Any]):
+    session = db.session
+    if not session.in_transaction():
+        # Rollback only fires after_soft_rollback for a begun transaction, without one
+        # these emails would survive a rollback and go out on the next commit
+        session.begin()
+
+    if not session.info.get(_BATCH_LISTENERS_KEY):
+        event.listen(session, 'after_commit', _flush_pending_emails)
+        event.listen(session, 'after_soft_rollback', _discard_pending_emails)
+        session.info[_BATCH_LISTENERS_KEY] = True
+
+    session.info.setdefault(_PENDING_EMAILS_KEY, []).append(send_kwargs)
+
+
+def _flush_pending_emails(session: Session):
+    pending_emails = session.info.pop(_PENDING_EMAILS_KEY, None)
+    if not pending_emails:
+        return
+
+    for i in range(0, len(pending_emails), MAX_EMAILS_PER_BATCH):
+        _send_template_email_batch.send(pending_emails[i : i + MAX_EMAILS_PER_BATCH])
+
+
+def _discard_pending_emails(session: Session, previous_transaction: SessionTransaction):
+    # Only the outermost rollback abandons the transaction's emails
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_EMAILS_KEY, None)
@@ -1,4 +1,19 @@
+from typing import TYPE_CHECKING
+
 from src.common.exceptions import InternalException
 
+if TYPE_CHECKING:
+    from src.platform.email.client import EmailClientDomain
+
 
 class EmailFailedToSend(InternalException): ...
+
+
+class EmailBatchFailedToSend(EmailFailedToSend):
+    """
+    Raised by send_many, carries the messages that did not go out so only those are retried
+    """
+
+    def __init__(self, message: str | None = None, unsent: list['EmailClientDomain'] | None = None):
+        super().__init__(message=message)
+        self.unsent = unsent or []
@@ -1,3 +1,5 @@
+from typing import Any
+
 from loguru import logger
 
 from src import settings
@@ -48,7 +50,31 @@ class EmailService:
         """
         Send an email using client configured by environment
         """
-        message = client.EmailClientDomain(
+        message = self._build_message(
+            subject=subject,
+            recipients=recipients,
+            plain_message=plain_message,
+            html_message=html_message,
+        )
+        logger.info(f'sending {subject} email to {recipients}')
+        self.client.send(message)
+
+    def send_many(self, emails: list[dict[str, Any]]):
+        """
+        Send several emails with a single client call, each dict takes the arguments of send
+        """
+        messages = [self._build_message(**email) for email in emails]
+        logger.info(f'sending batch of {len(messages)} email(s)')
+        self.client.send_many(messages)
+
+    def _build_message(
+        self,
+        subject: str,
+        recipients: list[str],
+        plain_message: str | None = None,
+        html_message: str | None = None,
+    ) -> client.EmailClientDomain:
+        return client.EmailClientDomain(
             # Something like Burn Notice <no-reply@burn_notice.com
             from_email=(settings.EMAIL_FROM_ADDRESS, settings.COMPANY_NAME),
             to_emails=recipients,
@@ -57,5 +83,3 @@ class EmailService:
             plain_text_content=plain_message,
             html_content=html_message,
         )
-        logger.info(f'sending {subject} email to {recipients}')
-        self.client.send(message)
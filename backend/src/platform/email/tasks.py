@@ -1,12 +1,15 @@
 import dramatiq
+from loguru import logger
 
+from src.platform.email.exceptions import EmailBatchFailedToSend, EmailFailedToSend
 from src.platform.email.service import EmailService
 from src.platform.email.utils import render_template
 
 
 @dramatiq.actor(max_retries=0)
-def _send_template_email(subject, recipients, context, template_name):
-    html_message = render_template(
+def _send_template_email(subject, recipients, context, template_name, rendered_html=None):
+    # Messages enqueued before rendered_html was passed along still render here
+    html_message = rendered_html or render_template(
         template_name=template_name,
         context=context,
     )
@@ -17,3 +20,36 @@ def _send_template_email(subject, recipients, context, template_name):
         recipients=recipients,
         html_message=html_message,
     )
+
+
+@dramatiq.actor(max_retries=0)
+def _send_template_email_batch(jobs: list[dict]):
+    """
+    Sends the template emails queued during a transaction with one client call.
+    Each job renders on its own so a bad context only costs that email, the rest still go out.
+    """
+    emails = []
+    failed_subjects = []
+    for job in jobs:
+        try:
+            html_message = job.get('rendered_html') or render_template(
+                template_name=job['template_name'],
+                context=job['context'],
+            )
+        except Exception:
+            logger.exception(f'failed to render {job["template_name"]} email to {job["recipients"]}')
+            failed_subjects.append(job['subject'])
+            continue
+
+        emails.append(dict(subject=job['subject'], recipients=job['recipients'], html_message=html_message))
+
+    if emails:
+        service = EmailService.factory()
+        try:
+            service.send_many(emails)
+        except EmailBatchFailedToSend as exc:
+            logger.exception(exc)
+            failed_subjects.extend(message.subject for message in exc.unsent)
+
+    if failed_subjects:
+        raise EmailFailedToSend(message=f'{len(failed_subjects)} of {len(jobs)} email(s) not sent: {failed_subjects}')
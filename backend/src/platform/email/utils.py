@@ -1,16 +1,11 @@
 import datetime
 
-from jinja2 import Environment, PackageLoader, select_autoescape
-
 from src import settings
+from src.common.templates import get_template_environment
 
 
 def render_template(template_name: str, context: dict):
-    env = Environment(
-        loader=PackageLoader('src.platform.email', 'templates'),
-        autoescape=select_autoescape(['html', 'xml']),
-    )
-    template = env.get_template(template_name)
+    template = get_template_environment('src.platform.email').get_template(template_name)
 
     # Add company information to all email templates
     return template.render(
@@ -1,7 +1,7 @@
 import abc
 import uuid
 from collections import defaultdict
-from typing import DefaultDict, List
+from typing import DefaultDict, Dict, List, Tuple
 
 from loguru import logger
 
@@ -15,6 +15,19 @@ from src.platform.event.exceptions import (
 from src.platform.event.subscriber import BaseSubscriber
 
 
+def _event_create(event: BaseEvent) -> EventCreate:
+    """
+    Built from the event directly rather than serialize(), which stringifies the id only for it to be
+    parsed back and carries created_at which the Event row sets itself
+    """
+    return EventCreate(
+        id=event.id,
+        event_type=event.event_type,
+        payload=event.payload.serialize(),
+        payload_class=event.PAYLOAD_CLASS.__name__,
+    )
+
+
 class BaseEventDAO(abc.ABC):
     def get(self, event_id: str):
         raise NotImplementedError
@@ -22,6 +35,9 @@ class BaseEventDAO(abc.ABC):
     def append(self, event: BaseEvent):
         raise NotImplementedError
 
+    def append_many(self, events: List[BaseEvent]):
+        raise NotImplementedError
+
     def remove(self, event: BaseEvent):
         raise NotImplementedError
 
@@ -35,11 +51,15 @@ class SQLAlchemyEventDao(BaseEventDAO):
         return BaseEvent.get_concrete_event_from_model(app_event)
 
     def append(self, event: BaseEvent) -> BaseEvent:
-        data = event.serialize()
-        event_create = EventCreate(**data)
-        app_event = Event.create(event_create)
+        app_event = Event.create(_event_create(event))
         return BaseEvent.get_concrete_event_from_model(app_event)
 
+    def append_many(self, events: List[BaseEvent]) -> None:
+        """
+        Stores all events with a single multi-row INSERT
+        """
+        Event.bulk_create([_event_create(event) for event in events])
+
     def remove(self, event: BaseEvent) -> None:
         Event.delete(Event.id == event.id)
 
@@ -53,16 +73,24 @@ class EventBus:
     def __init__(self, subscriber_registry: List[str]):
         self.event_dao = SQLAlchemyEventDao()
 
-        self._subscriber_registry: DefaultDict[str, List[BaseSubscriber]] = self._register_subscribers(
+        self._subscriber_registry: DefaultDict[type | str, List[BaseSubscriber]] = self._register_subscribers(
             subscriber_registry
         )
+        self._subscribers_for_event: Dict[type, Tuple[BaseSubscriber, ...]] = self._build_subscribers_for_event(
+            self._subscriber_registry
+        )
+        # Used for events without subscribers of their own
+        self._all_event_subscribers: Tuple[BaseSubscriber, ...] = self._dedupe_subscribers(
+            self._subscriber_registry.get(ALL_EVENTS, []), ALL_EVENTS
+        )
 
     @classmethod
     def initialize(cls, subscriber_registry: List[str]):
         global EB
         EB = cls(subscriber_registry)
+        BaseEvent._bus = EB
 
-    def _register_subscribers(self, subscriber_registry: List[str]) -> DefaultDict[str, List[BaseSubscriber]]:
+    def _register_subscribers(self, subscriber_registry: List[str]) -> DefaultDict[type | str, List[BaseSubscriber]]:
         subscriber_registry_map = defaultdict(list)
         for subscriber_path in subscriber_registry:
             try:
@@ -75,18 +103,64 @@ class EventBus:
                 if event_class == ALL_EVENTS:
                     subscriber_registry_map[ALL_EVENTS].append(subscriber)
                 else:
-                    subscriber_registry_map[event_class.__name__].append(subscriber)
+                    # Keyed by the class itself so publishing is a single identity-hashed lookup
+                    subscriber_registry_map[event_class].append(subscriber)
 
             logger.info(f'subscriber registered: {subscriber}')
 
         return subscriber_registry_map
 
+    def _build_subscribers_for_event(
+        self, subscriber_registry_map: DefaultDict[type | str, List[BaseSubscriber]]
+    ) -> Dict[type, Tuple[BaseSubscriber, ...]]:
+        """
+        Precomputes the ordered, deduplicated subscribers to run per event so publishing does no list building
+        """
+        all_event_subscribers = subscriber_registry_map.get(ALL_EVENTS, ())
+        subscribers_for_event = {}
+        for event_class, subscribers in subscriber_registry_map.items():
+            if event_class == ALL_EVENTS:
+                continue
+
+            subscribers_for_event[event_class] = self._dedupe_subscribers(
+                [*subscribers, *all_event_subscribers], event_class.__name__
+            )
+
+        return subscribers_for_event
+
+    def _dedupe_subscribers(self, subscribers: List[BaseSubscriber], event_name: str) -> Tuple[BaseSubscriber, ...]:
+        subscribers_by_name = {}
+        for subscriber in subscribers:
+            subscriber_name = subscriber.__class__.__name__
+            if subscriber_name in subscribers_by_name:
+                logger.warning(f'subscriber: {subscriber_name} registered more than once for {event_name}')
+                continue
+            subscribers_by_name[subscriber_name] = subscriber
+
+        return tuple(subscribers_by_name.values())
+
     def publish(self, event: BaseEvent):
         if len(self._subscriber_registry) == 0:
             raise NoSubscribersRegistered(message='No subscribers registered to EventBus!')
 
         self._publish_event(event)
 
+    def publish_batch(self, events: List[BaseEvent]):
+        """
+        Publishes several events, storing the STORE_EVENT ones in one round trip
+        before any subscriber runs.
+        """
+        if len(self._subscriber_registry) == 0:
+            raise NoSubscribersRegistered(message='No subscribers registered to EventBus!')
+
+        events_to_store = [event for event in events if event.STORE_EVENT]
+        if events_to_store:
+            self.event_dao.append_many(events_to_store)
+
+        for event in events:
+            logger.info(f'publishing event: {event}')
+            self._run_subscriber(event)
+
     def _publish_event(self, event: BaseEvent):
         logger.info(f'publishing event: {event}')
         if event.STORE_EVENT:
@@ -95,16 +169,10 @@ class EventBus:
         self._run_subscriber(event)
 
     def _run_subscriber(self, event):
-        run_subscribers = set()
-        all_event_subscribers = self._subscriber_registry[ALL_EVENTS]
-        subscribers = self._subscriber_registry[event.__class__.__name__]
-        for subscriber in [*subscribers, *all_event_subscribers]:
-            if subscriber.__class__.__name__ in run_subscribers:
-                logger.info(f'subscriber: {subscriber.__class__.__name__} already ran')
-
+        subscribers = self._subscribers_for_event.get(type(event), self._all_event_subscribers)
+        for subscriber in subscribers:
             logger.info(f'running subscriber: {subscriber.__class__.__name__}')
             subscriber.run(event)
-            run_subscribers.add(subscriber.__class__.__name__)
 
     def _store_event(self, event: BaseEvent):
         self.event_dao.append(event)
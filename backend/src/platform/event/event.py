@@ -1,14 +1,16 @@
 import datetime
+import functools
 import uuid
 from typing import Generic, Optional, TypeVar
 
 from src.platform.event.exceptions import EventBusNotInitialized
-from src.platform.event.payload import _PAYLOAD_TYPE_REGISTRY, BaseEventPayload
+from src.platform.event.payload import BaseEventPayload
 
 # Used to register subscribers to all events
 ALL_EVENTS = '*'
 
-_EVENT_TYPES_REGISTRY = {}
+# event_type -> (event class, payload class), one lookup when rebuilding events
+_EVENT_REGISTRY: dict[str, tuple[type['BaseEvent'], type[BaseEventPayload]]] = {}
 
 
 class BaseEventMeta(type):
@@ -20,12 +22,25 @@ class BaseEventMeta(type):
         klass = super().__new__(mcs, name, bases, attrs)
 
         if klass.EVENT_TYPE != NotImplemented:
-            _EVENT_TYPES_REGISTRY[klass.EVENT_TYPE.value] = klass
-            _PAYLOAD_TYPE_REGISTRY[klass.EVENT_TYPE.value] = klass.PAYLOAD_CLASS
+            _EVENT_REGISTRY[klass.EVENT_TYPE.value] = (klass, klass.PAYLOAD_CLASS)
+            _constructor_for.cache_clear()
 
         return klass
 
 
+@functools.lru_cache(maxsize=256)
+def _constructor_for(event_type: str):
+    """
+    Builds the event for event_type from raw payload data, resolved once per event type
+    """
+    klass, payload_class = _EVENT_REGISTRY[event_type]
+
+    def construct(id, payload: dict, created_at):
+        return klass(id=id, payload=payload_class(**payload), created_at=created_at)
+
+    return construct
+
+
 TPayload = TypeVar('TPayload', bound=BaseEventPayload)
 
 
@@ -42,6 +57,8 @@ class BaseEvent(Generic[TPayload], metaclass=BaseEventMeta):
     EVENT_TYPE = NotImplemented
     # If you dont want to store an event in the DB, set this to False
     STORE_EVENT: bool = False
+    # Set by EventBus.initialize so publishing doesn't go through an import
+    _bus = None
 
     __slots__ = [
         'id',
@@ -62,7 +79,8 @@ class BaseEvent(Generic[TPayload], metaclass=BaseEventMeta):
         payload: TPayload,
         created_at: Optional[datetime.datetime] = None,
     ):
-        self.id = id
+        # Ids rebuilt from serialized dicts arrive as strings, kept as a UUID so reads of .id are free
+        self.id = id if isinstance(id, uuid.UUID) else uuid.UUID(id)
         self._payload = payload
 
         # Event meta
@@ -84,18 +102,14 @@ class BaseEvent(Generic[TPayload], metaclass=BaseEventMeta):
         cls,
         payload: TPayload,
     ):
-        return cls(
-            id=uuid.uuid4(),
-            payload=payload,
-        )
+        # Positional with the timestamp supplied, skips the created_at fallback in __init__
+        return cls(uuid.uuid4(), payload, datetime.datetime.now())
 
     def publish(self):
-        from src.platform.event.bus import EB
-
-        if EB is None:
+        if self._bus is None:
             raise EventBusNotInitialized('EventBus.initialize never called')
 
-        EB.publish(self)
+        self._bus.publish(self)
         # @TODO Process after transaction commits
         # transaction.on_commit(lambda: EP.process(self))
 
@@ -104,30 +118,14 @@ class BaseEvent(Generic[TPayload], metaclass=BaseEventMeta):
         """
         Returns the correct concrete event given model object
         """
-        klass = _EVENT_TYPES_REGISTRY[event.event_type]
-        payload_class = _PAYLOAD_TYPE_REGISTRY[event.event_type]
-        payload = payload_class(**event.payload)
-
-        return klass(
-            id=event.id,
-            payload=payload,
-            created_at=event.created_at,
-        )
+        return _constructor_for(event.event_type)(event.id, event.payload, event.created_at)
 
     @classmethod
     def get_concrete_event_from_dict(cls, event) -> 'BaseEvent':
         """
         Returns the correct concrete event given raw event data as a dict
         """
-        klass = _EVENT_TYPES_REGISTRY[event['event_type']]
-        payload_class = _PAYLOAD_TYPE_REGISTRY[event['event_type']]
-        payload = payload_class(**event['payload'])
-
-        return klass(
-            id=event['id'],
-            payload=payload,
-            created_at=event['created_at'],
-        )
+        return _constructor_for(event['event_type'])(event['id'], event['payload'], event['created_at'])
 
     def serialize(self) -> dict:
         return {
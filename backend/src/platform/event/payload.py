@@ -4,8 +4,6 @@ import pydantic
 
 TEventPayload = TypeVar('TEventPayload', bound='BaseEventPayload')
 
-_PAYLOAD_TYPE_REGISTRY = {}
-
 
 class BaseEventPayload(pydantic.BaseModel):
     def __str__(self):
@@ -1,16 +1,41 @@
+import functools
 import re
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from types import SimpleNamespace
-from typing import Dict, List
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Tuple
+from urllib.parse import urlsplit
 
 import boto3
 import requests
+from boto3.s3.transfer import TransferConfig
+from botocore.auth import S3SigV4QueryAuth
+from botocore.awsrequest import AWSRequest
 from botocore.client import Config
-from botocore.exceptions import ClientError
+from botocore.exceptions import ClientError, NoCredentialsError
 from loguru import logger
+from requests_toolbelt import MultipartEncoder
 
 from src import settings
-from src.common.utils import split_every
+
+_FILENAME = re.compile(r'filename="([^"]+)"')
+# Anything outside ISO-8859-1, substituted in C rather than a per character python loop
+_NON_LATIN1_CHARACTERS = re.compile(r'[^\x00-\xff]')
+
+# Copies in flight at once, the client connection pool is sized to match
+BULK_COPY_MAX_WORKERS = 32
+# Objects over the 5GB copy_object limit are copied in parts
+_LARGE_COPY_CONFIG = TransferConfig(multipart_chunksize=64 * 1024 * 1024, max_concurrency=10)
+# Streamed uploads hold at most multipart_chunksize * max_concurrency in memory
+_STREAMING_UPLOAD_CONFIG = TransferConfig(multipart_chunksize=8 * 1024 * 1024, max_concurrency=10, use_threads=True)
+
+
+def _is_copy_size_limit_error(error: ClientError) -> bool:
+    """
+    copy_object rejects sources over 5GB with a generic InvalidRequest, told apart by its message
+    """
+    details = error.response.get('Error', {})
+    return details.get('Code') == 'InvalidRequest' and 'maximum allowable size' in details.get('Message', '')
 
 
 def sanitize_disposition(disposition):
@@ -23,13 +48,13 @@ def sanitize_disposition(disposition):
     :return: Sanitized Content-Disposition header string (str)
     """
 
-    match = re.search(r'filename="([^"]+)"', disposition)
+    match = _FILENAME.search(disposition)
     if not match:
         return disposition
 
     original_filename = match.group(1)
 
-    sanitized_filename = ''.join(c if ord(c) < 256 else '-' for c in original_filename)
+    sanitized_filename = _NON_LATIN1_CHARACTERS.sub('-', original_filename)
 
     # Reconstruct the disposition with the sanitized filename
     sanitized_disposition = disposition.replace(original_filename, sanitized_filename)
@@ -39,36 +64,39 @@ def sanitize_disposition(disposition):
 
 class S3Storage:
     def __init__(self):
-        self.client = self._get_client()
-
-    def _get_client(self):
-        session = boto3.session.Session(
+        self.session = boto3.session.Session(
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
             region_name=settings.AWS_REGION_NAME,
         )
-        client = session.client('s3', config=Config(signature_version='s3v4'))
+        self.client = self._get_client()
+        # Refreshable for role based credentials, frozen per signature
+        self.credentials = self.session.get_credentials()
+
+    def _get_client(self):
+        client = self.session.client(
+            's3', config=Config(signature_version='s3v4', max_pool_connections=BULK_COPY_MAX_WORKERS)
+        )
         return client
 
     def delete_by_prefix(self, prefix: str):
         paginator = self.client.get_paginator('list_objects_v2')
+        # A page holds at most 1000 keys, the delete_objects limit, so each page is deleted as it arrives
         response = paginator.paginate(
             Bucket=settings.AWS_STORAGE_BUCKET_NAME,
             Prefix=prefix,
             MaxKeys=1000,
         )
-        objects_to_delete = []
         for page in response:
-            if 'Contents' in page:
-                objects_to_delete.extend(page['Contents'])
+            contents = page.get('Contents')
+            if not contents:
+                continue
 
-        S3_MAX_DELETE_SIZE = 1000
-        for chunk in split_every(objects_to_delete, S3_MAX_DELETE_SIZE):
             self.client.delete_objects(
-                Delete={'Objects': [{'Key': s3_object['Key']} for s3_object in chunk]},
+                Delete={'Objects': [{'Key': s3_object['Key']} for s3_object in contents]},
                 Bucket=settings.AWS_STORAGE_BUCKET_NAME,
             )
-            logger.info(f'deleted {len(chunk)} objects with prefix: {prefix}')
+            logger.info(f'deleted {len(contents)} objects with prefix: {prefix}')
 
     def create_presigned_put(self, object_name, expiration=3600):
         """Generate a presigned URL to share an S3 object
@@ -157,26 +185,78 @@ class S3Storage:
         return url
 
     def upload_from_presigned_post(self, presigned_post, files):
-        response = requests.post(presigned_post['url'], files=files, data=presigned_post['fields'])
+        # Streams file objects through the socket in chunks, requests would build the whole multipart
+        # body in memory. S3 requires the policy fields before the file
+        encoder = MultipartEncoder(fields=[*presigned_post['fields'].items(), *files.items()])
+        response = requests.post(presigned_post['url'], data=encoder, headers={'Content-Type': encoder.content_type})
         return response
 
+    def upload_fileobj(self, fileobj: BinaryIO, object_name: str, is_public: bool = False):
+        """
+        Stream a file like object to S3 as a multipart upload, memory is bounded by the in flight parts
+        rather than the size of the file.
+
+        :param fileobj: Readable binary stream
+        :param object_name: The S3 key to upload to
+        :param is_public: Upload with a public-read acl
+        """
+        extra_args = {'ACL': 'public-read'} if is_public else None
+        self.client.upload_fileobj(
+            fileobj,
+            settings.AWS_STORAGE_BUCKET_NAME,
+            object_name,
+            ExtraArgs=extra_args,
+            Config=_STREAMING_UPLOAD_CONFIG,
+        )
+
     def create_multipart_upload(self, file_name: str) -> Dict[str, str]:  # fileName and uploadId to join parts
         response = self.client.create_multipart_upload(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=file_name)
         return response
 
     def generate_presigned_url_for_part(self, upload_id: str, file_name: str, part_number: int) -> str:
-        try:
-            params = {
+        return self.generate_presigned_urls_for_parts(upload_id, file_name, [part_number])[0]
+
+    def generate_presigned_urls_for_parts(
+        self, upload_id: str, file_name: str, part_numbers: Iterable[int]
+    ) -> List[str]:
+        """
+        The client's generate_presigned_url runs its full event and serializer chain per url which
+        dominates when signing hundreds of parts. The client signs the first part, which resolves the
+        object url for the configured endpoint, region and addressing style. The remaining parts are
+        signed directly with SigV4 against that url, with credentials resolved once.
+        """
+        part_numbers = list(part_numbers)
+        if not part_numbers:
+            return []
+
+        first_url = self.client.generate_presigned_url(
+            'upload_part',
+            Params={
                 'Bucket': settings.AWS_STORAGE_BUCKET_NAME,
                 'Key': file_name,
                 'UploadId': upload_id,
-                'PartNumber': part_number,
-            }
-            presigned_url = self.client.generate_presigned_url('upload_part', Params=params, ExpiresIn=3600)
-            return presigned_url
-        except ClientError as e:
-            logger.error(e)
-            return None
+                'PartNumber': part_numbers[0],
+            },
+            ExpiresIn=3600,
+        )
+        if len(part_numbers) == 1:
+            return [first_url]
+
+        if self.credentials is None:
+            raise NoCredentialsError()
+
+        auth = S3SigV4QueryAuth(
+            self.credentials.get_frozen_credentials(), 's3', self.client.meta.region_name, expires=3600
+        )
+        object_url = urlsplit(first_url)._replace(query='').geturl()
+        urls = [first_url]
+        for part_number in part_numbers[1:]:
+            request = AWSRequest(
+                method='PUT', url=object_url, params={'uploadId': upload_id, 'partNumber': part_number}
+            )
+            auth.add_auth(request)
+            urls.append(request.prepare().url)
+        return urls
 
     def complete_multipart_upload(self, file_name: str, upload_id: str, parts: List[Dict[str, int]]):
         try:
@@ -190,33 +270,84 @@ class S3Storage:
         except ClientError as e:
             logger.error(e)
 
-    def bulk_copy(self, new_s3_key_by_old_s3_key: Dict[str, str]):
-        for old_s3_key, new_s3_key in new_s3_key_by_old_s3_key.items():
-            copy_source = {'Bucket': settings.AWS_STORAGE_BUCKET_NAME, 'Key': old_s3_key}
-            destination_key = new_s3_key
-            try:
-                self.client.copy_object(
-                    CopySource=copy_source, Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=destination_key
-                )
-                logger.info(f'Copied {old_s3_key} to {new_s3_key}')
-            except Exception as e:
-                logger.error(f'Failed to copy {old_s3_key}: {e}')
+    def bulk_copy(self, new_s3_key_by_old_s3_key: Dict[str, str]) -> Dict[str, Exception]:
+        """
+        Copies each key concurrently, a failed copy doesn't stop the others.
 
-    def get_object(self, object_name: str) -> bytes:
+        :param new_s3_key_by_old_s3_key: Destination key for each source key
+        :return: The error for each source key that failed to copy
         """
-        Download an object from S3 and return its content as bytes.
+        errors_by_old_s3_key = {}
+        # Each copy_object is a blocking round trip, boto3 clients are safe to share across threads
+        with ThreadPoolExecutor(max_workers=BULK_COPY_MAX_WORKERS) as executor:
+            old_s3_key_by_future = {
+                executor.submit(self._copy_one, old_s3_key, new_s3_key): old_s3_key
+                for old_s3_key, new_s3_key in new_s3_key_by_old_s3_key.items()
+            }
+            for future in as_completed(old_s3_key_by_future):
+                old_s3_key = old_s3_key_by_future[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f'Failed to copy {old_s3_key}: {e}')
+                    errors_by_old_s3_key[old_s3_key] = e
+
+        return errors_by_old_s3_key
+
+    def _copy_one(self, old_s3_key: str, new_s3_key: str):
+        copy_source = {'Bucket': settings.AWS_STORAGE_BUCKET_NAME, 'Key': old_s3_key}
+        try:
+            self.client.copy_object(CopySource=copy_source, Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=new_s3_key)
+        except ClientError as e:
+            if not _is_copy_size_limit_error(e):
+                raise
+
+            # copy_object is capped at 5GB, the managed copy splits larger objects into parallel
+            # UploadPartCopy calls and aborts the multipart upload if any part fails
+            self.client.copy(copy_source, settings.AWS_STORAGE_BUCKET_NAME, new_s3_key, Config=_LARGE_COPY_CONFIG)
+
+        logger.info(f'Copied {old_s3_key} to {new_s3_key}')
+
+    def open_object(self, object_name: str, chunk_size: int = 1 << 20) -> Tuple[int, Iterator[bytes]]:
+        """
+        Start downloading an object from S3, returning its size along with the chunked body.
 
         :param object_name: The S3 key of the object to download
-        :return: The object content as bytes
+        :param chunk_size: Maximum bytes per yielded chunk. Default: 1MB
+        :return: Tuple of (content length, iterator of the object content)
         :raises: ClientError if the object doesn't exist or access is denied
         """
         try:
             response = self.client.get_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=object_name)
-            return response['Body'].read()
         except ClientError as e:
             logger.error(f'Failed to download object {object_name}: {e}')
             raise
 
+        return response['ContentLength'], response['Body'].iter_chunks(chunk_size)
+
+    def get_object(self, object_name: str) -> bytes:
+        """
+        Download an object from S3 and return its content as bytes.
+
+        :param object_name: The S3 key of the object to download
+        :return: The object content as bytes
+        :raises: ClientError if the object doesn't exist or access is denied
+        """
+        _, chunks = self.open_object(object_name)
+        return b''.join(chunks)
+
+    def iter_object(self, object_name: str, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+        """
+        Stream an object from S3 in chunks so large files are processed in constant memory.
+
+        :param object_name: The S3 key of the object to download
+        :param chunk_size: Maximum bytes per yielded chunk. Default: 1MB
+        :return: Iterator of the object content
+        :raises: ClientError if the object doesn't exist or access is denied
+        """
+        _, chunks = self.open_object(object_name, chunk_size)
+        yield from chunks
+
 
 class MockS3Storage:
     """
@@ -233,8 +364,8 @@ class MockS3Storage:
     def delete_by_prefix(self, prefix: str):
         pass
 
-    def bulk_copy(self, new_s3_key_by_old_s3_key: Dict[str, str]):
-        pass
+    def bulk_copy(self, new_s3_key_by_old_s3_key: Dict[str, str]) -> Dict[str, Exception]:
+        return {}
 
     def create_presigned_put(self, object_name, expiration=3600):
         return {
@@ -271,6 +402,9 @@ class MockS3Storage:
         response = SimpleNamespace(text='', status_code=204)
         return response
 
+    def upload_fileobj(self, fileobj: BinaryIO, object_name: str, is_public: bool = False):
+        pass
+
     def create_multipart_upload(self, file_name: str) -> Dict[str, str]:
         upload_id = str(uuid.uuid4())
         self.uploads[upload_id] = {'file_name': file_name, 'parts': {}}
@@ -281,6 +415,11 @@ class MockS3Storage:
             raise ValueError('Invalid upload ID')
         return f'offline-file-store/{file_name}/part-{part_number}'
 
+    def generate_presigned_urls_for_parts(
+        self, upload_id: str, file_name: str, part_numbers: Iterable[int]
+    ) -> List[str]:
+        return [self.generate_presigned_url_for_part(upload_id, file_name, part_number) for part_number in part_numbers]
+
     def complete_multipart_upload(self, file_name: str, upload_id: str, parts: List[Dict[str, int]]):
         if upload_id not in self.uploads:
             raise ValueError('Invalid upload ID')
@@ -291,19 +430,33 @@ class MockS3Storage:
     def list_uploads(self):
         return self.uploads
 
-    def get_object(self, object_name: str) -> bytes:
+    def open_object(self, object_name: str, chunk_size: int = 1 << 20) -> Tuple[int, Iterator[bytes]]:
         """
-        Mock implementation of get_object for testing.
+        Mock implementation of open_object for testing.
         Returns dummy content for any object.
 
         :param object_name: The S3 key of the object to download
-        :return: Mock object content as bytes
+        :return: Tuple of (content length, iterator of the mock object content)
         """
-        # Return some mock content for testing
-        return f'Mock content for {object_name}'.encode('utf-8')
+        content = f'Mock content for {object_name}'.encode('utf-8')
+        return len(content), iter([content])
+
+    def get_object(self, object_name: str) -> bytes:
+        _, chunks = self.open_object(object_name)
+        return b''.join(chunks)
 
+    def iter_object(self, object_name: str, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+        _, chunks = self.open_object(object_name, chunk_size)
+        yield from chunks
+
+
+@functools.cache
+def FileBackend() -> S3Storage | MockS3Storage:
+    """
+    Process wide storage client, building a boto3 client loads and parses botocore service models
+    """
+    if settings.USE_MOCK_FILE_CLIENT:
+        # Override with mock client
+        return MockS3Storage()
 
-FileBackend = S3Storage
-if settings.USE_MOCK_FILE_CLIENT:
-    # Override with mock client
-    FileBackend = MockS3Storage
+    return S3Storage()
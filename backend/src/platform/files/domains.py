@@ -2,15 +2,35 @@ import uuid
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import Field, computed_field
+from pydantic import ConfigDict, Field
 
 from src.common.domain import BaseDomain
 from src.common.nanoid import NanoIdType
 from src.platform.files.backend import FileBackend
 from src.settings import AWS_STORAGE_BUCKET_NAME
 
+# Content types for the file extensions that most modern browsers can render inline
+_MIME_TYPES = {
+    'jpg': 'image/jpeg;',
+    'jpeg': 'image/jpeg;',
+    'png': 'image/png;',
+    'gif': 'image/gif;',
+    'bmp': 'image/bmp;',
+    'webp': 'image/webp;',
+    'pdf': 'application/pdf;',
+    'html': 'text/html;',
+    'txt': 'text/plain;',
+    'svg': 'image/svg+xml;',
+}
+_RENDERABLE_TYPES = frozenset(_MIME_TYPES)
+_DEFAULT_MIME_TYPE = 'binary/octet-stream;'
+
+_PUBLIC_URL_PREFIX = f'https://{AWS_STORAGE_BUCKET_NAME}.s3.amazonaws.com/'
+
 
 class FileCreate(BaseDomain):
+    model_config = ConfigDict(frozen=True)
+
     id: Optional[uuid.UUID] = Field(default_factory=uuid.uuid4)
     file_name: Optional[str] = None
     s3_key: Optional[str] = None
@@ -42,47 +62,27 @@ class FileRead(FileCreate):
 
     @property
     def url(self) -> str:
+        return self.url_from(FileBackend())
+
+    def url_from(self, storage) -> str:
+        """
+        Url for the file signed with the given storage client, lets callers share one client in bulk
+        """
         if self.is_public:
-            return f'https://{AWS_STORAGE_BUCKET_NAME}.s3.amazonaws.com/{self.s3_key}'
+            return _PUBLIC_URL_PREFIX + self.s3_key
         else:
-            # @TODO This would really suck in bulk...
-            return FileBackend().generate_presigned_url(self.s3_key)
+            return storage.generate_presigned_url(self.s3_key)
 
 
 class FileWithUrl(FileRead):
-    @computed_field
-    @property
-    def get_url(self) -> str:
-        # List of file extensions that most modern browsers can render inline
-        renderable_types = ['jpg', 'jpeg', 'png', 'gif', 'bmp', 'webp', 'pdf', 'html', 'txt', 'svg']
-        file_name = self.file_name
-        file_type = file_name.rpartition('.')[-1]
-        if file_type in renderable_types:
-            mime_types = {
-                'jpg': 'image/jpeg;',
-                'jpeg': 'image/jpeg;',
-                'png': 'image/png;',
-                'gif': 'image/gif;',
-                'bmp': 'image/bmp;',
-                'webp': 'image/webp;',
-                'pdf': 'application/pdf;',
-                'html': 'text/html;',
-                'txt': 'text/plain;',
-                'svg': 'image/svg+xml;',
-            }
-            content_disposition = f'inline; filename="{file_name}"'
-            content_type = mime_types.get(file_type, 'binary/octet-stream;')
-        else:
-            # Download
-            content_disposition = f'attachment; filename="{file_name}"'
-            content_type = None
-
-        return FileBackend().generate_presigned_url(
-            self.s3_key, disposition=content_disposition, content_type=content_type
-        )
+    # Signed when constructed so bulk serialization doesn't sign per property access
+    get_url: str
 
     @classmethod
-    def from_file(cls, file_read: FileRead):
+    def from_file(cls, file_read: FileRead, storage=None):
+        """
+        Pass a shared storage client when building many of these
+        """
         return cls(
             id=file_read.id,
             file_name=file_read.file_name,
@@ -91,15 +91,36 @@ class FileWithUrl(FileRead):
             is_public=file_read.is_public,
             uploaded_by_id=file_read.uploaded_by_id,
             size=file_read.size,
+            get_url=cls.generate_get_url(file_read, storage or FileBackend()),
+        )
+
+    @staticmethod
+    def generate_get_url(file_read: FileRead, storage) -> str:
+        file_name = file_read.file_name
+        file_type = file_name.rpartition('.')[2].lower()
+        if file_type in _RENDERABLE_TYPES:
+            content_disposition = f'inline; filename="{file_name}"'
+            content_type = _MIME_TYPES.get(file_type, _DEFAULT_MIME_TYPE)
+        else:
+            # Download
+            content_disposition = f'attachment; filename="{file_name}"'
+            content_type = None
+
+        return storage.generate_presigned_url(
+            file_read.s3_key, disposition=content_disposition, content_type=content_type
         )
 
 
 class Part(BaseDomain):
+    model_config = ConfigDict(frozen=True)
+
     e_tag: str
     part_number: int
 
 
 class PresignedUrlsResponse(BaseDomain):
+    model_config = ConfigDict(frozen=True)
+
     urls: List[str]
 
 
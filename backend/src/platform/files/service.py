@@ -1,14 +1,20 @@
 import logging
+import os
+import threading
+import time
 import uuid
+from collections import OrderedDict
 from io import BytesIO
-from typing import List, Optional, Tuple
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
 
+import redis
 import requests
 
 from src.common.exceptions import InternalException
 from src.common.nanoid import NanoIdType, generate_custom_nanoid
 from src.common.utils import make_lazy
 from src.core.user import UserRead, UserService
+from src.network.cache.cache import BestEffortCache
 from src.platform.files.backend import FileBackend
 from src.platform.files.domains import FileCreate, FileRead, FileWithUrl, Part
 from src.platform.files.models import File
@@ -41,11 +47,92 @@ logger = logging.getLogger(__name__)
 class FileUploadFailed(InternalException): ...
 
 
+# Largest file accepted by upload and upload_from_url
+MAX_UPLOAD_SIZE = 1000 * 1024 * 1024  # 1GB
+
+
+class _SizeLimitedReader:
+    """
+    Counts the bytes read from a stream of unknown length and fails the read that goes past max_size,
+    the presigned post's content-length-range enforces the same limit for buffered uploads
+    """
+
+    def __init__(self, stream: BinaryIO, max_size: int):
+        self._stream = stream
+        self.max_size = max_size
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._stream.read(size)
+        self.bytes_read += len(chunk)
+        if self.bytes_read > self.max_size:
+            raise FileUploadFailed(f'File is larger than {self.max_size} bytes')
+        return chunk
+
+
+class _S3KeyCache:
+    """
+    Short lived per process map of file id to s3 key. A file's key never changes once created, the ttl
+    bounds how long a file deleted by another process can still resolve here
+    """
+
+    def __init__(self, ttl_seconds: int, maxsize: int):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: OrderedDict[uuid.UUID, Tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, file_id: uuid.UUID) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(file_id)
+            if entry is None:
+                return None
+            s3_key, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[file_id]
+                return None
+            return s3_key
+
+    def set(self, file_id: uuid.UUID, s3_key: str) -> None:
+        with self._lock:
+            self._entries[file_id] = (s3_key, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(file_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, file_ids: Iterable[uuid.UUID]) -> None:
+        with self._lock:
+            for file_id in file_ids:
+                self._entries.pop(file_id, None)
+
+    def discard_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for file_id in [file_id for file_id, (s3_key, _) in self._entries.items() if s3_key.startswith(prefix)]:
+                del self._entries[file_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_S3_KEY_CACHE = _S3KeyCache(ttl_seconds=60, maxsize=10_000)
+
+# One storage reference per process, resolved on first use so importing or instantiating never touches S3
+_STORAGE = make_lazy(FileBackend)
+
+
 class FileService:
+    # Cache settings
+    CACHE_KEY_PREFIX = 'files::signed-url'
+    SIGNED_URL_FORMAT = '{prefix}:{s3_key}:{ttl_seconds}:{disposition}:{content_type}'
+    SIGNED_URL_DEFAULT_TTL = 6 * 60 * 60  # 6 hours
+    # Cached urls expire this long before their signature does so callers never receive a stale one
+    SIGNED_URL_CACHE_MARGIN = 10 * 60  # 10 minutes
+
     def __init__(self, user_service=None):
-        # Avoid making a call to S3 on instantiation
-        self.storage = make_lazy(FileBackend)
+        self.storage = _STORAGE
         self.user_service = user_service
+        self.cache = BestEffortCache
 
     @classmethod
     def factory(cls) -> 'FileService':
@@ -54,22 +141,32 @@ class FileService:
     def get_for_id(self, file_id: uuid.UUID) -> FileRead:
         return File.get(id=file_id)
 
+    def _get_s3_key(self, file_id: uuid.UUID) -> str:
+        s3_key = _S3_KEY_CACHE.get(file_id)
+        if s3_key is None:
+            s3_key = File.get(id=file_id).s3_key
+            _S3_KEY_CACHE.set(file_id, s3_key)
+        return s3_key
+
     def get_with_url(self, file_id: uuid.UUID) -> FileWithUrl:
         file = File.get(id=file_id)
-        return FileWithUrl.from_file(file)
+        return FileWithUrl.from_file(file, storage=self.storage)
 
     def list_with_urls_for_ids(self, file_ids: list[uuid.UUID]) -> list[FileWithUrl]:
-        return [FileWithUrl.from_file(file) for file in File.list(File.id.in_(file_ids))]
+        # One storage client signs every url in the batch
+        return [FileWithUrl.from_file(file, storage=self.storage) for file in File.list(File.id.in_(file_ids))]
 
     def list_for_ids(self, file_ids: list[uuid.UUID]) -> list[FileRead]:
         return File.list(File.id.in_(file_ids))
 
     def delete(self, file_id: uuid.UUID):
         File.delete(File.id == file_id)
+        _S3_KEY_CACHE.discard([file_id])
         # @TODO should delete this from S3
 
     def bulk_delete(self, file_ids: list[uuid.UUID]):
         File.delete(File.id.in_(file_ids))
+        _S3_KEY_CACHE.discard(file_ids)
 
     def bulk_create_files(self, file_creates: list[FileCreate]) -> None:
         File.bulk_create(file_creates)
@@ -78,31 +175,39 @@ class FileService:
         File.create(file_create)
 
     def copy_files(self, files: List[FileRead | FileWithUser]) -> dict[uuid.UUID, uuid.UUID]:
-        copied_files = []
-        new_s3_key_by_old_s3_key = {}
-        new_file_id_by_old_file_id = {}
-        for file in files:
-            file_id = uuid.uuid4()
-            s3_key = self._make_s3_file_path(
-                file_id=file_id,
-                file_name=file.file_name,
-                uploaded_by_id=file.uploaded_by_id,
-            )
-            copied_file = FileCreate(
-                id=file_id,
-                file_name=file.file_name,
-                s3_key=s3_key,
-                uploaded_by_id=file.uploaded_by_id,
-                is_public=file.is_public,
-                size=file.size,
-                uploaded_at=file.uploaded_at,
+        # One urandom call for the whole batch instead of one per file
+        random_bytes = os.urandom(16 * len(files))
+        new_file_ids = [uuid.UUID(bytes=random_bytes[i : i + 16], version=4) for i in range(0, len(random_bytes), 16)]
+        # Every value comes from an already validated file, skip validating it again
+        copied_files = [
+            (
+                file,
+                FileCreate.model_construct(
+                    id=file_id,
+                    file_name=file.file_name,
+                    s3_key=self._make_s3_file_path(
+                        file_id=file_id,
+                        file_name=file.file_name,
+                        uploaded_by_id=file.uploaded_by_id,
+                    ),
+                    uploaded_by_id=file.uploaded_by_id,
+                    is_public=file.is_public,
+                    size=file.size,
+                    uploaded_at=file.uploaded_at,
+                ),
             )
-            copied_files.append(copied_file)
-            new_s3_key_by_old_s3_key[file.s3_key] = s3_key
-            new_file_id_by_old_file_id[file.id] = file_id
-        self.storage.bulk_copy(new_s3_key_by_old_s3_key)
-        File.bulk_create(copied_files)
-        return new_file_id_by_old_file_id
+            for file, file_id in zip(files, new_file_ids)
+        ]
+        errors_by_old_s3_key = self.storage.bulk_copy(
+            {file.s3_key: copied_file.s3_key for file, copied_file in copied_files}
+        )
+
+        # Only record the copies that made it to S3
+        copied_files = [
+            (file, copied_file) for file, copied_file in copied_files if file.s3_key not in errors_by_old_s3_key
+        ]
+        File.bulk_create([copied_file for _, copied_file in copied_files])
+        return {file.id: copied_file.id for file, copied_file in copied_files}
 
     def create_presigned_post(
         self,
@@ -188,11 +293,11 @@ class FileService:
             file_name=file_name,
             uploaded_by_id=uploaded_by_id,
             is_temporary=is_temporary,
-            max_size=1000 * 1024 * 1024,  # 1GB
+            max_size=MAX_UPLOAD_SIZE,
             is_public=is_public,
         )
-        files = {'file': (file_name, content.read())}
-
+        # Streamed from the buffer by the storage backend rather than copied into the request body
+        files = {'file': (file_name, content)}
         response = self.storage.upload_from_presigned_post(presigned_post, files)
 
         if response.status_code != 204:
@@ -217,8 +322,8 @@ class FileService:
         presigned_post = self.storage.create_presigned_post(
             object_name=s3_key,
         )
-        files = {'file': (file_name, content.read())}
-
+        # Streamed from the buffer by the storage backend rather than copied into the request body
+        files = {'file': (file_name, content)}
         response = self.storage.upload_from_presigned_post(presigned_post, files)
 
         if response.status_code != 204:
@@ -239,14 +344,53 @@ class FileService:
         :param file: The file
         :param ttl_seconds: The number of seconds the url is valid for. Default: 6 hours
         """
-        file = File.get(id=file_id)
+        s3_key = self._get_s3_key(file_id)
+        if ttl_seconds is None:
+            ttl_seconds = self.SIGNED_URL_DEFAULT_TTL
+
+        # Reuse a signed url while it has a safe margin of validity left, signing again changes the
+        # query string and defeats downstream http caches
+        cache_ttl = ttl_seconds - self.SIGNED_URL_CACHE_MARGIN
+        if cache_ttl <= 0:
+            return self._generate_presigned_url(s3_key, ttl_seconds, disposition, content_type)
+
+        key = self.SIGNED_URL_FORMAT.format(
+            prefix=self.CACHE_KEY_PREFIX,
+            s3_key=s3_key,
+            ttl_seconds=ttl_seconds,
+            disposition=disposition,
+            content_type=content_type,
+        )
+        url = self._get_from_cache(key)
+        if url is None:
+            url = self._generate_presigned_url(s3_key, ttl_seconds, disposition, content_type)
+            self._set_to_cache(key, url, cache_ttl)
+        return url
+
+    def _generate_presigned_url(
+        self, s3_key: str, ttl_seconds: int, disposition: str | None, content_type: str | None
+    ) -> str:
         return self.storage.generate_presigned_url(
-            file.s3_key,
+            s3_key,
             expires_in=ttl_seconds,
             disposition=disposition,
             content_type=content_type,
         )
 
+    def _get_from_cache(self, key: str) -> Optional[str]:
+        try:
+            return self.cache.get(key)
+        except redis.RedisError as e:
+            # The cache is an optimization, sign a fresh url when it is unavailable
+            logger.warning(f'Signed url cache read failed: {e}')
+            return None
+
+    def _set_to_cache(self, key: str, value: str, ttl_seconds: int) -> None:
+        try:
+            self.cache.setex(key, ttl_seconds, value)
+        except redis.RedisError as e:
+            logger.warning(f'Signed url cache write failed: {e}')
+
     def download(self, file_id: uuid.UUID) -> BytesIO:
         """
         Download a file from S3 and return its content as a BytesIO object.
@@ -256,9 +400,31 @@ class FileService:
         :raises: RepositoryObjectNotFound if file doesn't exist
         :raises: ClientError if S3 download fails
         """
-        file = File.get(id=file_id)
-        content = self.storage.get_object(file.s3_key)
-        return BytesIO(content)
+        content_length, chunks = self.storage.open_object(self._get_s3_key(file_id))
+        # Size the buffer once up front and fill it in place, rather than holding the whole body as bytes
+        # alongside its copy
+        buffer = BytesIO()
+        if content_length:
+            buffer.seek(content_length - 1)
+            buffer.write(b'\0')
+            buffer.seek(0)
+        for chunk in chunks:
+            buffer.write(chunk)
+        buffer.truncate()
+        buffer.seek(0)
+        return buffer
+
+    def iter_download(self, file_id: uuid.UUID, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+        """
+        Stream a file from S3 in chunks, for consumers that shouldn't hold the whole file in memory.
+
+        :param file_id: The UUID of the file to download
+        :param chunk_size: Maximum bytes per yielded chunk. Default: 1MB
+        :return: Iterator of the file content
+        :raises: RepositoryObjectNotFound if file doesn't exist
+        :raises: ClientError if S3 download fails
+        """
+        return self.storage.iter_object(self._get_s3_key(file_id), chunk_size=chunk_size)
 
     def upload_from_url(
         self,
@@ -268,19 +434,44 @@ class FileService:
         is_public: bool = False,
         is_temporary: bool = False,
     ) -> FileRead:
+        file_id = uuid.uuid4()
+        s3_key = self._make_s3_file_path(
+            file_id=file_id,
+            file_name=file_name,
+            is_temporary=is_temporary,
+            uploaded_by_id=uploaded_by_id,
+        )
+
+        # Piped straight from the response into a multipart upload rather than buffered in memory
         with requests.get(url, stream=True) as req_file:
-            file = self.upload(
-                content=BytesIO(req_file.content),
-                file_name=file_name,
-                uploaded_by_id=uploaded_by_id,
-                is_public=is_public,
-                is_temporary=is_temporary,
-            )
+            content_length = req_file.headers.get('Content-Length')
+            if content_length and content_length.isdigit() and int(content_length) > MAX_UPLOAD_SIZE:
+                raise FileUploadFailed(f'Failed to upload from url: file is larger than {MAX_UPLOAD_SIZE} bytes')
+
+            req_file.raw.decode_content = True
+            # Content-Length can be missing or describe the compressed body, so the limit is also enforced on read
+            content = _SizeLimitedReader(req_file.raw, MAX_UPLOAD_SIZE)
+            try:
+                self.storage.upload_fileobj(content, s3_key, is_public=is_public)
+            except Exception as e:
+                logger.error(e)
+                raise FileUploadFailed(f'Failed to upload from url: {e}')
 
-        return file
+        logger.info(f'uploaded file key: {s3_key}')
+        file_create = FileCreate(
+            id=file_id,
+            file_name=file_name,
+            s3_key=s3_key,
+            uploaded_by_id=uploaded_by_id,
+            is_public=is_public,
+            size=content.bytes_read,
+        )
+        file_model = File.create(file_create)
+        return self.get_for_id(file_model.id)
 
     def delete_by_prefix(self, prefix: str):
         File.delete(File.s3_key.startswith(prefix))
+        _S3_KEY_CACHE.discard_prefix(prefix)
         self.storage.delete_by_prefix(prefix=prefix)
 
     def get_with_details_for_id(self, file_id: uuid.UUID) -> FileWithUser:
@@ -292,8 +483,9 @@ class FileService:
 
     def list_with_details_for_id(self, file_ids: list[uuid.UUID]) -> list[FileWithUser]:
         file_reads = File.list(File.id.in_(file_ids))
-        uploaded_by_ids = [file_read.uploaded_by_id for file_read in file_reads]
-        users = self.user_service.list_users_for_ids(uploaded_by_ids)
+        # Files commonly share uploaders, query each once
+        uploaded_by_ids = list({file_read.uploaded_by_id for file_read in file_reads} - {None})
+        users = self.user_service.list_users_for_ids(uploaded_by_ids) if uploaded_by_ids else []
         user_by_id = {user.id: user for user in users}
         return [
             FileWithUser.factory(
@@ -308,11 +500,7 @@ class FileService:
         return response['UploadId'], response['Key']
 
     def generate_presigned_urls_for_parts(self, upload_id: str, file_name: str, num_parts: int) -> List[str]:
-        urls = []
-        for part_number in range(1, num_parts + 1):
-            presigned_url = self.storage.generate_presigned_url_for_part(upload_id, file_name, part_number)
-            urls.append(presigned_url)
-        return urls
+        return self.storage.generate_presigned_urls_for_parts(upload_id, file_name, range(1, num_parts + 1))
 
     def complete_multipart_upload(
         self,
@@ -323,7 +511,12 @@ class FileService:
         is_public: bool = False,
         size: int | None = None,
     ):
-        aws_parts = [{'ETag': part.e_tag, 'PartNumber': part.part_number} for part in parts]
+        # A retried part upload can be reported twice, S3 wants each part once in ascending order
+        e_tag_by_part_number = {part.part_number: part.e_tag for part in parts}
+        aws_parts = [
+            {'ETag': e_tag_by_part_number[part_number], 'PartNumber': part_number}
+            for part_number in sorted(e_tag_by_part_number)
+        ]
         response = self.storage.complete_multipart_upload(file_name, upload_id, aws_parts)
 
         s3_key = response['Key']
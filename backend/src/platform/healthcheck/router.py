@@ -1,12 +1,19 @@
+import json
+
 from fastapi import APIRouter, Response
 from sqlalchemy import text
 from starlette import status
 
 router = APIRouter()
 
+_HTML_MEDIA_TYPE = 'text/html; charset=utf-8'
+# Encoded once, byte for byte what returning the message as a str produced: a JSON string literal
+_STATUS_BODY = json.dumps('💸 Colonel Collateral is hungry... 💸', ensure_ascii=False).encode('utf-8')
+_TEST_QUERY = text('SELECT 1')
+
 
-@router.get('/api')
-def status_get(response: Response) -> str:
+@router.get('/api', response_class=Response)
+def status_get() -> Response:
     """
     Fast check to ensure API is running.
     🏴‍☠️ DO NOT CHANGE 🏴‍☠️
@@ -16,10 +23,7 @@ def status_get(response: Response) -> str:
         aws load balancer
         deploy scripts
     """
-    message = '💸 Colonel Collateral is hungry... 💸'
-    response.headers['Content-Type'] = 'text/html; charset=utf-8'
-
-    return message
+    return Response(content=_STATUS_BODY, media_type=_HTML_MEDIA_TYPE)
 
 
 @router.get('/database')
@@ -32,10 +36,9 @@ def database_health_check(response: Response) -> str:
 
     lines = []
     is_healthy = True
-    test_query = text('SELECT 1')
 
     try:
-        db.session.execute(test_query)
+        db.session.execute(_TEST_QUERY)
         lines.append('✅ Regular DB is happy')
     except Exception as e:
         lines.append(f'❌ Regular DB is sad: {str(e)}')
@@ -43,13 +46,13 @@ def database_health_check(response: Response) -> str:
 
     try:
         with ReadOnlySession() as session:
-            session.execute(test_query)
+            session.execute(_TEST_QUERY)
             lines.append('✅ Read-only DB is happy')
     except Exception as e:
         lines.append(f'❌ Read-only DB is sad: {str(e)}')
         is_healthy = False
 
-    response.headers['Content-Type'] = 'text/html; charset=utf-8'
+    response.headers['Content-Type'] = _HTML_MEDIA_TYPE
     response.status_code = status.HTTP_200_OK if is_healthy else status.HTTP_503_SERVICE_UNAVAILABLE
 
     return '<br>'.join(lines)
@@ -1,18 +1,33 @@
+import functools
 import io
 import logging
 import uuid
-
-from weasyprint import CSS, HTML
+from typing import TYPE_CHECKING
 
 from src.platform.files.service import FileService
 from src.platform.pdf.utils import render_template
 from src.settings import PDF_CSS_DIR
 
+if TYPE_CHECKING:
+    # weasyprint pulls in cairo, pango and fontTools, imported on first render rather than by every worker
+    from weasyprint import CSS
+
 # These are way too noisy
 logging.getLogger('fontTools').setLevel(logging.WARNING)
 logging.getLogger('weasyprint').setLevel(logging.WARNING)
 
 
+@functools.lru_cache(maxsize=32)
+def _load_stylesheet(css_path: str) -> 'CSS':
+    """
+    Parsed once per process, weasyprint would otherwise re-tokenize the stylesheet for every pdf
+    """
+    from weasyprint import CSS
+
+    with open(css_path, 'r', encoding='utf-8') as file:
+        return CSS(string=file.read())
+
+
 class PDFService:
     def __init__(self, css_dir: str, file_service: FileService):
         """
@@ -25,10 +40,12 @@ class PDFService:
     def factory(cls) -> 'PDFService':
         return cls(css_dir=PDF_CSS_DIR, file_service=FileService.factory())
 
-    def _convert_to_pdf(self, html_string: str, stylesheets: list[CSS], file_path: str | None = None) -> bytes:
+    def _convert_to_pdf(self, html_string: str, stylesheets: list['CSS'], file_path: str | None = None) -> bytes:
         """
         Pass in file_path to generate pdf locally
         """
+        from weasyprint import HTML
+
         if file_path:
             return HTML(string=html_string).write_pdf(file_path, stylesheets=stylesheets, presentational_hints=True)
         return HTML(string=html_string).write_pdf(stylesheets=stylesheets, presentational_hints=True)
@@ -48,9 +65,7 @@ class PDFService:
 
         stylesheets = []
         if css_name and self.css_dir:
-            with open(f'{self.css_dir}/{css_name}', 'r', encoding='utf-8') as file:
-                css_string = file.read()
-                stylesheets.append(CSS(string=css_string))
+            stylesheets.append(_load_stylesheet(f'{self.css_dir}/{css_name}'))
 
         pdf = self._convert_to_pdf(html_string=rendered_html, stylesheets=stylesheets, file_path=file_path)
         return io.BytesIO(pdf)
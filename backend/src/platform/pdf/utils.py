@@ -1,11 +1,7 @@
-from jinja2 import Environment, PackageLoader, select_autoescape
+from src.common.templates import get_template_environment
 
 
 def render_template(template_name: str, context: dict):
-    env = Environment(
-        loader=PackageLoader('src.platform.pdf', 'templates'),
-        autoescape=select_autoescape(['html', 'xml']),
-    )
-    template = env.get_template(template_name)
+    template = get_template_environment('src.platform.pdf').get_template(template_name)
 
     return template.render(**context)
@@ -1,3 +1,6 @@
+import asyncio
+import atexit
+import functools
 from abc import ABC, abstractmethod
 
 import httpx
@@ -5,6 +8,18 @@ from loguru import logger
 
 from src import settings
 
+MAX_CONCURRENT_WEBHOOK_POSTS = 10
+
+
+@functools.cache
+def _http_client() -> httpx.Client:
+    """
+    Process wide client so consecutive webhook posts reuse the kept alive TLS connection
+    """
+    client = httpx.Client(timeout=30, limits=httpx.Limits(max_keepalive_connections=10, max_connections=20))
+    atexit.register(client.close)
+    return client
+
 
 class BaseSlackClient(ABC):
     @abstractmethod
@@ -12,6 +27,11 @@ class BaseSlackClient(ABC):
         """Post a message to a Slack webhook."""
         pass
 
+    @abstractmethod
+    async def post_webhooks_async(self, webhook_urls: list[str], payload: dict) -> list[bool]:
+        """Post the same message to several Slack webhooks concurrently."""
+        pass
+
 
 class SlackClient(BaseSlackClient):
     """Production Slack client using webhooks."""
@@ -19,7 +39,7 @@ class SlackClient(BaseSlackClient):
     def post_webhook(self, webhook_url: str, payload: dict) -> bool:
         """Post a message to a Slack webhook."""
         try:
-            response = httpx.post(webhook_url, json=payload, timeout=30)
+            response = _http_client().post(webhook_url, json=payload)
             response.raise_for_status()
             logger.info('Slack webhook posted successfully')
             return True
@@ -27,6 +47,26 @@ class SlackClient(BaseSlackClient):
             logger.error(f'Slack webhook failed: {e}')
             return False
 
+    async def post_webhooks_async(self, webhook_urls: list[str], payload: dict) -> list[bool]:
+        """Post the same message to several Slack webhooks concurrently."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_WEBHOOK_POSTS)
+
+        async def post(client: httpx.AsyncClient, webhook_url: str) -> bool:
+            async with semaphore:
+                try:
+                    response = await client.post(webhook_url, json=payload)
+                    response.raise_for_status()
+                    return True
+                except httpx.HTTPError as e:
+                    logger.error(f'Slack webhook failed: {e}')
+                    return False
+
+        async with httpx.AsyncClient(timeout=30) as client:
+            results = await asyncio.gather(*(post(client, webhook_url) for webhook_url in webhook_urls))
+
+        logger.info(f'Slack webhooks posted: {sum(results)}/{len(results)}')
+        return list(results)
+
 
 class MockSlackClient(BaseSlackClient):
     """Mock Slack client for testing."""
@@ -40,6 +80,10 @@ class MockSlackClient(BaseSlackClient):
         logger.info(f'Mock Slack webhook: {payload}')
         return True
 
+    async def post_webhooks_async(self, webhook_urls: list[str], payload: dict) -> list[bool]:
+        """Store messages for testing."""
+        return [self.post_webhook(webhook_url, payload) for webhook_url in webhook_urls]
+
 
 def get_slack_client() -> BaseSlackClient:
     """Get the appropriate Slack client based on settings."""
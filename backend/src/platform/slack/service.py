@@ -4,15 +4,32 @@ from src import settings
 from src.app.leaderboard.domains import Leaderboard, LeaderboardEntry
 from src.platform.slack.client import get_slack_client
 
+# Blocks that are the same in every message, shared rather than rebuilt. Only ever serialized, never mutated
+_HEADER_BLOCK = {
+    'type': 'header',
+    'text': {'type': 'plain_text', 'text': '🔥 burn-notice', 'emoji': True},
+}
+_DIVIDER_BLOCK = {'type': 'divider'}
+_LEGEND_BLOCK = {
+    'type': 'context',
+    'elements': [
+        {
+            'type': 'mrkdwn',
+            'text': '▲ = moved up · ▼ = moved down · ━ = no change · 🆕 = new',
+        }
+    ],
+}
+
 
 class SlackService:
     @staticmethod
     def format_tokens(n: int) -> str:
-        """Format token count for display."""
+        """Format token count for display, rounding half up in integer arithmetic."""
         if n >= 1_000_000:
-            return f'{n / 1_000_000:.1f}M'
+            tenths = (n + 50_000) // 100_000
+            return f'{tenths // 10}.{tenths % 10}M'
         if n >= 1_000:
-            return f'{n / 1_000:.0f}K'
+            return f'{(n + 500) // 1_000}K'
         return str(n)
 
     @staticmethod
@@ -33,13 +50,12 @@ class SlackService:
         if not entries:
             return f'*{title}*\n_No data yet_'
 
-        lines = [f'*{title}*', '```']
-        for entry in entries[:limit]:
-            change = SlackService.rank_change_icon(entry)
-            tokens = SlackService.format_tokens(entry.tokens)
-            lines.append(f'{entry.rank:>2}. {entry.display_name:<16} {tokens:>8}  {change}')
-        lines.append('```')
-        return '\n'.join(lines)
+        rows = '\n'.join(
+            f'{entry.rank:>2}. {entry.display_name:<16} {SlackService.format_tokens(entry.tokens):>8}  '
+            f'{SlackService.rank_change_icon(entry)}'
+            for entry in entries[:limit]
+        )
+        return f'*{title}*\n```\n{rows}\n```'
 
     @staticmethod
     def build_slack_message(leaderboard: Leaderboard) -> dict:
@@ -47,15 +63,12 @@ class SlackService:
         date_str = leaderboard.date.strftime('%A, %b %d, %Y')
 
         blocks = [
-            {
-                'type': 'header',
-                'text': {'type': 'plain_text', 'text': '🔥 burn-notice', 'emoji': True},
-            },
+            _HEADER_BLOCK,
             {
                 'type': 'context',
                 'elements': [{'type': 'mrkdwn', 'text': date_str}],
             },
-            {'type': 'divider'},
+            _DIVIDER_BLOCK,
             {
                 'type': 'section',
                 'text': {
@@ -77,16 +90,8 @@ class SlackService:
                     'text': SlackService.format_leaderboard_section('📊 Monthly', leaderboard.monthly),
                 },
             },
-            {'type': 'divider'},
-            {
-                'type': 'context',
-                'elements': [
-                    {
-                        'type': 'mrkdwn',
-                        'text': '▲ = moved up · ▼ = moved down · ━ = no change · 🆕 = new',
-                    }
-                ],
-            },
+            _DIVIDER_BLOCK,
+            _LEGEND_BLOCK,
         ]
 
         return {'blocks': blocks}
@@ -104,3 +109,16 @@ class SlackService:
 
         logger.info(f'Posting leaderboard for {leaderboard.date}')
         return client.post_webhook(webhook_url, message)
+
+    @staticmethod
+    async def post_leaderboard_async(leaderboard: Leaderboard, webhook_urls: list[str]) -> list[bool]:
+        """Post leaderboard to several Slack webhooks concurrently."""
+        if not webhook_urls:
+            logger.warning('No Slack webhook URLs given, skipping post')
+            return []
+
+        message = SlackService.build_slack_message(leaderboard)
+        client = get_slack_client()
+
+        logger.info(f'Posting leaderboard for {leaderboard.date} to {len(webhook_urls)} webhooks')
+        return await client.post_webhooks_async(webhook_urls, message)
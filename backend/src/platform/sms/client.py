@@ -1,19 +1,282 @@
 import abc
 import datetime
+import functools
+import html
 import os
+import re
 import smtplib
+import string
+import threading
+import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from email.message import EmailMessage
+from typing import Dict, Iterable, List, Tuple
 
 import boto3
 import sentry_sdk
-from botocore.exceptions import BotoCoreError, ClientError
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotoConnectionError
 from loguru import logger
+from pydantic import field_validator
 
 from src import settings
 from src.common.domain import BaseDomain
 from src.common.nanoid import generate_custom_nanoid
-from src.platform.sms.exceptions import SMSFailedToSend
+from src.platform.sms.exceptions import SMSFailedToSend, SMSProviderUnavailable
+
+MAX_MESSAGES_PER_SMTP_CONNECTION = 100
+# Fail fast on a dead endpoint so the resilient client can move on, and back off client side when throttled
+_SNS_CONFIG = Config(
+    retries={'max_attempts': 4, 'mode': 'adaptive'},
+    connect_timeout=2,
+    read_timeout=5,
+    tcp_keepalive=True,
+)
+
+
+class _SMTPConnections(threading.local):
+    """
+    Keeps one SMTP connection open per thread and server, so previews skip the connect and EHLO after the first.
+    Connections are rotated every MAX_MESSAGES_PER_SMTP_CONNECTION messages.
+    """
+
+    def __init__(self):
+        self._connections: Dict[Tuple[str, int], Tuple[smtplib.SMTP, int]] = {}
+
+    def send_message(self, host: str, port: int, msg: EmailMessage) -> None:
+        try:
+            self._send_message((host, port), msg)
+        except (smtplib.SMTPServerDisconnected, ConnectionError):
+            # The server dropped the idle connection, retry once on a fresh one
+            self._discard((host, port))
+            self._send_message((host, port), msg)
+
+    def _send_message(self, address: Tuple[str, int], msg: EmailMessage) -> None:
+        server, sent = self._connections.get(address, (None, 0))
+        if server is None or sent >= MAX_MESSAGES_PER_SMTP_CONNECTION:
+            self._discard(address)
+            server, sent = smtplib.SMTP(*address, timeout=10), 0
+        self._connections[address] = (server, sent + 1)
+        server.send_message(msg)
+
+    def _discard(self, address: Tuple[str, int]) -> None:
+        server, _ = self._connections.pop(address, (None, 0))
+        if server is None:
+            return
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+
+_SMTP_CONNECTIONS = _SMTPConnections()
+
+
+_SNS_THROTTLING_ERROR_CODES = frozenset({'Throttling', 'ThrottledException'})
+
+_E164_PHONE_NUMBER = re.compile(r'\+[1-9]\d{6,14}\Z')
+
+# Preview files are written and opened in the background, the worker threads are joined at exit so none are lost
+_PREVIEW_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='sms-preview')
+
+
+@functools.lru_cache(maxsize=4096)
+def _mask_phone(phone_number: str) -> str:
+    """Mask phone number for privacy: +1****567890"""
+    if len(phone_number) > 8:
+        return f'{phone_number[:2]}****{phone_number[-6:]}'
+    return phone_number
+
+
+@functools.lru_cache(maxsize=1)
+def _preview_timestamp(epoch_seconds: int) -> str:
+    """Sends within the same second share one formatted timestamp"""
+    return datetime.datetime.fromtimestamp(epoch_seconds).strftime('%B %d, %Y at %I:%M %p')
+
+
+@functools.lru_cache(maxsize=64)
+def _message_attributes(sender_id: str | None) -> dict:
+    """
+    Publish attributes only vary by sender, botocore doesn't mutate request params so the dicts can be shared
+    """
+    message_attributes = {
+        'AWS.SNS.SMS.SMSType': {
+            'DataType': 'String',
+            'StringValue': 'Transactional',  # Optimized for delivery over cost
+        }
+    }
+
+    # Add sender ID if provided (not supported in all regions/countries)
+    if sender_id:
+        message_attributes['AWS.SNS.SMS.SenderID'] = {'DataType': 'String', 'StringValue': sender_id}
+    return message_attributes
+
+
+def _is_provider_failure(exc: BotoCoreError | ClientError) -> bool:
+    """Connection errors, 5xx responses and throttling, as opposed to SNS rejecting this particular number"""
+    if isinstance(exc, (HTTPClientError, BotoConnectionError)):
+        return True
+    if isinstance(exc, ClientError):
+        error = exc.response.get('Error', {})
+        status_code = exc.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0)
+        return status_code >= 500 or error.get('Code') in _SNS_THROTTLING_ERROR_CODES
+    return False
+
+
+@functools.lru_cache(maxsize=1)
+def _sns_client(region_name: str, aws_access_key_id: str, aws_secret_access_key: str):
+    """
+    Shared by every AWSSNSSMSClient, so MFA codes reuse one warm connection to SNS instead of a new TLS handshake each
+    """
+    return boto3.client(
+        'sns',
+        region_name=region_name,
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        config=_SNS_CONFIG,
+    )
+
+
+# Parsed once at import, every preview is a single substitution
+_PREVIEW_TEMPLATE = string.Template(
+    """\
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>SMS to $masked_phone</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+            background: linear-gradient(135deg, #f5f5f5 0%, #e8e8e8 100%);
+            min-height: 100vh;
+            margin: 0;
+            padding: 0;
+        }
+        .dev-banner {
+            background: #000;
+            color: #fff;
+            padding: 15px 20px;
+            text-align: left;
+            font-size: 13px;
+            line-height: 1.6;
+            border-bottom: 3px solid #4CAF50;
+        }
+        .dev-banner strong {
+            color: #4CAF50;
+            font-weight: 600;
+        }
+        .container {
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            min-height: calc(100vh - 80px);
+            padding: 20px;
+        }
+        .phone-container {
+            background: #000;
+            border-radius: 40px;
+            padding: 15px;
+            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
+            max-width: 375px;
+            width: 100%;
+        }
+        .phone-screen {
+            background: #fff;
+            border-radius: 30px;
+            overflow: hidden;
+            box-shadow: inset 0 0 10px rgba(0,0,0,0.1);
+        }
+        .status-bar {
+            background: #f6f6f6;
+            padding: 8px 20px;
+            display: flex;
+            justify-content: space-between;
+            font-size: 12px;
+            color: #000;
+            border-bottom: 1px solid #e0e0e0;
+        }
+        .message-header {
+            background: #f6f6f6;
+            padding: 15px 20px;
+            border-bottom: 1px solid #e0e0e0;
+        }
+        .contact-name {
+            font-weight: 600;
+            font-size: 16px;
+            color: #000;
+        }
+        .contact-number {
+            font-size: 13px;
+            color: #8e8e93;
+            margin-top: 2px;
+        }
+        .messages {
+            background: #fff;
+            padding: 20px;
+            min-height: 300px;
+        }
+        .message-bubble {
+            background: #e5e5ea;
+            border-radius: 18px;
+            padding: 10px 15px;
+            max-width: 80%;
+            word-wrap: break-word;
+            margin-bottom: 10px;
+            animation: slideIn 0.3s ease-out;
+        }
+        .timestamp {
+            font-size: 11px;
+            color: #8e8e93;
+            text-align: center;
+            margin: 15px 0;
+        }
+        @keyframes slideIn {
+            from {
+                opacity: 0;
+                transform: translateY(10px);
+            }
+            to {
+                opacity: 1;
+                transform: translateY(0);
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="dev-banner">
+        <strong>$banner_label</strong><br>
+        To: $phone_number<br>
+        From: $sender<br>
+        Message Length: $message_length characters
+    </div>
+    <div class="container">
+        <div class="phone-container">
+            <div class="phone-screen">
+                <div class="status-bar">
+                    <span>9:41</span>
+                    <span>📶 🔋</span>
+                </div>
+                <div class="message-header">
+                    <div class="contact-name">$sender</div>
+                    <div class="contact-number">To: $masked_phone</div>
+                </div>
+                <div class="messages">
+                    <div class="timestamp">$timestamp</div>
+                    <div class="message-bubble">
+                        $message
+                    </div>
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>
+"""
+)
 
 
 class SMSMessage(BaseDomain):
@@ -26,6 +289,28 @@ class SMSMessage(BaseDomain):
     message: str
     sender_id: str | None = None  # Optional sender ID (e.g., "Burn Notice")
 
+    @field_validator('phone_number')
+    def validate_e164(cls, value):
+        # Reject malformed numbers before they cost a provider round trip
+        if not _E164_PHONE_NUMBER.match(value):
+            raise ValueError('Phone number must be in E.164 format: +1234567890')
+
+        return value
+
+
+def _render_sms_preview(sms: SMSMessage, banner_label: str) -> str:
+    """Render the phone-styled HTML preview shared by the Mailpit and file clients"""
+    # Everything user supplied is escaped exactly once, the template repeats some of these values
+    return _PREVIEW_TEMPLATE.substitute(
+        banner_label=banner_label,
+        masked_phone=html.escape(_mask_phone(sms.phone_number)),
+        phone_number=html.escape(sms.phone_number),
+        sender=html.escape(sms.sender_id or 'Burn Notice'),
+        message_length=len(sms.message),
+        timestamp=_preview_timestamp(int(time.time())),
+        message=html.escape(sms.message),
+    )
+
 
 class AbstractSMSClient(abc.ABC):
     def __init__(self, *args, **kwargs): ...
@@ -33,6 +318,23 @@ class AbstractSMSClient(abc.ABC):
     @abc.abstractmethod
     def send(self, sms: SMSMessage): ...
 
+    def send_many(self, smses: Iterable[SMSMessage]):
+        """
+        Send every message, attempting all of them before reporting failures.
+
+        Raises:
+            SMSFailedToSend: Naming each phone number that could not be reached
+        """
+        failed_phone_numbers = []
+        for sms in smses:
+            try:
+                self.send(sms)
+            except SMSFailedToSend:
+                failed_phone_numbers.append(sms.phone_number)
+
+        if failed_phone_numbers:
+            raise SMSFailedToSend(message=f'Failed to send SMS to: {", ".join(failed_phone_numbers)}')
+
 
 class MockSMSClient(AbstractSMSClient):
     """
@@ -45,7 +347,7 @@ class MockSMSClient(AbstractSMSClient):
         super().__init__(*args, **kwargs)
 
     def send(self, sms: SMSMessage):
-        logger.info(f'[MOCK SMS] To: {sms.phone_number} | Message: {sms.message}')
+        logger.info('[MOCK SMS] To: {} | Message: {}', sms.phone_number, sms.message)
         self.sms_catcher.append(sms)
 
     def get_sms_catcher(self) -> list:
@@ -72,11 +374,8 @@ class AWSSNSSMSClient(AbstractSMSClient):
                 'AWS_SNS_ACCESS_KEY_ID and AWS_SNS_SECRET_ACCESS_KEY must be configured for SMS functionality'
             )
 
-        self.client = boto3.client(
-            'sns',
-            region_name=settings.AWS_REGION_NAME,
-            aws_access_key_id=settings.AWS_SNS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SNS_SECRET_ACCESS_KEY,
+        self.client = _sns_client(
+            settings.AWS_REGION_NAME, settings.AWS_SNS_ACCESS_KEY_ID, settings.AWS_SNS_SECRET_ACCESS_KEY
         )
         super().__init__(*args, **kwargs)
 
@@ -90,30 +389,20 @@ class AWSSNSSMSClient(AbstractSMSClient):
         Raises:
             SMSFailedToSend: If SMS fails to send
         """
-        logger.info(f'Sending SMS to {sms.phone_number}')
+        logger.info('Sending SMS to {}', sms.phone_number)
 
         try:
-            # Prepare message attributes
-            message_attributes = {
-                'AWS.SNS.SMS.SMSType': {
-                    'DataType': 'String',
-                    'StringValue': 'Transactional',  # Optimized for delivery over cost
-                }
-            }
-
-            # Add sender ID if provided (not supported in all regions/countries)
-            if sms.sender_id:
-                message_attributes['AWS.SNS.SMS.SenderID'] = {'DataType': 'String', 'StringValue': sms.sender_id}
-
             response = self.client.publish(
-                PhoneNumber=sms.phone_number, Message=sms.message, MessageAttributes=message_attributes
+                PhoneNumber=sms.phone_number, Message=sms.message, MessageAttributes=_message_attributes(sms.sender_id)
             )
 
-            logger.info(f'SMS sent successfully. MessageId: {response.get("MessageId")}')
+            logger.info('SMS sent successfully. MessageId: {}', response.get('MessageId'))
             return response
 
         except (BotoCoreError, ClientError) as exc:
-            logger.exception(f'Failed to send SMS to {sms.phone_number}')
+            logger.exception('Failed to send SMS to {}', sms.phone_number)
+            if _is_provider_failure(exc):
+                raise SMSProviderUnavailable(message=f'AWS SNS unavailable: {sms.phone_number}') from exc
             raise SMSFailedToSend(message=f'AWS SNS failed: {sms.phone_number}') from exc
 
 
@@ -142,155 +431,12 @@ class SMSMailpitClient(AbstractSMSClient):
         msg.add_alternative(html_content, subtype='html')
 
         # Send to Mailpit
-        with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-            server.send_message(msg)
-            logger.info(f'[MAILPIT SMS] Sent SMS preview to Mailpit: {sms.phone_number}')
+        _SMTP_CONNECTIONS.send_message(self.smtp_host, self.smtp_port, msg)
+        logger.info('[MAILPIT SMS] Sent SMS preview to Mailpit: {}', sms.phone_number)
 
     def _generate_sms_html(self, sms: SMSMessage) -> str:
         """Generate the phone-styled HTML preview"""
-        masked_phone = self._mask_phone(sms.phone_number)
-
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>SMS to {masked_phone}</title>
-            <style>
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-                    background: linear-gradient(135deg, #f5f5f5 0%, #e8e8e8 100%);
-                    min-height: 100vh;
-                    margin: 0;
-                    padding: 0;
-                }}
-                .dev-banner {{
-                    background: #000;
-                    color: #fff;
-                    padding: 15px 20px;
-                    text-align: left;
-                    font-size: 13px;
-                    line-height: 1.6;
-                    border-bottom: 3px solid #4CAF50;
-                }}
-                .dev-banner strong {{
-                    color: #4CAF50;
-                    font-weight: 600;
-                }}
-                .container {{
-                    display: flex;
-                    justify-content: center;
-                    align-items: center;
-                    min-height: calc(100vh - 80px);
-                    padding: 20px;
-                }}
-                .phone-container {{
-                    background: #000;
-                    border-radius: 40px;
-                    padding: 15px;
-                    box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-                    max-width: 375px;
-                    width: 100%;
-                }}
-                .phone-screen {{
-                    background: #fff;
-                    border-radius: 30px;
-                    overflow: hidden;
-                    box-shadow: inset 0 0 10px rgba(0,0,0,0.1);
-                }}
-                .status-bar {{
-                    background: #f6f6f6;
-                    padding: 8px 20px;
-                    display: flex;
-                    justify-content: space-between;
-                    font-size: 12px;
-                    color: #000;
-                    border-bottom: 1px solid #e0e0e0;
-                }}
-                .message-header {{
-                    background: #f6f6f6;
-                    padding: 15px 20px;
-                    border-bottom: 1px solid #e0e0e0;
-                }}
-                .contact-name {{
-                    font-weight: 600;
-                    font-size: 16px;
-                    color: #000;
-                }}
-                .contact-number {{
-                    font-size: 13px;
-                    color: #8e8e93;
-                    margin-top: 2px;
-                }}
-                .messages {{
-                    background: #fff;
-                    padding: 20px;
-                    min-height: 300px;
-                }}
-                .message-bubble {{
-                    background: #e5e5ea;
-                    border-radius: 18px;
-                    padding: 10px 15px;
-                    max-width: 80%;
-                    word-wrap: break-word;
-                    margin-bottom: 10px;
-                    animation: slideIn 0.3s ease-out;
-                }}
-                .timestamp {{
-                    font-size: 11px;
-                    color: #8e8e93;
-                    text-align: center;
-                    margin: 15px 0;
-                }}
-                @keyframes slideIn {{
-                    from {{
-                        opacity: 0;
-                        transform: translateY(10px);
-                    }}
-                    to {{
-                        opacity: 1;
-                        transform: translateY(0);
-                    }}
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="dev-banner">
-                <strong>Staging SMS Preview</strong><br>
-                To: {sms.phone_number}<br>
-                From: {sms.sender_id or 'Burn Notice'}<br>
-                Message Length: {len(sms.message)} characters
-            </div>
-            <div class="container">
-                <div class="phone-container">
-                    <div class="phone-screen">
-                        <div class="status-bar">
-                            <span>9:41</span>
-                            <span>📶 🔋</span>
-                        </div>
-                        <div class="message-header">
-                            <div class="contact-name">{sms.sender_id or 'Burn Notice'}</div>
-                            <div class="contact-number">To: {masked_phone}</div>
-                        </div>
-                        <div class="messages">
-                            <div class="timestamp">{datetime.datetime.now().strftime('%B %d, %Y at %I:%M %p')}</div>
-                            <div class="message-bubble">
-                                {sms.message}
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-
-    def _mask_phone(self, phone_number: str) -> str:
-        """Mask phone number for privacy: +1****567890"""
-        if len(phone_number) > 8:
-            return f'{phone_number[:2]}****{phone_number[-6:]}'
-        return phone_number
+        return _render_sms_preview(sms, banner_label='Staging SMS Preview')
 
 
 class SMSFileClient(AbstractSMSClient):
@@ -307,173 +453,42 @@ class SMSFileClient(AbstractSMSClient):
         # Make sure that sms file_path is writable.
         if not os.access(self.file_path, os.W_OK):
             raise ValueError(f"Can't write to directory: {self.file_path}")
+        self._path_prefix = self.file_path + os.sep
 
     def send(self, sms: SMSMessage):
-        file_path = self.write_sms(sms)
-        webbrowser.open(f'file:///{file_path}')
+        file_path = self._get_full_filename(sms)
+        html_content = self._generate_sms_html(sms)
+        # Writing the preview and launching a browser can take hundreds of milliseconds,
+        # don't hold up whatever sent the SMS
+        _PREVIEW_EXECUTOR.submit(self._write_and_open, file_path, html_content)
 
     def write_sms(self, sms: SMSMessage) -> str:
         """Create a phone-styled HTML preview of the SMS message."""
-        # Mask phone number for privacy
-        masked_phone = self._mask_phone(sms.phone_number)
-
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>SMS to {masked_phone}</title>
-            <style>
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-                    background: linear-gradient(135deg, #f5f5f5 0%, #e8e8e8 100%);
-                    min-height: 100vh;
-                    margin: 0;
-                    padding: 0;
-                }}
-                .dev-banner {{
-                    background: #000;
-                    color: #fff;
-                    padding: 15px 20px;
-                    text-align: left;
-                    font-size: 13px;
-                    line-height: 1.6;
-                    border-bottom: 3px solid #4CAF50;
-                }}
-                .dev-banner strong {{
-                    color: #4CAF50;
-                    font-weight: 600;
-                }}
-                .container {{
-                    display: flex;
-                    justify-content: center;
-                    align-items: center;
-                    min-height: calc(100vh - 45px);
-                    padding: 20px;
-                }}
-                .phone-container {{
-                    background: #000;
-                    border-radius: 40px;
-                    padding: 15px;
-                    box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-                    max-width: 375px;
-                    width: 100%;
-                }}
-                .phone-screen {{
-                    background: #fff;
-                    border-radius: 30px;
-                    overflow: hidden;
-                    box-shadow: inset 0 0 10px rgba(0,0,0,0.1);
-                }}
-                .status-bar {{
-                    background: #f6f6f6;
-                    padding: 8px 20px;
-                    display: flex;
-                    justify-content: space-between;
-                    font-size: 12px;
-                    color: #000;
-                    border-bottom: 1px solid #e0e0e0;
-                }}
-                .message-header {{
-                    background: #f6f6f6;
-                    padding: 15px 20px;
-                    border-bottom: 1px solid #e0e0e0;
-                }}
-                .contact-name {{
-                    font-weight: 600;
-                    font-size: 16px;
-                    color: #000;
-                }}
-                .contact-number {{
-                    font-size: 13px;
-                    color: #8e8e93;
-                    margin-top: 2px;
-                }}
-                .messages {{
-                    background: #fff;
-                    padding: 20px;
-                    min-height: 300px;
-                }}
-                .message-bubble {{
-                    background: #e5e5ea;
-                    border-radius: 18px;
-                    padding: 10px 15px;
-                    max-width: 80%;
-                    word-wrap: break-word;
-                    margin-bottom: 10px;
-                    animation: slideIn 0.3s ease-out;
-                }}
-                .timestamp {{
-                    font-size: 11px;
-                    color: #8e8e93;
-                    text-align: center;
-                    margin: 15px 0;
-                }}
-                @keyframes slideIn {{
-                    from {{
-                        opacity: 0;
-                        transform: translateY(10px);
-                    }}
-                    to {{
-                        opacity: 1;
-                        transform: translateY(0);
-                    }}
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="dev-banner">
-                <strong>Development Mode</strong><br>
-                To: {sms.phone_number}<br>
-                From: {sms.sender_id or 'Burn Notice'}<br>
-                Message Length: {len(sms.message)} characters
-            </div>
-            <div class="container">
-                <div class="phone-container">
-                    <div class="phone-screen">
-                        <div class="status-bar">
-                            <span>9:41</span>
-                            <span>📶 🔋</span>
-                        </div>
-                        <div class="message-header">
-                            <div class="contact-name">{sms.sender_id or 'Burn Notice'}</div>
-                            <div class="contact-number">To: {masked_phone}</div>
-                        </div>
-                        <div class="messages">
-                            <div class="timestamp">{datetime.datetime.now().strftime('%B %d, %Y at %I:%M %p')}</div>
-                            <div class="message-bubble">
-                                {sms.message}
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-
         file_with_path = self._get_full_filename(sms)
-        with open(file_with_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-
-        logger.info(f'[FILE SMS] Saved to: {file_with_path}')
+        self._write(file_with_path, self._generate_sms_html(sms))
         return file_with_path
 
-    def _mask_phone(self, phone_number: str) -> str:
-        """Mask phone number for privacy: +1****567890"""
-        if len(phone_number) > 8:
-            return f'{phone_number[:2]}****{phone_number[-6:]}'
-        return phone_number
+    def _generate_sms_html(self, sms: SMSMessage) -> str:
+        return _render_sms_preview(sms, banner_label='Development Mode')
+
+    def _write_and_open(self, file_with_path: str, html_content: str):
+        try:
+            self._write(file_with_path, html_content)
+        except OSError:
+            logger.exception('[FILE SMS] Failed to save {}', file_with_path)
+            return
+        webbrowser.open(f'file:///{file_with_path}')
+
+    def _write(self, file_with_path: str, html_content: str):
+        with open(file_with_path, 'wb') as f:
+            f.write(html_content.encode('utf-8'))
+        logger.info('[FILE SMS] Saved to: {}', file_with_path)
 
     def _get_full_filename(self, sms: SMSMessage) -> str:
         """Return a unique file name."""
-        timestamp = datetime.datetime.now().strftime('%Y%m%d-%H%M%S')
+        timestamp = time.strftime('%Y%m%d-%H%M%S')
         random = generate_custom_nanoid(size=4)
-        masked_phone = self._mask_phone(sms.phone_number)
-        file_name = f'{timestamp}-{random}-sms-{masked_phone}.html'
-        file_with_path = os.path.join(self.file_path, file_name)
-        return file_with_path
+        return f'{self._path_prefix}{timestamp}-{random}-sms-{_mask_phone(sms.phone_number)}.html'
 
 
 class ResilientLiveSMSClient(AbstractSMSClient):
@@ -491,23 +506,67 @@ class ResilientLiveSMSClient(AbstractSMSClient):
         # Future: TwilioSMSClient,
     ]
 
+    # A provider that keeps being unavailable is skipped until the cooldown passes, then given one trial send
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS = 30
+
+    _breaker_lock = threading.Lock()
+    # Client class -> (consecutive provider failures, monotonic time of the latest failure)
+    _failures_by_client_class: Dict[type, Tuple[int, float]] = {}
+
+    @classmethod
+    @functools.cache
+    def _clients(cls) -> List[AbstractSMSClient]:
+        """
+        Built once per process rather than per message
+        """
+        return [sms_client_class() for sms_client_class in cls.CLIENT_PRIORITY_ORDER]
+
     def send(self, sms: SMSMessage):
         message_sent = False
 
-        for sms_client_class in self.CLIENT_PRIORITY_ORDER:
-            client = sms_client_class()
+        for client in self._clients():
+            client_name = type(client).__name__
+            if self._is_circuit_open(type(client)):
+                logger.warning('Skipping {}, too many recent failures', client_name)
+                continue
             try:
                 client.send(sms)
+            except SMSProviderUnavailable:
+                logger.warning('{} is unavailable', client_name)
+                sentry_sdk.capture_exception()
+                self._record_failure(type(client))
             except SMSFailedToSend:
-                logger.warning(f'{sms_client_class.__name__} failed to send SMS')
+                # Rejected for this recipient only, says nothing about the provider's health
+                logger.warning('{} failed to send SMS', client_name)
                 sentry_sdk.capture_exception()
             except Exception as exc:
-                logger.exception(f'Unexpected error with {sms_client_class.__name__}')
-                raise SMSFailedToSend(message=f'Unexpected failure using {sms_client_class.__name__}') from exc
+                logger.exception('Unexpected error with {}', client_name)
+                raise SMSFailedToSend(message=f'Unexpected failure using {client_name}') from exc
             else:
                 # Success
+                self._record_success(type(client))
                 message_sent = True
                 break
 
         if not message_sent:
             raise SMSFailedToSend(message=f'Exhausted all SMS clients for {sms.phone_number}')
+
+    @classmethod
+    def _is_circuit_open(cls, client_class: type) -> bool:
+        failures, failed_at = cls._failures_by_client_class.get(client_class, (0, 0.0))
+        return (
+            failures >= cls.CIRCUIT_BREAKER_FAILURE_THRESHOLD
+            and time.monotonic() - failed_at < cls.CIRCUIT_BREAKER_COOLDOWN_SECONDS
+        )
+
+    @classmethod
+    def _record_failure(cls, client_class: type):
+        with cls._breaker_lock:
+            failures, _ = cls._failures_by_client_class.get(client_class, (0, 0.0))
+            cls._failures_by_client_class[client_class] = (failures + 1, time.monotonic())
+
+    @classmethod
+    def _record_success(cls, client_class: type):
+        with cls._breaker_lock:
+            cls._failures_by_client_class.pop(client_class, None)
@@ -6,3 +6,7 @@ class SMSFailedToSend(InternalException):
 
     default_detail = 'SMS failed to send'
     default_code = 'sms_send_failure'
+
+
+class SMSProviderUnavailable(SMSFailedToSend):
+    """Raised when the provider itself could not take the message, as opposed to a problem with the recipient"""
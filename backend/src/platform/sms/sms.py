@@ -3,6 +3,8 @@ SMS service wrapper similar to Email service.
 Provides a simple interface for sending SMS messages.
 """
 
+import functools
+
 from loguru import logger
 
 from src import settings
@@ -16,6 +18,26 @@ from src.platform.sms.client import (
 )
 
 
+@functools.cache
+def _get_default_client(sms_backend: str) -> AbstractSMSClient:
+    """
+    One client per process, their setup checks directories or builds boto3 clients
+    """
+    if sms_backend == 'file':
+        # Development - creates phone-styled HTML previews in browser
+        return SMSFileClient()
+    elif sms_backend == 'mailpit':
+        # Staging - sends SMS preview as email to Mailpit
+        return SMSMailpitClient()
+    elif sms_backend == 'live':
+        # Production - sends real SMS via AWS SNS (with Twilio fallback in future)
+        return ResilientLiveSMSClient()
+
+    # Default to file for safety
+    logger.warning('Unknown SMS_BACKEND: {}, using SMSFileClient', sms_backend)
+    return SMSFileClient()
+
+
 class SMS:
     """
     High-level SMS sending interface.
@@ -53,21 +75,10 @@ class SMS:
         if client is not None:
             self.client = client
         elif settings.USE_MOCK_SMS_CLIENT:
-            # For testing - captures messages in memory
+            # For testing - captures messages in memory, fresh per message so tests can swap the catcher
             self.client = MockSMSClient()
-        elif settings.SMS_BACKEND == 'file':
-            # Development - creates phone-styled HTML previews in browser
-            self.client = SMSFileClient()
-        elif settings.SMS_BACKEND == 'mailpit':
-            # Staging - sends SMS preview as email to Mailpit
-            self.client = SMSMailpitClient()
-        elif settings.SMS_BACKEND == 'live':
-            # Production - sends real SMS via AWS SNS (with Twilio fallback in future)
-            self.client = ResilientLiveSMSClient()
         else:
-            # Default to file for safety
-            logger.warning(f'Unknown SMS_BACKEND: {settings.SMS_BACKEND}, using SMSFileClient')
-            self.client = SMSFileClient()
+            self.client = _get_default_client(settings.SMS_BACKEND)
 
     def send(self):
         """Send the SMS message"""
@@ -77,4 +88,4 @@ class SMS:
             sender_id=self.sender_id,
         )
         self.client.send(sms_domain)
-        logger.info(f'SMS sent to {self.phone_number}')
+        logger.info('SMS sent to {}', self.phone_number)
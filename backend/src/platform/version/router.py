@@ -1,12 +1,21 @@
-from fastapi import APIRouter
-from starlette.responses import JSONResponse
+import functools
+
+import orjson
+from fastapi import APIRouter, Response
 
 router = APIRouter()
 
 
-@router.get('/api')
-def get_app_version() -> JSONResponse:
-    """Get the current application version"""
+@functools.cache
+def _version_body() -> bytes:
+    # Images read the VERSION file written at build time, but a checkout without one still shells
+    # out to git, so the import waits for the first request rather than slowing every startup
     from src.version import VERSION
 
-    return JSONResponse({'version': VERSION})
+    return orjson.dumps({'version': VERSION})
+
+
+@router.get('/api', response_class=Response)
+def get_app_version() -> Response:
+    """Get the current application version"""
+    return Response(content=_version_body(), media_type='application/json')
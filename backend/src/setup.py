@@ -1,6 +1,8 @@
-from src.common.middleware import DramatiqAuditMiddleware
+import functools
+import sys
 
 
+@functools.cache
 def run():
     """
     Run before every entry point:
@@ -8,6 +10,7 @@ def run():
         dramatiq worker
         dramatiq scheduler
         ipython shell
+    Only runs once per process, repeat calls return immediately
     """
     from loguru import logger
 
@@ -23,7 +26,8 @@ def run():
     EventBus.initialize(settings.EVENT_BUS_SUBSCRIBER_REGISTRY)
 
     # The default here is bg:ansiyellow which you cant see in terminal
-    if settings.ENVIRONMENT == 'local':
+    # Only patched when a shell has already loaded IPython, importing it costs over half a second of boot
+    if settings.ENVIRONMENT == 'local' and 'IPython' in sys.modules:
         from IPython.core.ultratb import VerboseTB
 
         orange = '#c96c0e'
@@ -65,16 +69,17 @@ def configure_websockets():
     return connection_manager
 
 
+@functools.cache
 def configure_queue():
     """
     Sets up dramatiq broker with appropriate middleware
     """
     import dramatiq
-    from dramatiq.brokers.redis import RedisBroker
     from dramatiq.middleware import CurrentMessage
     from dramatiq.results import Results
 
     from src import settings
+    from src.common.middleware import DramatiqAuditMiddleware
     from src.network.database.middleware import DramatiqSessionMiddleware
     from src.network.queue.broker import EagerBroker, StubBroker
     from src.network.queue.middleware import (
@@ -94,7 +99,9 @@ def configure_queue():
         # Useful for de-buggers
         broker = EagerBroker()
     else:
-        # Live redis broker
+        # Live redis broker, imported here so the stub and eager brokers never load it
+        from dramatiq.brokers.redis import RedisBroker
+
         broker = RedisBroker(url=settings.REDIS_URL)
 
     # Middleware
@@ -104,12 +111,14 @@ def configure_queue():
     broker.add_middleware(DramatiqTelemetryMiddleware())
     broker.add_middleware(DramatiqSessionMiddleware())
     broker.add_middleware(CurrentMessage())
+    # Always registered, it declares the sentry_ignore_exceptions actor option and its hooks return early without a client
     broker.add_middleware(SentryMiddleware())
     broker.add_middleware(DramatiqJobStatusMiddleware())
     broker.add_middleware(Results(backend=get_results_backend()))
     dramatiq.set_broker(broker)
 
 
+@functools.cache
 def configure_models():
     """
     When using declarative we need to run this for our entry points
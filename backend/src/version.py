@@ -1,32 +1,31 @@
+import pathlib
 import subprocess
 
-try:
-    # Try to get version tags
-    VERSION = (
-        subprocess.Popen(
-            'git describe --tags --exact-match',
-            shell=True,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-        )
-        .communicate()[0]
-        .strip()
-        .decode('utf-8')
-    )
-    if not VERSION:
-        raise ValueError('Empty version')
-except (OSError, IOError, ValueError, subprocess.CalledProcessError):
+# Written at image build time, where there's no git history to describe
+_VERSION_FILE = pathlib.Path(__file__).with_name('VERSION')
+
+
+def _git(*args: str) -> str:
+    # Run git directly rather than through a shell, one process per lookup instead of two
+    return subprocess.run(
+        ['git', *args],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        check=False,
+        text=True,
+    ).stdout.strip()
+
+
+def _git_version() -> str:
     try:
-        VERSION = (
-            subprocess.Popen(
-                'git rev-parse --short HEAD',
-                shell=True,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-            )
-            .communicate()[0]
-            .strip()
-            .decode('utf-8')
-        )
-    except (OSError, IOError):
-        VERSION = 'unknown'
+        # Prefer a release tag, otherwise the short commit
+        return _git('describe', '--tags', '--exact-match') or _git('rev-parse', '--short', 'HEAD') or 'unknown'
+    except OSError:
+        return 'unknown'
+
+
+try:
+    VERSION = _VERSION_FILE.read_text().strip() or _git_version()
+except FileNotFoundError:
+    VERSION = _git_version()
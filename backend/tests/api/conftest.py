@@ -1,9 +1,10 @@
+import functools
 from contextlib import contextmanager
 from typing import Callable, Dict
 
 import pytest
 from fastapi.testclient import TestClient
-from starlette.middleware import Middleware
+from starlette.types import ASGIApp
 
 from src.core.authentication import (
     AuthenticatedUser,
@@ -28,10 +29,27 @@ def patch_isolated_session(monkeypatch):
     monkeypatch.setattr('src.network.database.session.IsolatedSession', PatchedIsolatedSession)
 
 
+# Middleware stacks only depend on which middleware are removed, so each is built once per session
+_MIDDLEWARE_STACK_WITHOUT: Dict[frozenset[str], ASGIApp] = {}
+
+
+def _middleware_stack_without(server, target_names: frozenset[str]) -> ASGIApp:
+    if target_names not in _MIDDLEWARE_STACK_WITHOUT:
+        original_middleware = server.user_middleware
+        server.user_middleware = [
+            middleware for middleware in original_middleware if middleware.cls.__name__ not in target_names
+        ]
+        try:
+            _MIDDLEWARE_STACK_WITHOUT[target_names] = server.build_middleware_stack()
+        finally:
+            server.user_middleware = original_middleware
+    return _MIDDLEWARE_STACK_WITHOUT[target_names]
+
+
 @contextmanager
-def _make_persistent_client(dependency_overrides: Dict[Callable, Callable] | None = None):
+def _make_persistent_client(app_client: TestClient, dependency_overrides: Dict[Callable, Callable] | None = None):
     """
-    Helper to create a persistent TestClient with optional dependency overrides.
+    Helper to turn the shared TestClient persistent with optional dependency overrides.
 
     Removes HTTPSessionManagerMiddleware so multiple requests share state.
     Optionally applies dependency overrides for authentication/authorization.
@@ -46,28 +64,18 @@ def _make_persistent_client(dependency_overrides: Dict[Callable, Callable] | Non
     from src.network.http.server import server
 
     @contextmanager
-    def _temporary_remove_middleware(target_name: str):
+    def _temporary_remove_middleware(target_names: frozenset[str]):
         """
-        Temporarily remove middleware and restore it after use
+        Temporarily swap in a middleware stack without the target and restore it after use
         We use this to mimic a persistent client
         """
-        # Store original middleware state
-        original_middleware = server.user_middleware.copy()
-
-        # Remove from server
-        new_middlewares: list[Middleware] = []
-        for middleware in server.user_middleware:
-            if not middleware.cls.__name__ == target_name:
-                new_middlewares.append(middleware)
-        server.user_middleware = new_middlewares
-        server.middleware_stack = server.build_middleware_stack()
+        original_middleware_stack = server.middleware_stack
+        server.middleware_stack = _middleware_stack_without(server, target_names)
 
         try:
-            yield server
+            yield
         finally:
-            # Restore original middleware state
-            server.user_middleware = original_middleware
-            server.middleware_stack = server.build_middleware_stack()
+            server.middleware_stack = original_middleware_stack
 
     # Apply dependency overrides if provided
     if dependency_overrides:
@@ -75,9 +83,9 @@ def _make_persistent_client(dependency_overrides: Dict[Callable, Callable] | Non
             server.dependency_overrides[dependency] = override
 
     try:
-        with _temporary_remove_middleware(HTTPSessionManagerMiddleware.__name__) as modified_server:
-            with TestClient(modified_server) as client:
-                yield client
+        with _temporary_remove_middleware(frozenset({HTTPSessionManagerMiddleware.__name__})):
+            app_client.cookies.clear()
+            yield app_client
     finally:
         # Clean up dependency overrides
         if dependency_overrides:
@@ -85,16 +93,54 @@ def _make_persistent_client(dependency_overrides: Dict[Callable, Callable] | Non
                 server.dependency_overrides.pop(dependency, None)
 
 
-@pytest.fixture(scope='module')
-def client() -> TestClient:
+@functools.cache
+def _authn_service() -> AuthenticationService:
+    return AuthenticationService.factory()
+
+
+@functools.cache
+def _authz_service() -> AuthorizationService:
+    return AuthorizationService.factory()
+
+
+def _customer_admin_authenticator(user_id: str) -> Callable[[], AuthenticatedUser]:
+    """
+    Build the authenticate_user override for a customer admin. The token is
+    signed and verified on the first request only and reused for the rest of the test.
+    """
+
+    @functools.cache
+    def _authenticate_customer_admin_user() -> AuthenticatedUser:
+        token = _authn_service().create_auth_token(user_id=user_id, ip_address='127.0.0.1')
+        access_token_contents = _authn_service().verify_jwt_token(token.access_token)
+        return AuthenticatedUser(
+            id=user_id,
+            impersonator_id=None,
+            token=access_token_contents,
+        )
+
+    return _authenticate_customer_admin_user
+
+
+@pytest.fixture(scope='session')
+def app_client() -> TestClient:
+    """
+    One TestClient for the whole run, entering a TestClient runs the app lifespan.
+    Other client fixtures hand this out with their own overrides applied.
+    """
     from src.network.http.server import server
 
     with TestClient(server) as c:
         yield c
 
 
+@pytest.fixture(scope='module')
+def client(app_client) -> TestClient:
+    return app_client
+
+
 @pytest.fixture(scope='function')
-def persistent_client() -> TestClient:
+def persistent_client(app_client) -> TestClient:
     """
     TestClient that persists data between HTTP requests within a single test.
 
@@ -104,25 +150,24 @@ def persistent_client() -> TestClient:
     Note: Data persists between requests within the test, but is cleaned up
     after the test completes (function scope).
     """
-    with _make_persistent_client() as client:
+    with _make_persistent_client(app_client) as client:
         yield client
 
 
 @pytest.fixture(scope='function')
-def staff_client(staff_user) -> TestClient:
+def staff_client(staff_user, app_client) -> TestClient:
     """
     Get a client authenticated as a staff user
     """
     from src.network.http.server import server
 
     def authorize_staff_user():
-        authz_service = AuthorizationService.factory()
-        return authz_service.get_auth_user_from_id(staff_user.id)
+        return _authz_service().get_auth_user_from_id(staff_user.id)
 
     server.dependency_overrides[_authorize_staff_member] = authorize_staff_user
     server.dependency_overrides[_authorize_user] = authorize_staff_user
-    with TestClient(server) as c:
-        yield c
+    app_client.cookies.clear()
+    yield app_client
 
     # clear Dependency
     server.dependency_overrides.pop(_authorize_user)
@@ -130,32 +175,24 @@ def staff_client(staff_user) -> TestClient:
 
 
 @pytest.fixture(scope='function')
-def customer_admin_client(customer_admin_user) -> TestClient:
+def customer_admin_client(customer_admin_user, app_client) -> TestClient:
     """
     Get a client authenticated as a customer admin user
     """
     from src.network.http.server import server
 
-    def _authenticate_customer_admin_user():
-        authn_service = AuthenticationService.factory()
-        token = authn_service.create_auth_token(user_id=customer_admin_user.id, ip_address='127.0.0.1')
-        access_token_contents = authn_service.verify_jwt_token(token.access_token)
-        return AuthenticatedUser(
-            id=customer_admin_user.id,
-            impersonator_id=None,
-            token=access_token_contents,
-        )
+    _authenticate_customer_admin_user = _customer_admin_authenticator(customer_admin_user.id)
 
     server.dependency_overrides[authenticate_user] = _authenticate_customer_admin_user
-    with TestClient(server) as c:
-        yield c
+    app_client.cookies.clear()
+    yield app_client
 
     # clear Dependency
     server.dependency_overrides.pop(authenticate_user)
 
 
 @pytest.fixture(scope='function')
-def persistent_staff_client(staff_user) -> TestClient:
+def persistent_staff_client(staff_user, app_client) -> TestClient:
     """
     Persistent client authenticated as a staff user.
 
@@ -164,20 +201,19 @@ def persistent_staff_client(staff_user) -> TestClient:
     """
 
     def authorize_staff_user():
-        authz_service = AuthorizationService.factory()
-        return authz_service.get_auth_user_from_id(staff_user.id)
+        return _authz_service().get_auth_user_from_id(staff_user.id)
 
     overrides = {
         _authorize_staff_member: authorize_staff_user,
         _authorize_user: authorize_staff_user,
     }
 
-    with _make_persistent_client(dependency_overrides=overrides) as client:
+    with _make_persistent_client(app_client, dependency_overrides=overrides) as client:
         yield client
 
 
 @pytest.fixture(scope='function')
-def persistent_customer_admin_client(customer_admin_user) -> TestClient:
+def persistent_customer_admin_client(customer_admin_user, app_client) -> TestClient:
     """
     Persistent client authenticated as a customer admin user.
 
@@ -185,17 +221,9 @@ def persistent_customer_admin_client(customer_admin_user) -> TestClient:
     Data persists between requests within the test.
     """
 
-    def _authenticate_customer_admin_user():
-        authn_service = AuthenticationService.factory()
-        token = authn_service.create_auth_token(user_id=customer_admin_user.id, ip_address='127.0.0.1')
-        access_token_contents = authn_service.verify_jwt_token(token.access_token)
-        return AuthenticatedUser(
-            id=customer_admin_user.id,
-            impersonator_id=None,
-            token=access_token_contents,
-        )
+    _authenticate_customer_admin_user = _customer_admin_authenticator(customer_admin_user.id)
 
     overrides = {authenticate_user: _authenticate_customer_admin_user}
 
-    with _make_persistent_client(dependency_overrides=overrides) as client:
+    with _make_persistent_client(app_client, dependency_overrides=overrides) as client:
         yield client
@@ -1,6 +1,6 @@
 import string
 
-from src.common.nanoid import NanoId
+from src.common.nanoid import NanoId, generate_custom_nanoid
 
 
 def test_nanoid_length_without_abbrev():
@@ -34,3 +34,9 @@ def test_nanoid_chars_in_pool_with_abbrev():
     nano_id_without_abbrev = nano_id.split('-')[1]
     for char in nano_id_without_abbrev:
         assert char in char_pool
+
+
+def test_custom_nanoid_uses_only_given_pool():
+    nano_id = generate_custom_nanoid(size=200, char_pool='ab')
+    assert len(nano_id) == 200
+    assert set(nano_id) <= {'a', 'b'}
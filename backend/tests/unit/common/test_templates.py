@@ -0,0 +1,14 @@
+"""Unit tests for the shared jinja environment helper."""
+
+from src.common.templates import get_template_environment
+
+
+class TestGetTemplateEnvironment:
+    def test_one_environment_per_package(self):
+        email_environment = get_template_environment('src.platform.email')
+
+        assert get_template_environment('src.platform.email') is email_environment
+        assert get_template_environment('src.platform.pdf') is not email_environment
+
+    def test_loads_templates_from_the_package(self):
+        assert get_template_environment('src.platform.email').get_template('base.html')
@@ -0,0 +1,22 @@
+"""Unit tests for JWT issuance in AuthenticationService."""
+
+from datetime import timedelta
+
+from src import settings
+from src.core.authentication.services.authentication_service import AuthenticationService
+
+
+class TestCreateToken:
+    def test_access_token_lifetime_matches_settings(self):
+        token = AuthenticationService.create_auth_token(user_id='usr-1', ip_address='127.0.0.1')
+        contents = AuthenticationService.verify_jwt_token(token.access_token)
+
+        assert contents.exp - contents.nbf == settings.AUTH_SETTINGS['ACCESS_TOKEN_LIFETIME'].total_seconds()
+
+    def test_lifetime_changes_apply_without_a_second_source(self, monkeypatch):
+        monkeypatch.setitem(settings.AUTH_SETTINGS, 'ACCESS_TOKEN_LIFETIME', timedelta(minutes=1))
+
+        token = AuthenticationService.create_auth_token(user_id='usr-1', ip_address='127.0.0.1')
+        contents = AuthenticationService.verify_jwt_token(token.access_token)
+
+        assert contents.exp - contents.nbf == 60
@@ -0,0 +1,162 @@
+"""Unit tests for the email clients."""
+
+import smtplib
+from unittest import mock
+
+import pytest
+
+from src import settings
+from src.platform.email.client import (
+    EmailClientDomain,
+    MailPitClient,
+    MockEmailClient,
+    ResendEmailClient,
+    ResilientLiveEmailClient,
+)
+from src.platform.email.exceptions import EmailBatchFailedToSend
+
+
+def make_messages(count: int) -> list[EmailClientDomain]:
+    return [
+        EmailClientDomain(
+            from_email=('noreply@example.com', 'Example'),
+            to_emails=[f'user{n}@example.com'],
+            subject=f'subject {n}',
+            plain_text_content='hi',
+        )
+        for n in range(count)
+    ]
+
+
+class FlakyEmailClient(MockEmailClient):
+    def send(self, message: EmailClientDomain):
+        if message.subject.endswith('0'):
+            raise ConnectionError('refused')
+        super().send(message)
+
+
+class TestSendMany:
+    def test_attempts_every_message_and_reports_only_unsent(self):
+        client = FlakyEmailClient()
+        messages = make_messages(3)
+
+        with pytest.raises(EmailBatchFailedToSend) as exc_info:
+            client.send_many(messages)
+
+        assert exc_info.value.unsent == messages[:1]
+        assert client.email_catcher == messages[1:]
+
+
+class TestMailPitClient:
+    def test_reports_messages_after_the_failure_as_unsent(self, monkeypatch):
+        server = mock.MagicMock()
+        server.__enter__.return_value = server
+        server.send_message.side_effect = [None, smtplib.SMTPServerDisconnected('gone'), None]
+        monkeypatch.setattr(smtplib, 'SMTP', mock.Mock(return_value=server))
+        messages = make_messages(3)
+
+        with pytest.raises(EmailBatchFailedToSend) as exc_info:
+            MailPitClient().send_many(messages)
+
+        assert exc_info.value.unsent == messages[1:]
+
+    def test_keeps_sending_after_a_message_is_refused(self, monkeypatch):
+        server = mock.MagicMock()
+        server.__enter__.return_value = server
+        server.send_message.side_effect = [
+            smtplib.SMTPRecipientsRefused({'user0@example.com': (550, b'no such user')}),
+            None,
+            smtplib.SMTPDataError(554, b'rejected'),
+            None,
+        ]
+        monkeypatch.setattr(smtplib, 'SMTP', mock.Mock(return_value=server))
+        messages = make_messages(4)
+
+        with pytest.raises(EmailBatchFailedToSend) as exc_info:
+            MailPitClient().send_many(messages)
+
+        assert exc_info.value.unsent == [messages[0], messages[2]]
+        assert server.send_message.call_count == 4
+
+    def test_reports_refused_and_remaining_messages_when_connection_drops(self, monkeypatch):
+        server = mock.MagicMock()
+        server.__enter__.return_value = server
+        server.send_message.side_effect = [smtplib.SMTPDataError(554, b'rejected'), OSError('reset'), None]
+        monkeypatch.setattr(smtplib, 'SMTP', mock.Mock(return_value=server))
+        messages = make_messages(3)
+
+        with pytest.raises(EmailBatchFailedToSend) as exc_info:
+            MailPitClient().send_many(messages)
+
+        assert exc_info.value.unsent == messages
+
+
+class TestResendEmailClient:
+    def test_reports_failed_batch_and_later_batches_as_unsent(self, monkeypatch):
+        monkeypatch.setattr(settings, 'RESEND_API_KEY', 're_test')
+        monkeypatch.setattr(ResendEmailClient, 'BATCH_SIZE', 2)
+        client = ResendEmailClient()
+        batch_send = mock.Mock(side_effect=[None, Exception('rate limited'), None])
+        monkeypatch.setattr(client._resend.Batch, 'send', batch_send)
+        messages = make_messages(5)
+
+        with pytest.raises(EmailBatchFailedToSend) as exc_info:
+            client.send_many(messages)
+
+        assert exc_info.value.unsent == messages[2:]
+        assert batch_send.call_count == 2
+
+
+class TestResilientLiveEmailClient:
+    @pytest.fixture
+    def providers(self, monkeypatch):
+        sent_by_provider = {}
+
+        def make_provider(name: str, fail_after: int | None = None, broken: bool = False):
+            class Provider(MockEmailClient):
+                def __init__(self, *args, **kwargs):
+                    if broken:
+                        raise RuntimeError('misconfigured')
+                    super().__init__(*args, **kwargs)
+                    self.email_catcher = sent_by_provider.setdefault(name, [])
+
+                def send_many(self, messages):
+                    if fail_after is None:
+                        return super().send_many(messages)
+                    for message in messages[:fail_after]:
+                        self.send(message)
+                    raise EmailBatchFailedToSend(message='down', unsent=messages[fail_after:])
+
+            Provider.__name__ = name
+            return Provider
+
+        return sent_by_provider, make_provider
+
+    def test_fails_over_only_unsent_messages(self, providers, monkeypatch):
+        sent_by_provider, make_provider = providers
+        monkeypatch.setattr(
+            ResilientLiveEmailClient,
+            'CLIENT_PRIORITY_ORDER',
+            [make_provider('primary', fail_after=2), make_provider('broken', broken=True), make_provider('secondary')],
+        )
+        messages = make_messages(5)
+
+        ResilientLiveEmailClient().send_many(messages)
+
+        assert sent_by_provider['primary'] == messages[:2]
+        assert sent_by_provider['secondary'] == messages[2:]
+
+    def test_raises_with_remaining_messages_when_every_provider_fails(self, providers, monkeypatch):
+        sent_by_provider, make_provider = providers
+        monkeypatch.setattr(
+            ResilientLiveEmailClient,
+            'CLIENT_PRIORITY_ORDER',
+            [make_provider('primary', fail_after=1), make_provider('secondary', fail_after=1)],
+        )
+        messages = make_messages(4)
+
+        with pytest.raises(EmailBatchFailedToSend) as exc_info:
+            ResilientLiveEmailClient().send_many(messages)
+
+        assert exc_info.value.unsent == messages[2:]
+        assert sent_by_provider['primary'] + sent_by_provider['secondary'] == messages[:2]
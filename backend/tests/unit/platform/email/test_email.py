@@ -0,0 +1,74 @@
+"""Unit tests for queueing template emails until the transaction commits."""
+
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.platform.email import email as email_module
+from src.platform.email.email import Email
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = Session()
+    monkeypatch.setattr(email_module, 'db', SimpleNamespace(session=session))
+    return session
+
+
+@pytest.fixture
+def batch_send(monkeypatch):
+    batch_send = mock.Mock()
+    monkeypatch.setattr(email_module._send_template_email_batch, 'send', batch_send)
+    monkeypatch.setattr(Email, 'render_template_with_context', lambda self: f'<p>{self.subject}</p>')
+    return batch_send
+
+
+def make_email(n: int) -> Email:
+    return Email(subject=f'subject {n}', recipients=[f'user{n}@example.com'], template_name='base.html')
+
+
+class TestBatchOnCommit:
+    def test_sends_emails_of_the_transaction_after_commit(self, session, batch_send):
+        make_email(0).send()
+        make_email(1).send()
+        batch_send.assert_not_called()
+
+        session.commit()
+
+        (jobs,), _ = batch_send.call_args
+        assert [job['subject'] for job in jobs] == ['subject 0', 'subject 1']
+        assert jobs[0]['rendered_html'] == '<p>subject 0</p>'
+
+    def test_splits_large_transactions_into_capped_batches(self, session, batch_send, monkeypatch):
+        monkeypatch.setattr(email_module, 'MAX_EMAILS_PER_BATCH', 2)
+        for n in range(5):
+            make_email(n).send()
+
+        session.commit()
+
+        assert [len(call.args[0]) for call in batch_send.call_args_list] == [2, 2, 1]
+
+    def test_discards_emails_on_rollback(self, session, batch_send):
+        make_email(0).send()
+        session.rollback()
+        session.commit()
+
+        batch_send.assert_not_called()
+
+    def test_nested_rollback_keeps_outer_transaction_emails(self, session, batch_send):
+        session.begin()
+        make_email(0).send()
+        session.begin_nested().rollback()
+        session.commit()
+
+        assert len(batch_send.call_args.args[0]) == 1
+
+    def test_registers_listeners_once_per_session(self, session, batch_send):
+        make_email(0).send()
+        session.commit()
+        make_email(1).send()
+        session.commit()
+
+        assert [len(call.args[0]) for call in batch_send.call_args_list] == [1, 1]
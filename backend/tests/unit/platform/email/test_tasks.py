@@ -0,0 +1,52 @@
+"""Unit tests for the template email worker tasks."""
+
+from unittest import mock
+
+import pytest
+
+from src.platform.email import tasks
+from src.platform.email.exceptions import EmailBatchFailedToSend, EmailFailedToSend
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = mock.Mock()
+    monkeypatch.setattr(tasks.EmailService, 'factory', mock.Mock(return_value=service))
+    return service
+
+
+def make_job(subject: str, template_name: str = 'auth-email-challenge.html', rendered_html: str | None = '<p>hi</p>'):
+    return {
+        'subject': subject,
+        'recipients': ['user@example.com'],
+        'context': {},
+        'template_name': template_name,
+        'rendered_html': rendered_html,
+    }
+
+
+class TestSendTemplateEmailBatch:
+    def test_sends_every_job_in_one_call(self, service):
+        tasks._send_template_email_batch([make_job('a'), make_job('b')])
+
+        (emails,), _ = service.send_many.call_args
+        assert [email['subject'] for email in emails] == ['a', 'b']
+
+    def test_bad_template_only_costs_its_own_email(self, service):
+        jobs = [make_job('a'), make_job('broken', template_name='missing.html', rendered_html=None), make_job('c')]
+
+        with pytest.raises(EmailFailedToSend) as exc_info:
+            tasks._send_template_email_batch(jobs)
+
+        (emails,), _ = service.send_many.call_args
+        assert [email['subject'] for email in emails] == ['a', 'c']
+        assert "['broken']" in exc_info.value.message
+
+    def test_reports_emails_the_provider_did_not_send(self, service):
+        unsent = mock.Mock(subject='b')
+        service.send_many.side_effect = EmailBatchFailedToSend(message='down', unsent=[unsent])
+
+        with pytest.raises(EmailFailedToSend) as exc_info:
+            tasks._send_template_email_batch([make_job('a'), make_job('b')])
+
+        assert exc_info.value.message == "1 of 2 email(s) not sent: ['b']"
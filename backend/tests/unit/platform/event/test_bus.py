@@ -0,0 +1,88 @@
+"""Unit tests for EventBus subscriber dispatch."""
+
+import sys
+import types
+
+import pytest
+
+from src.platform.event.bus import EventBus, _event_create
+from src.platform.event.constants import EventTypeEnum
+from src.platform.event.event import ALL_EVENTS, BaseEvent
+from src.platform.event.exceptions import EventBusNotInitialized
+from src.platform.event.payload import BaseEventPayload
+from src.platform.event.subscriber import BaseSubscriber
+
+RAN = []
+
+
+class SamplePayload(BaseEventPayload):
+    value: int = 1
+
+
+class SampleEvent(BaseEvent[SamplePayload]):
+    EVENT_TYPE = EventTypeEnum.ENTITY_CREATED
+    PAYLOAD_CLASS = SamplePayload
+
+
+class OtherEvent(BaseEvent[SamplePayload]):
+    EVENT_TYPE = EventTypeEnum.DOCUMENT_PARSED
+    PAYLOAD_CLASS = SamplePayload
+
+
+class SampleSubscriber(BaseSubscriber):
+    # Registered for the specific event and all events, should still only run once
+    FOR_EVENTS = [SampleEvent, ALL_EVENTS]
+
+    def run(self, event):
+        RAN.append((self.__class__.__name__, type(event).__name__))
+
+
+class CatchAllSubscriber(BaseSubscriber):
+    FOR_EVENTS = [ALL_EVENTS]
+
+    def run(self, event):
+        RAN.append((self.__class__.__name__, type(event).__name__))
+
+
+@pytest.fixture
+def event_bus(monkeypatch):
+    module = types.ModuleType('sample_subscribers')
+    module.SampleSubscriber = SampleSubscriber
+    module.CatchAllSubscriber = CatchAllSubscriber
+    monkeypatch.setitem(sys.modules, 'sample_subscribers', module)
+    RAN.clear()
+    return EventBus(['sample_subscribers.SampleSubscriber', 'sample_subscribers.CatchAllSubscriber'])
+
+
+class TestEventBus:
+    def test_runs_specific_then_catch_all_subscribers_once(self, event_bus):
+        event_bus.publish(SampleEvent.new(SamplePayload()))
+
+        assert RAN == [('SampleSubscriber', 'SampleEvent'), ('CatchAllSubscriber', 'SampleEvent')]
+
+    def test_event_without_own_subscribers_runs_catch_all(self, event_bus):
+        event_bus.publish(OtherEvent.new(SamplePayload()))
+
+        assert RAN == [('SampleSubscriber', 'OtherEvent'), ('CatchAllSubscriber', 'OtherEvent')]
+
+    def test_event_publish_goes_through_initialized_bus(self, event_bus, monkeypatch):
+        monkeypatch.setattr(BaseEvent, '_bus', None)
+        with pytest.raises(EventBusNotInitialized):
+            SampleEvent.new(SamplePayload()).publish()
+
+        monkeypatch.setattr(BaseEvent, '_bus', event_bus)
+        SampleEvent.new(SamplePayload()).publish()
+
+        assert RAN == [('SampleSubscriber', 'SampleEvent'), ('CatchAllSubscriber', 'SampleEvent')]
+
+
+class TestEventCreate:
+    def test_built_from_event_without_string_round_trip(self):
+        event = SampleEvent.new(SamplePayload(value=3))
+
+        event_create = _event_create(event)
+
+        assert event_create.id == event.id
+        assert event_create.event_type == EventTypeEnum.ENTITY_CREATED.value
+        assert event_create.payload == {'value': 3}
+        assert event_create.payload_class == 'SamplePayload'
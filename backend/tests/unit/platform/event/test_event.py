@@ -0,0 +1,35 @@
+"""Unit tests for BaseEvent serialization round trips."""
+
+import uuid
+
+from src.platform.event.constants import EventTypeEnum
+from src.platform.event.event import BaseEvent
+from src.platform.event.payload import BaseEventPayload
+
+
+class RoundTripPayload(BaseEventPayload):
+    name: str
+
+
+class RoundTripEvent(BaseEvent[RoundTripPayload]):
+    EVENT_TYPE = EventTypeEnum.SCHEDULE_TRIGGERED
+    PAYLOAD_CLASS = RoundTripPayload
+
+
+class TestBaseEvent:
+    def test_concrete_event_from_dict_round_trip(self):
+        event = RoundTripEvent.new(RoundTripPayload(name='nightly'))
+        data = event.serialize()
+
+        rebuilt = BaseEvent.get_concrete_event_from_dict(data)
+
+        assert isinstance(rebuilt, RoundTripEvent)
+        assert rebuilt.payload == event.payload
+        assert str(rebuilt.id) == data['id']
+
+    def test_id_is_stored_as_uuid(self):
+        event = RoundTripEvent.new(RoundTripPayload(name='nightly'))
+        rebuilt = BaseEvent.get_concrete_event_from_dict(event.serialize())
+
+        assert isinstance(rebuilt.id, uuid.UUID)
+        assert rebuilt.id == event.id
@@ -0,0 +1,213 @@
+"""Unit tests for file backend helpers."""
+
+import datetime
+from io import BytesIO
+from unittest import mock
+
+import botocore.session
+import pytest
+from botocore.client import Config
+from botocore.credentials import Credentials
+from botocore.exceptions import ClientError
+
+from src import settings
+from src.platform.files.backend import MockS3Storage, S3Storage, sanitize_disposition
+
+
+@pytest.fixture
+def storage():
+    # Skips __init__, which would build a boto3 session, tests swap in the client they need
+    storage = S3Storage.__new__(S3Storage)
+    storage.client = mock.Mock()
+    storage.credentials = Credentials('AKIDEXAMPLE', 'secret')
+    return storage
+
+
+class TestSanitizeDisposition:
+    def test_replaces_characters_outside_latin1(self):
+        disposition = 'inline; filename="résumé—final😀.pdf"'
+        assert sanitize_disposition(disposition) == 'inline; filename="résumé-final-.pdf"'
+
+    def test_latin1_filename_unchanged(self):
+        disposition = 'attachment; filename="report (1).pdf"'
+        assert sanitize_disposition(disposition) == disposition
+
+    def test_without_filename_unchanged(self):
+        assert sanitize_disposition('inline') == 'inline'
+
+
+class TestBulkCopy:
+    def test_copies_every_key_and_reports_failures(self, storage):
+        denied = RuntimeError('denied')
+
+        def copy_object(**kwargs):
+            if kwargs['Key'] == 'b2':
+                raise denied
+
+        client = storage.client
+        client.copy_object.side_effect = copy_object
+
+        errors = storage.bulk_copy({'a1': 'a2', 'b1': 'b2', 'c1': 'c2'})
+
+        copied = {call.kwargs['Key'] for call in client.copy_object.call_args_list}
+        assert copied == {'a2', 'b2', 'c2'}
+        assert errors == {'b1': denied}
+
+    def test_objects_over_copy_limit_use_managed_copy(self, storage):
+        client = storage.client
+        client.copy_object.side_effect = ClientError(
+            {
+                'Error': {
+                    'Code': 'InvalidRequest',
+                    'Message': 'The specified copy source is larger than the maximum allowable size for a copy '
+                    'source: 5368709120',
+                }
+            },
+            'CopyObject',
+        )
+
+        assert storage.bulk_copy({'big1': 'big2'}) == {}
+        client.copy.assert_called_once()
+        assert client.copy.call_args.args[2] == 'big2'
+
+    def test_other_invalid_requests_are_reported_not_retried(self, storage):
+        client = storage.client
+        client.copy_object.side_effect = ClientError(
+            {'Error': {'Code': 'InvalidRequest', 'Message': 'nope'}}, 'CopyObject'
+        )
+
+        assert list(storage.bulk_copy({'a1': 'a2'})) == ['a1']
+        client.copy.assert_not_called()
+
+
+class TestDeleteByPrefix:
+    def test_deletes_each_page_as_it_is_listed(self, storage):
+        client = storage.client
+        client.get_paginator.return_value.paginate.return_value = iter(
+            [{'Contents': [{'Key': 'p/a'}, {'Key': 'p/b'}]}, {}, {'Contents': [{'Key': 'p/c'}]}]
+        )
+
+        storage.delete_by_prefix('p/')
+
+        deleted = [call.kwargs['Delete']['Objects'] for call in client.delete_objects.call_args_list]
+        assert deleted == [[{'Key': 'p/a'}, {'Key': 'p/b'}], [{'Key': 'p/c'}]]
+
+
+def make_signing_client(**kwargs):
+    # boto3 sessions are patched out for tests, sign with a plain botocore client instead
+    return botocore.session.get_session().create_client(
+        's3',
+        aws_access_key_id='AKIDEXAMPLE',
+        aws_secret_access_key='secret',
+        **{'region_name': 'us-west-2', 'config': Config(signature_version='s3v4'), **kwargs},
+    )
+
+
+class TestGeneratePresignedUrlsForParts:
+    @pytest.fixture(autouse=True)
+    def frozen_signing_time(self, monkeypatch):
+        # Both signatures must use the same timestamp to be comparable
+        monkeypatch.setattr('botocore.auth.get_current_datetime', lambda: datetime.datetime(2024, 1, 1, 12, 0, 0))
+
+    def client_signed_urls(self, client, file_name, part_numbers):
+        return [
+            client.generate_presigned_url(
+                'upload_part',
+                Params={
+                    'Bucket': settings.AWS_STORAGE_BUCKET_NAME,
+                    'Key': file_name,
+                    'UploadId': 'upload+id',
+                    'PartNumber': part_number,
+                },
+                ExpiresIn=3600,
+            )
+            for part_number in part_numbers
+        ]
+
+    @pytest.mark.parametrize(
+        'client_kwargs',
+        [
+            {},
+            {'region_name': 'eu-central-1'},
+            {
+                'endpoint_url': 'http://localhost:9000',
+                'config': Config(signature_version='s3v4', s3={'addressing_style': 'path'}),
+            },
+        ],
+        ids=['default', 'other-region', 'custom-endpoint-path-style'],
+    )
+    def test_matches_client_signed_urls(self, client_kwargs, storage):
+        storage.client = make_signing_client(**client_kwargs)
+        file_name = 'uploads/a b/scan~+.pdf'
+
+        urls = storage.generate_presigned_urls_for_parts('upload+id', file_name, range(1, 4))
+
+        assert urls == self.client_signed_urls(storage.client, file_name, range(1, 4))
+
+    def test_single_part(self, storage):
+        storage.client = make_signing_client()
+
+        url = storage.generate_presigned_url_for_part('upload+id', 'uploads/scan.pdf', 3)
+
+        assert [url] == self.client_signed_urls(storage.client, 'uploads/scan.pdf', [3])
+
+
+class TestOpenObject:
+    def test_returns_content_length_with_body_chunks(self, storage):
+        client = storage.client
+        body = mock.Mock(iter_chunks=mock.Mock(return_value=iter([b'ab', b'c'])))
+        client.get_object.return_value = {'ContentLength': 3, 'Body': body}
+
+        content_length, chunks = storage.open_object('uploads/scan.pdf', chunk_size=2)
+
+        assert (content_length, list(chunks)) == (3, [b'ab', b'c'])
+        client.get_object.assert_called_once_with(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key='uploads/scan.pdf')
+        body.iter_chunks.assert_called_once_with(2)
+
+    def test_get_and_iter_object_read_through_open_object(self, storage):
+        client = storage.client
+        client.get_object.side_effect = lambda **kwargs: {
+            'ContentLength': 3,
+            'Body': mock.Mock(iter_chunks=mock.Mock(return_value=iter([b'ab', b'c']))),
+        }
+
+        assert storage.get_object('uploads/scan.pdf') == b'abc'
+        assert list(storage.iter_object('uploads/scan.pdf', chunk_size=2)) == [b'ab', b'c']
+
+    @pytest.mark.parametrize('method', ['open_object', 'get_object', 'iter_object'])
+    def test_missing_object_raises_client_error(self, method, storage):
+        client = storage.client
+        client.get_object.side_effect = ClientError({'Error': {'Code': 'NoSuchKey'}}, 'GetObject')
+
+        with pytest.raises(ClientError):
+            result = getattr(storage, method)('uploads/missing.pdf')
+            if method == 'iter_object':
+                # iter_object is lazy, the request goes out on the first chunk
+                list(result)
+
+
+class TestMockS3StorageObjects:
+    def test_reads_agree_with_open_object(self):
+        storage = MockS3Storage()
+        content_length, chunks = storage.open_object('a.pdf')
+        content = b''.join(chunks)
+
+        assert content_length == len(content)
+        assert storage.get_object('a.pdf') == content
+        assert b''.join(storage.iter_object('a.pdf')) == content
+
+
+class TestUploadFromPresignedPost:
+    def test_streams_fields_then_file(self, monkeypatch, storage):
+        post = mock.Mock()
+        monkeypatch.setattr('src.platform.files.backend.requests.post', post)
+        presigned_post = {'url': 'https://bucket.s3.test', 'fields': {'key': 'uploads/scan.pdf', 'policy': 'p'}}
+
+        storage.upload_from_presigned_post(presigned_post, {'file': ('scan.pdf', BytesIO(b'%PDF-1.4'))})
+
+        (url,), kwargs = post.call_args
+        body = kwargs['data'].to_string()
+        assert url == 'https://bucket.s3.test'
+        assert kwargs['headers']['Content-Type'].startswith('multipart/form-data; boundary=')
+        assert body.index(b'name="key"') < body.index(b'name="policy"') < body.index(b'name="file"')
+        assert b'%PDF-1.4' in body
@@ -0,0 +1,70 @@
+"""Unit tests for file domain url helpers."""
+
+import datetime
+import uuid
+from unittest import mock
+
+from src import settings
+from src.platform.files.domains import FileRead, FileWithUrl
+
+
+def _file_read(file_name: str, is_public: bool = False) -> FileRead:
+    return FileRead(
+        id=uuid.uuid4(),
+        file_name=file_name,
+        s3_key=f'uploads/{file_name}',
+        uploaded_at=datetime.datetime(2024, 1, 1),
+        is_public=is_public,
+    )
+
+
+class TestFileReadUrl:
+    def test_public_file_uses_bucket_url_without_signing(self):
+        storage = mock.Mock()
+
+        url = _file_read('logo.png', is_public=True).url_from(storage)
+
+        assert url == f'https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.amazonaws.com/uploads/logo.png'
+        storage.generate_presigned_url.assert_not_called()
+
+
+class TestGenerateGetUrl:
+    def test_renderable_file_is_served_inline(self):
+        storage = mock.Mock()
+
+        FileWithUrl.generate_get_url(_file_read('scan.pdf'), storage)
+
+        storage.generate_presigned_url.assert_called_once_with(
+            'uploads/scan.pdf', disposition='inline; filename="scan.pdf"', content_type='application/pdf;'
+        )
+
+    def test_extension_match_ignores_case(self):
+        storage = mock.Mock()
+
+        FileWithUrl.generate_get_url(_file_read('IMG_0001.JPG'), storage)
+
+        storage.generate_presigned_url.assert_called_once_with(
+            'uploads/IMG_0001.JPG', disposition='inline; filename="IMG_0001.JPG"', content_type='image/jpeg;'
+        )
+
+    def test_other_file_is_downloaded(self):
+        storage = mock.Mock()
+
+        FileWithUrl.generate_get_url(_file_read('data.csv'), storage)
+
+        storage.generate_presigned_url.assert_called_once_with(
+            'uploads/data.csv', disposition='attachment; filename="data.csv"', content_type=None
+        )
+
+
+class TestFileWithUrl:
+    def test_url_is_signed_once_at_construction(self):
+        storage = mock.Mock()
+        storage.generate_presigned_url.return_value = 'https://signed'
+
+        file_with_url = FileWithUrl.from_file(_file_read('scan.pdf'), storage=storage)
+        file_with_url.model_dump()
+        file_with_url.model_dump(mode='json')
+
+        assert file_with_url.get_url == 'https://signed'
+        storage.generate_presigned_url.assert_called_once()
@@ -0,0 +1,256 @@
+"""Unit tests for FileService signed url caching."""
+
+import uuid
+from datetime import datetime
+from io import BytesIO
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+import redis
+
+from src.platform.files import service as file_service_module
+from src.platform.files.domains import FileRead, Part
+from src.platform.files.service import FileService
+
+
+class FakeCache:
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+
+@pytest.fixture
+def file_service(monkeypatch):
+    monkeypatch.setattr(
+        file_service_module.File, 'get', mock.Mock(return_value=SimpleNamespace(s3_key='uploads/scan.pdf'))
+    )
+    file_service_module._S3_KEY_CACHE.clear()
+    service = FileService()
+    service.storage = mock.Mock()
+    service.storage.generate_presigned_url.side_effect = ['https://signed/1', 'https://signed/2']
+    service.cache = FakeCache()
+    return service
+
+
+class TestGetSignedUrlForFileId:
+    def test_reuses_cached_url_that_expires_before_its_signature(self, file_service):
+        first = file_service.get_signed_url_for_file_id('file-id', ttl_seconds=3600)
+        second = file_service.get_signed_url_for_file_id('file-id', ttl_seconds=3600)
+
+        assert first == second == 'https://signed/1'
+        file_service.storage.generate_presigned_url.assert_called_once()
+        assert list(file_service.cache.ttls.values()) == [3600 - FileService.SIGNED_URL_CACHE_MARGIN]
+
+    def test_short_lived_urls_are_not_cached(self, file_service):
+        file_service.get_signed_url_for_file_id('file-id', ttl_seconds=60)
+        file_service.get_signed_url_for_file_id('file-id', ttl_seconds=60)
+
+        assert file_service.storage.generate_presigned_url.call_count == 2
+        assert file_service.cache.values == {}
+
+    def test_cache_failure_falls_back_to_signing_and_is_logged(self, file_service, monkeypatch):
+        file_service.cache = mock.Mock(
+            get=mock.Mock(side_effect=redis.ConnectionError('refused')),
+            setex=mock.Mock(side_effect=redis.TimeoutError('timed out')),
+        )
+        monkeypatch.setattr(file_service_module, 'logger', mock.Mock())
+
+        assert file_service.get_signed_url_for_file_id('file-id') == 'https://signed/1'
+        assert file_service_module.logger.warning.call_count == 2
+
+    def test_cache_client_fails_fast(self):
+        connection_kwargs = FileService().cache.connection_pool.connection_kwargs
+
+        assert connection_kwargs['socket_connect_timeout'] <= 1
+        assert connection_kwargs['socket_timeout'] <= 1
+
+
+class TestS3KeyCache:
+    def test_file_row_is_read_once_until_deleted(self, file_service, monkeypatch):
+        monkeypatch.setattr(file_service_module.File, 'delete', mock.Mock())
+        file_service.storage.open_object.side_effect = lambda s3_key: (0, iter([]))
+
+        file_service.download('file-id')
+        file_service.download('file-id')
+        assert file_service_module.File.get.call_count == 1
+
+        file_service.delete('file-id')
+        file_service.download('file-id')
+        assert file_service_module.File.get.call_count == 2
+
+    def test_expired_entries_are_reloaded(self, monkeypatch):
+        clock = mock.Mock(return_value=100.0)
+        monkeypatch.setattr(file_service_module.time, 'monotonic', clock)
+        cache = file_service_module._S3KeyCache(ttl_seconds=60, maxsize=1)
+
+        cache.set('a', 'uploads/a')
+        assert cache.get('a') == 'uploads/a'
+        clock.return_value = 161.0
+        assert cache.get('a') is None
+
+        cache.set('a', 'uploads/a')
+        cache.set('b', 'uploads/b')
+        assert cache.get('a') is None
+
+
+class TestUploadFromUrl:
+    @pytest.fixture
+    def response(self, monkeypatch):
+        response = mock.MagicMock(headers={}, raw=BytesIO(b'%PDF-1.4'))
+        response.__enter__.return_value = response
+        monkeypatch.setattr(file_service_module.requests, 'get', mock.Mock(return_value=response))
+        monkeypatch.setattr(file_service_module.File, 'create', mock.Mock(return_value=SimpleNamespace(id='file-id')))
+        return response
+
+    @pytest.fixture
+    def uploaded(self, file_service):
+        uploaded = []
+
+        def upload_fileobj(fileobj, s3_key, is_public):
+            while chunk := fileobj.read(4):
+                uploaded.append(chunk)
+
+        file_service.storage.upload_fileobj.side_effect = upload_fileobj
+        return uploaded
+
+    def test_streams_response_into_storage_before_recording_file(self, file_service, response, uploaded):
+        file_service.upload_from_url('https://example.com/scan.pdf', 'scan.pdf', uploaded_by_id='user')
+
+        file_service_module.requests.get.assert_called_once_with('https://example.com/scan.pdf', stream=True)
+        (_, s3_key), kwargs = file_service.storage.upload_fileobj.call_args
+        assert b''.join(uploaded) == b'%PDF-1.4'
+        assert response.raw.decode_content is True
+        assert kwargs == {'is_public': False}
+        file_create = file_service_module.File.create.call_args.args[0]
+        assert (file_create.s3_key, file_create.size) == (s3_key, 8)
+
+    def test_rejects_declared_length_over_the_limit(self, file_service, response, monkeypatch):
+        monkeypatch.setattr(file_service_module, 'MAX_UPLOAD_SIZE', 4)
+        response.headers = {'Content-Length': '8'}
+
+        with pytest.raises(file_service_module.FileUploadFailed):
+            file_service.upload_from_url('https://example.com/scan.pdf', 'scan.pdf')
+
+        file_service.storage.upload_fileobj.assert_not_called()
+        file_service_module.File.create.assert_not_called()
+
+    def test_stops_reading_once_the_limit_is_passed(self, file_service, response, uploaded, monkeypatch):
+        monkeypatch.setattr(file_service_module, 'MAX_UPLOAD_SIZE', 6)
+
+        with pytest.raises(file_service_module.FileUploadFailed):
+            file_service.upload_from_url('https://example.com/scan.pdf', 'scan.pdf')
+
+        assert uploaded == [b'%PDF']
+        file_service_module.File.create.assert_not_called()
+
+
+class TestUploadLight:
+    def test_hands_rewound_buffer_to_storage_without_reading_it(self, file_service):
+        file_service.storage.upload_from_presigned_post.return_value = SimpleNamespace(status_code=204, text='')
+        content = BytesIO(b'%PDF-1.4')
+        content.read()
+
+        file_service.upload_light(content, 'scan.pdf', 'uploads/scan.pdf')
+
+        (_, files), _ = file_service.storage.upload_from_presigned_post.call_args
+        assert files == {'file': ('scan.pdf', content)}
+        assert content.tell() == 0
+
+
+class TestListWithDetailsForId:
+    def test_queries_each_uploader_once(self, file_service, monkeypatch):
+        file_reads = [mock.Mock(uploaded_by_id=uploaded_by_id) for uploaded_by_id in ('a', 'b', 'a', None)]
+        monkeypatch.setattr(file_service_module.File, 'list', mock.Mock(return_value=file_reads))
+        monkeypatch.setattr(file_service_module.FileWithUser, 'factory', mock.Mock())
+        file_service.user_service = mock.Mock()
+        file_service.user_service.list_users_for_ids.return_value = []
+
+        file_service.list_with_details_for_id(['file-id'])
+
+        (uploaded_by_ids,), _ = file_service.user_service.list_users_for_ids.call_args
+        assert sorted(uploaded_by_ids) == ['a', 'b']
+
+
+class TestCompleteMultipartUpload:
+    def test_sends_last_e_tag_per_part_in_order(self, file_service, monkeypatch):
+        monkeypatch.setattr(file_service_module.File, 'create', mock.Mock(return_value=SimpleNamespace(id='file-id')))
+        file_service.storage.complete_multipart_upload.return_value = {'Key': 'uploads/scan.pdf'}
+        parts = [
+            Part(e_tag='two', part_number=2),
+            Part(e_tag='one', part_number=1),
+            Part(e_tag='two-retried', part_number=2),
+        ]
+
+        file_service.complete_multipart_upload(file_name='scan.pdf', upload_id='upload-id', parts=parts)
+
+        file_service.storage.complete_multipart_upload.assert_called_once_with(
+            'scan.pdf',
+            'upload-id',
+            [{'ETag': 'one', 'PartNumber': 1}, {'ETag': 'two-retried', 'PartNumber': 2}],
+        )
+
+
+class TestCopyFiles:
+    def test_records_only_copies_that_reached_s3(self, file_service, monkeypatch):
+        bulk_create = mock.Mock()
+        monkeypatch.setattr(file_service_module.File, 'bulk_create', bulk_create)
+        files = [
+            FileRead(
+                id=uuid.uuid4(),
+                file_name='a.pdf',
+                s3_key='uploads/a.pdf',
+                uploaded_at=datetime(2024, 1, 1),
+                uploaded_by_id='user',
+                is_public=False,
+                size=1,
+            ),
+            FileRead(
+                id=uuid.uuid4(),
+                file_name='b.pdf',
+                s3_key='uploads/b.pdf',
+                uploaded_at=datetime(2024, 1, 1),
+                uploaded_by_id='user',
+                is_public=False,
+                size=2,
+            ),
+        ]
+        file_service.storage.bulk_copy.return_value = {'uploads/b.pdf': Exception('boom')}
+
+        new_file_id_by_old_file_id = file_service.copy_files(files)
+
+        (new_s3_key_by_old_s3_key,), _ = file_service.storage.bulk_copy.call_args
+        assert list(new_s3_key_by_old_s3_key) == ['uploads/a.pdf', 'uploads/b.pdf']
+        (copied_files,), _ = bulk_create.call_args
+        assert [copied_file.s3_key for copied_file in copied_files] == [new_s3_key_by_old_s3_key['uploads/a.pdf']]
+        assert new_file_id_by_old_file_id == {files[0].id: copied_files[0].id}
+        assert copied_files[0].id.version == 4
+        assert copied_files[0].to_dict()['size'] == 1
+
+
+class TestDownload:
+    def test_fills_buffer_sized_from_content_length(self, file_service):
+        file_service.storage.open_object.return_value = (5, iter([b'%P', b'DF', b'!']))
+
+        content = file_service.download('file-id')
+
+        assert content.tell() == 0
+        assert content.getvalue() == b'%PDF!'
+        file_service.storage.open_object.assert_called_once_with('uploads/scan.pdf')
+
+    def test_short_body_is_not_padded(self, file_service):
+        file_service.storage.open_object.return_value = (5, iter([b'%P']))
+
+        assert file_service.download('file-id').getvalue() == b'%P'
+
+
+class TestStorage:
+    def test_instances_share_one_storage(self):
+        assert FileService().storage is FileService().storage is file_service_module._STORAGE
@@ -0,0 +1,18 @@
+"""Unit tests for the api healthcheck response."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.platform.healthcheck.router import router
+
+
+class TestStatusGet:
+    def test_body_and_content_type_are_unchanged(self):
+        app = FastAPI()
+        app.include_router(router)
+
+        response = TestClient(app).get('/api')
+
+        assert response.status_code == 200
+        assert response.headers['content-type'] == 'text/html; charset=utf-8'
+        assert response.content == '"💸 Colonel Collateral is hungry... 💸"'.encode('utf-8')
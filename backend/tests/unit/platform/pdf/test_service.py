@@ -0,0 +1,21 @@
+"""Unit tests for PDFService."""
+
+import sys
+from unittest import mock
+
+from src.platform.pdf.service import PDFService
+
+
+class TestPDFService:
+    def test_importing_service_does_not_load_weasyprint(self):
+        assert 'weasyprint' not in sys.modules
+
+    def test_generate_pdf_renders_template_into_buffer(self, monkeypatch):
+        monkeypatch.setattr('src.platform.pdf.service.render_template', mock.Mock(return_value='<p>hi</p>'))
+        service = PDFService(css_dir=None, file_service=mock.Mock())
+        service._convert_to_pdf = mock.Mock(return_value=b'%PDF-1.7')
+
+        pdf = service._generate_pdf(template_name='report.html', context={})
+
+        assert pdf.getvalue() == b'%PDF-1.7'
+        service._convert_to_pdf.assert_called_once_with(html_string='<p>hi</p>', stylesheets=[], file_path=None)
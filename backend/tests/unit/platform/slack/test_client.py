@@ -0,0 +1,44 @@
+"""Unit tests for the Slack webhook client."""
+
+import asyncio
+import functools
+
+import httpx
+import pytest
+
+from src.platform.slack import client as slack_client_module
+from src.platform.slack.client import SlackClient
+
+
+@pytest.fixture
+def requests_seen(monkeypatch):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(500 if request.url.path == '/broken' else 200)
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.Client(transport=transport)
+    monkeypatch.setattr(slack_client_module, '_http_client', lambda: http_client)
+    monkeypatch.setattr(httpx, 'AsyncClient', functools.partial(httpx.AsyncClient, transport=transport))
+    return seen
+
+
+class TestSlackClient:
+    def test_posts_through_shared_http_client(self, requests_seen):
+        assert SlackClient().post_webhook('https://hooks.slack.test/ok', {'text': 'hi'}) is True
+        assert SlackClient().post_webhook('https://hooks.slack.test/ok', {'text': 'again'}) is True
+
+        assert [request.content for request in requests_seen] == [b'{"text":"hi"}', b'{"text":"again"}']
+
+    def test_http_error_returns_false(self, requests_seen):
+        assert SlackClient().post_webhook('https://hooks.slack.test/broken', {'text': 'hi'}) is False
+
+    def test_async_posts_to_every_webhook(self, requests_seen):
+        webhook_urls = ['https://hooks.slack.test/a', 'https://hooks.slack.test/broken', 'https://hooks.slack.test/b']
+
+        results = asyncio.run(SlackClient().post_webhooks_async(webhook_urls, {'text': 'hi'}))
+
+        assert results == [True, False, True]
+        assert sorted(request.url.path for request in requests_seen) == ['/a', '/b', '/broken']
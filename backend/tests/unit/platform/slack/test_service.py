@@ -0,0 +1,36 @@
+"""Unit tests for Slack leaderboard message formatting."""
+
+from types import SimpleNamespace
+
+from src.platform.slack.service import SlackService
+
+
+def _entry(rank: int, display_name: str, tokens: int, rank_change: int | None):
+    return SimpleNamespace(rank=rank, display_name=display_name, tokens=tokens, rank_change=rank_change)
+
+
+class TestFormatTokens:
+    def test_units(self):
+        assert SlackService.format_tokens(999) == '999'
+        assert SlackService.format_tokens(12_000) == '12K'
+        assert SlackService.format_tokens(1_000_000) == '1.0M'
+        assert SlackService.format_tokens(2_540_000) == '2.5M'
+
+    def test_rounds_half_up(self):
+        assert SlackService.format_tokens(2_500) == '3K'
+        assert SlackService.format_tokens(1_150_000) == '1.2M'
+        assert SlackService.format_tokens(1_249_999) == '1.2M'
+
+
+class TestFormatLeaderboardSection:
+    def test_formats_rows_inside_code_block(self):
+        entries = [_entry(1, 'ada', 2_500_000, 2), _entry(2, 'grace', 12_000, None)]
+
+        section = SlackService.format_leaderboard_section('Daily', entries)
+
+        assert section == (
+            '*Daily*\n```\n' ' 1. ada                  2.5M  ▲2\n' ' 2. grace                 12K  🆕\n' '```'
+        )
+
+    def test_empty_section(self):
+        assert SlackService.format_leaderboard_section('Daily', []) == '*Daily*\n_No data yet_'
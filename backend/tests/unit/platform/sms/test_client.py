@@ -0,0 +1,262 @@
+"""Unit tests for the SMS clients."""
+
+import smtplib
+import threading
+from unittest import mock
+
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+from pydantic import ValidationError
+
+from src import settings
+from src.platform.sms import client as sms_client_module
+from src.platform.sms.client import (
+    AWSSNSSMSClient,
+    MockSMSClient,
+    ResilientLiveSMSClient,
+    SMSFileClient,
+    SMSMailpitClient,
+    SMSMessage,
+)
+from src.platform.sms.exceptions import SMSFailedToSend, SMSProviderUnavailable
+
+
+class TestSMSMessage:
+    @pytest.mark.parametrize('phone_number', ['+15551234567', '+447911123456'])
+    def test_accepts_e164_numbers(self, phone_number):
+        assert SMSMessage(phone_number=phone_number, message='hi').phone_number == phone_number
+
+    @pytest.mark.parametrize('phone_number', ['5551234567', '+05551234567', '+1 555 123 4567', '+15551234567\n'])
+    def test_rejects_other_formats(self, phone_number):
+        with pytest.raises(ValidationError):
+            SMSMessage(phone_number=phone_number, message='hi')
+
+
+class FlakySMSClient(MockSMSClient):
+    def send(self, sms: SMSMessage):
+        if sms.phone_number.endswith('0'):
+            raise SMSFailedToSend(message=f'Failed: {sms.phone_number}')
+        super().send(sms)
+
+
+class TestSendMany:
+    def test_attempts_every_message_before_reporting_failures(self):
+        client = FlakySMSClient()
+        smses = [SMSMessage(phone_number=f'+1555000000{n}', message='hi') for n in range(3)]
+
+        with pytest.raises(SMSFailedToSend) as exc_info:
+            client.send_many(smses)
+
+        assert exc_info.value.message == 'Failed to send SMS to: +15550000000'
+        assert client.sms_catcher == smses[1:]
+
+
+class TestSNSClient:
+    def test_client_is_built_once_with_tuned_config(self, monkeypatch):
+        boto3_client = mock.Mock()
+        monkeypatch.setattr(sms_client_module.boto3, 'client', boto3_client)
+        sms_client_module._sns_client.cache_clear()
+
+        first = sms_client_module._sns_client('us-east-1', 'key', 'secret')
+        second = sms_client_module._sns_client('us-east-1', 'key', 'secret')
+        sms_client_module._sns_client.cache_clear()
+
+        assert first is second
+        config = boto3_client.call_args.kwargs['config']
+        assert config.retries == {'max_attempts': 4, 'mode': 'adaptive'}
+        assert (config.connect_timeout, config.read_timeout, config.tcp_keepalive) == (2, 5, True)
+
+
+@pytest.fixture
+def sns_client(monkeypatch):
+    monkeypatch.setattr(settings, 'AWS_SNS_ACCESS_KEY_ID', 'key')
+    monkeypatch.setattr(settings, 'AWS_SNS_SECRET_ACCESS_KEY', 'secret')
+    monkeypatch.setattr(sms_client_module, '_sns_client', mock.Mock(return_value=mock.Mock()))
+    return AWSSNSSMSClient()
+
+
+class TestAWSSNSSMSClientSend:
+    @pytest.mark.parametrize(
+        'error',
+        [
+            EndpointConnectionError(endpoint_url='https://sns.us-east-1.amazonaws.com'),
+            ClientError({'Error': {'Code': 'InternalError'}, 'ResponseMetadata': {'HTTPStatusCode': 500}}, 'Publish'),
+            ClientError({'Error': {'Code': 'Throttling'}, 'ResponseMetadata': {'HTTPStatusCode': 400}}, 'Publish'),
+        ],
+    )
+    def test_provider_failures_are_reported_as_unavailable(self, sns_client, error):
+        sns_client.client.publish.side_effect = error
+
+        with pytest.raises(SMSProviderUnavailable):
+            sns_client.send(SMSMessage(phone_number='+15550000000', message='hi'))
+
+    @pytest.mark.parametrize('code', ['InvalidParameter', 'OptedOut'])
+    def test_recipient_failures_are_not_reported_as_unavailable(self, sns_client, code):
+        sns_client.client.publish.side_effect = ClientError(
+            {'Error': {'Code': code}, 'ResponseMetadata': {'HTTPStatusCode': 400}}, 'Publish'
+        )
+
+        with pytest.raises(SMSFailedToSend) as exc_info:
+            sns_client.send(SMSMessage(phone_number='+15550000000', message='hi'))
+        assert not isinstance(exc_info.value, SMSProviderUnavailable)
+
+    def test_publishes_sender_id_with_transactional_type(self, sns_client):
+        client = sns_client
+
+        client.send(SMSMessage(phone_number='+15550000001', message='hi', sender_id='Burn Notice'))
+        client.send(SMSMessage(phone_number='+15550000002', message='hi'))
+
+        first, second = (call.kwargs['MessageAttributes'] for call in client.client.publish.call_args_list)
+        assert first == {
+            'AWS.SNS.SMS.SMSType': {'DataType': 'String', 'StringValue': 'Transactional'},
+            'AWS.SNS.SMS.SenderID': {'DataType': 'String', 'StringValue': 'Burn Notice'},
+        }
+        assert second == {'AWS.SNS.SMS.SMSType': {'DataType': 'String', 'StringValue': 'Transactional'}}
+
+
+class TestSMSMailpitClient:
+    @pytest.fixture
+    def servers(self, monkeypatch):
+        servers = []
+
+        def connect(*args, **kwargs):
+            servers.append(mock.Mock())
+            return servers[-1]
+
+        monkeypatch.setattr(sms_client_module.smtplib, 'SMTP', connect)
+        monkeypatch.setattr(sms_client_module, '_SMTP_CONNECTIONS', sms_client_module._SMTPConnections())
+        return servers
+
+    def test_reuses_connection_until_rotation(self, servers, monkeypatch):
+        monkeypatch.setattr(sms_client_module, 'MAX_MESSAGES_PER_SMTP_CONNECTION', 2)
+        sms = SMSMessage(phone_number='+15550000000', message='hi')
+
+        for _ in range(3):
+            SMSMailpitClient().send(sms)
+
+        assert [server.send_message.call_count for server in servers] == [2, 1]
+        servers[0].quit.assert_called_once()
+
+    def test_reconnects_once_when_server_dropped_connection(self, servers):
+        sms = SMSMessage(phone_number='+15550000000', message='hi')
+        SMSMailpitClient().send(sms)
+        servers[0].send_message.side_effect = smtplib.SMTPServerDisconnected
+
+        SMSMailpitClient().send(sms)
+
+        assert len(servers) == 2
+        servers[1].send_message.assert_called_once()
+
+
+class TestPreviewHtml:
+    def test_fills_every_placeholder(self):
+        sms = SMSMessage(phone_number='+15551234567', message='Your code costs $5', sender_id='Burn Notice')
+
+        html = SMSMailpitClient()._generate_sms_html(sms)
+
+        assert '<title>SMS to +1****234567</title>' in html
+        assert 'To: +15551234567<br>' in html
+        assert 'Message Length: 18 characters' in html
+        assert 'Your code costs $5' in html
+        assert '.container {' in html
+        assert '<strong>Staging SMS Preview</strong>' in html
+
+    def test_escapes_user_supplied_values(self):
+        sms = SMSMessage(phone_number='+15551234567', message='<b>hi</b>', sender_id='<script>')
+
+        html = SMSMailpitClient()._generate_sms_html(sms)
+
+        assert '<script>' not in html
+        assert html.count('&lt;script&gt;') == 2
+        assert '&lt;b&gt;hi&lt;/b&gt;' in html
+        assert 'Message Length: 9 characters' in html
+
+
+class TestResilientLiveSMSClient:
+    @pytest.fixture(autouse=True)
+    def fresh_provider_state(self, monkeypatch):
+        # Test subclasses would otherwise stay cached in _clients for the rest of the session
+        ResilientLiveSMSClient._clients.cache_clear()
+        monkeypatch.setattr(ResilientLiveSMSClient, '_failures_by_client_class', {})
+        yield
+        ResilientLiveSMSClient._clients.cache_clear()
+
+    def test_provider_clients_are_built_once(self):
+        provider_class = mock.Mock(return_value=MockSMSClient())
+
+        class SingleProviderSMSClient(ResilientLiveSMSClient):
+            CLIENT_PRIORITY_ORDER = [provider_class]
+
+        sms = SMSMessage(phone_number='+15550000000', message='hi')
+        SingleProviderSMSClient().send(sms)
+        SingleProviderSMSClient().send(sms)
+
+        provider_class.assert_called_once_with()
+        assert provider_class.return_value.sms_catcher == [sms, sms]
+
+    def test_skips_failing_provider_until_cooldown_passes(self, monkeypatch):
+        class FailingSMSClient(MockSMSClient):
+            def send(self, sms: SMSMessage):
+                super().send(sms)
+                raise SMSProviderUnavailable(message='down')
+
+        class SingleProviderSMSClient(ResilientLiveSMSClient):
+            CLIENT_PRIORITY_ORDER = [FailingSMSClient]
+            CIRCUIT_BREAKER_FAILURE_THRESHOLD = 2
+
+        clock = mock.Mock(return_value=100.0)
+        monkeypatch.setattr(sms_client_module.time, 'monotonic', clock)
+        [provider] = SingleProviderSMSClient._clients()
+        sms = SMSMessage(phone_number='+15550000000', message='hi')
+
+        for _ in range(3):
+            with pytest.raises(SMSFailedToSend):
+                SingleProviderSMSClient().send(sms)
+        assert len(provider.sms_catcher) == 2
+
+        clock.return_value = 100.0 + SingleProviderSMSClient.CIRCUIT_BREAKER_COOLDOWN_SECONDS
+        with pytest.raises(SMSFailedToSend):
+            SingleProviderSMSClient().send(sms)
+        assert len(provider.sms_catcher) == 3
+
+    def test_recipient_failures_do_not_open_the_circuit(self):
+        class RejectingSMSClient(MockSMSClient):
+            def send(self, sms: SMSMessage):
+                super().send(sms)
+                raise SMSFailedToSend(message='opted out')
+
+        class SingleProviderSMSClient(ResilientLiveSMSClient):
+            CLIENT_PRIORITY_ORDER = [RejectingSMSClient]
+            CIRCUIT_BREAKER_FAILURE_THRESHOLD = 2
+
+        [provider] = SingleProviderSMSClient._clients()
+        sms = SMSMessage(phone_number='+15550000000', message='hi')
+
+        for _ in range(3):
+            with pytest.raises(SMSFailedToSend):
+                SingleProviderSMSClient().send(sms)
+        assert len(provider.sms_catcher) == 3
+
+
+class TestSMSFileClient:
+    def test_writes_and_opens_preview_off_the_calling_thread(self, monkeypatch, tmp_path):
+        opened = threading.Event()
+        opened_on = []
+
+        def open_browser(url):
+            opened_on.append((url, threading.current_thread()))
+            opened.set()
+
+        monkeypatch.setattr(sms_client_module.webbrowser, 'open', open_browser)
+        monkeypatch.setattr(settings, 'BASE_DIR', str(tmp_path))
+        client = SMSFileClient()
+
+        client.send(SMSMessage(phone_number='+15550000000', message='hi'))
+
+        assert opened.wait(timeout=5)
+        [(url, thread)] = opened_on
+        [preview] = (tmp_path / 'tmp').iterdir()
+        assert preview.name.endswith('-sms-+1****000000.html')
+        assert url == f'file:///{preview}'
+        assert '<strong>Development Mode</strong>' in preview.read_text(encoding='utf-8')
+        assert thread is not threading.current_thread()
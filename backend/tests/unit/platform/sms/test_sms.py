@@ -0,0 +1,34 @@
+"""Unit tests for SMS client selection."""
+
+import pytest
+
+from src import settings
+from src.platform.sms import sms as sms_module
+from src.platform.sms.client import MockSMSClient, SMSMailpitClient
+from src.platform.sms.sms import SMS
+
+
+@pytest.fixture(autouse=True)
+def clear_default_client():
+    sms_module._get_default_client.cache_clear()
+    yield
+    sms_module._get_default_client.cache_clear()
+
+
+class TestClientSelection:
+    def test_backend_client_is_shared_across_messages(self, monkeypatch):
+        monkeypatch.setattr(settings, 'USE_MOCK_SMS_CLIENT', False)
+        monkeypatch.setattr(settings, 'SMS_BACKEND', 'mailpit')
+
+        first, second = SMS('+15550000000', 'hi'), SMS('+15550000001', 'hi')
+
+        assert isinstance(first.client, SMSMailpitClient)
+        assert first.client is second.client
+
+    def test_mock_client_is_fresh_per_message(self, monkeypatch):
+        monkeypatch.setattr(settings, 'USE_MOCK_SMS_CLIENT', True)
+
+        first, second = SMS('+15550000000', 'hi'), SMS('+15550000001', 'hi')
+
+        assert isinstance(first.client, MockSMSClient)
+        assert first.client is not second.client
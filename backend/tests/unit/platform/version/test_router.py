@@ -0,0 +1,19 @@
+"""Unit tests for the app version response."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.platform.version.router import router
+from src.version import VERSION
+
+
+class TestGetAppVersion:
+    def test_returns_version_json(self):
+        app = FastAPI()
+        app.include_router(router)
+
+        response = TestClient(app).get('/api')
+
+        assert response.status_code == 200
+        assert response.headers['content-type'] == 'application/json'
+        assert response.json() == {'version': VERSION}
@@ -0,0 +1,28 @@
+import pytest
+
+from src import settings
+
+
+class TestLazySettings:
+    def test_resolves_and_caches_on_module(self, monkeypatch):
+        monkeypatch.delitem(vars(settings), 'SLACK_EVENT_CHANNEL', raising=False)
+        monkeypatch.setenv('SLACK_EVENT_CHANNEL', '#lazy')
+
+        assert settings.SLACK_EVENT_CHANNEL == '#lazy'
+        assert vars(settings)['SLACK_EVENT_CHANNEL'] == '#lazy'
+
+    def test_applies_cast(self, monkeypatch):
+        monkeypatch.delitem(vars(settings), 'SENTRY_DEFAULT_SAMPLE_RATE', raising=False)
+        monkeypatch.setenv('SENTRY_DEFAULT_SAMPLE_RATE', '0')
+
+        assert settings.SENTRY_DEFAULT_SAMPLE_RATE == 0
+
+    def test_from_import(self):
+        from src.settings import GITHUB_OAUTH_REDIRECT_URI, SLACK_BOT_TOKEN  # noqa: F401
+
+    def test_unknown_setting_raises_attribute_error(self):
+        with pytest.raises(AttributeError):
+            settings.NOT_A_SETTING
+
+    def test_dir_lists_lazy_settings(self):
+        assert 'OPENAI_API_KEY' in dir(settings)
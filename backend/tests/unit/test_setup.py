@@ -0,0 +1,8 @@
+import dramatiq
+
+from src import settings
+
+
+def test_queue_declares_sentry_actor_option_with_mocked_sentry():
+    assert settings.USE_MOCK_SENTRY_CLIENT
+    assert 'sentry_ignore_exceptions' in dramatiq.get_broker().actor_options